@@ -3,7 +3,19 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add source to path so tests can import modules directly
 src_dir = Path(__file__).parent.parent / "usr" / "share" / "langforge"
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_translation_memory(tmp_path, monkeypatch):
+    """Keep the persistent translation memory out of the user's cache dir."""
+    from api import _cache
+
+    monkeypatch.setattr(
+        _cache, "_memory", _cache.TranslationMemory(tmp_path / "tm.sqlite")
+    )
@@ -0,0 +1,75 @@
+"""Tests for api._cache — persistent translation memory."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "usr" / "share" / "langforge"))
+
+from api._cache import TranslationMemory, cached, cached_batch
+from api.base import TranslationAPI
+
+
+class CountingAPI(TranslationAPI):
+    def __init__(self):
+        self.calls = []
+
+    @cached
+    def translate(self, text, source_lang, target_lang):
+        self.calls.append(text)
+        return text.upper()
+
+    @cached_batch
+    def translate_batch(self, texts, source_lang, target_lang):
+        self.calls.extend(texts)
+        return [t.upper() for t in texts]
+
+    def test_connection(self):
+        return True
+
+    def get_name(self):
+        return "Counting"
+
+
+class TestTranslationMemory:
+    def test_roundtrip(self, tmp_path):
+        tm = TranslationMemory(tmp_path / "tm.sqlite")
+        assert tm.get(b"k") is None
+        tm.put(b"k", "value")
+        assert tm.get(b"k") == "value"
+
+    def test_unwritable_path_disables_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        tm = TranslationMemory(blocker / "sub" / "tm.sqlite")
+        tm.put(b"k", "value")
+        assert tm.get(b"k") is None
+
+
+class TestCachedDecorators:
+    def test_translate_hits_cache(self):
+        api = CountingAPI()
+        assert api.translate("ok", "en", "de") == "OK"
+        assert api.translate("ok", "en", "de") == "OK"
+        assert api.calls == ["ok"]
+
+    def test_key_includes_target_and_context(self):
+        api = CountingAPI()
+        api.translate("ok", "en", "de")
+        api.translate("ok", "en", "fr")
+        api.set_context("other-app")
+        api.translate("ok", "en", "de")
+        assert len(api.calls) == 3
+
+    def test_batch_only_sends_misses(self):
+        api = CountingAPI()
+        api.translate("b", "en", "de")
+        result = api.translate_batch(["a", "b", "c"], "en", "de")
+        assert result == ["A", "B", "C"]
+        assert api.calls == ["b", "a", "c"]
+
+    def test_use_cache_false_skips_lookup(self):
+        api = CountingAPI()
+        api.translate("ok", "en", "de")
+        api.use_cache = False
+        api.translate("ok", "en", "de")
+        assert api.calls == ["ok", "ok"]
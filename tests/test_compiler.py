@@ -0,0 +1,74 @@
+"""Tests for core.compiler — .po discovery and compile bookkeeping."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "usr" / "share" / "langforge"))
+
+from core.compiler import MoCompiler
+
+
+class TestMoCompiler:
+    def _project(self, tmp_path, langs=("de", "fr", "pt_BR")):
+        locale = tmp_path / "locale"
+        locale.mkdir()
+        (locale / "app.pot").write_text("")
+        for lang in langs:
+            (locale / f"{lang}.po").write_text("")
+        return MoCompiler(tmp_path, "app")
+
+    def test_compile_all_reports_every_language(self, tmp_path):
+        compiler = self._project(tmp_path)
+        compiled = []
+
+        def fake_compile(lang):
+            if lang == "fr":
+                raise RuntimeError("broken")
+            compiled.append(lang)
+
+        compiler.compile_language = fake_compile
+        events = []
+        results = compiler.compile_all(lambda *args: events.append(args))
+        assert results == {"de": True, "fr": False, "pt_BR": True}
+        assert sorted(compiled) == ["de", "pt_BR"]
+        assert sorted(e[2] for e in events) == [1, 2, 3]
+        assert all(e[3] == 3 for e in events)
+
+    def test_compile_all_skips_already_compiled(self, tmp_path):
+        compiler = self._project(tmp_path)
+        compiled = []
+        compiler.compile_language = compiled.append
+        assert compiler.compile_all(skip={"de", "fr"}) == {"pt_BR": True}
+        assert compiled == ["pt_BR"]
+
+    def test_compile_all_without_po_files(self, tmp_path):
+        compiler = self._project(tmp_path, langs=())
+        assert compiler.compile_all() == {}
+
+    def test_compile_language_writes_loadable_mo(self, tmp_path):
+        import gettext
+        import polib
+
+        compiler = self._project(tmp_path, langs=())
+        po = polib.POFile()
+        po.metadata = {"Content-Type": "text/plain; charset=UTF-8"}
+        po.append(polib.POEntry(msgid="Open", msgstr="Öffnen"))
+        po.append(polib.POEntry(msgid="Close", msgstr="Zu", flags=["fuzzy"]))
+        po.save(str(tmp_path / "locale" / "de.po"))
+
+        compiler.compile_language("de")
+        mo = tmp_path / "usr/share/locale/de/LC_MESSAGES/app.mo"
+        with open(mo, "rb") as f:
+            catalog = gettext.GNUTranslations(f)
+        assert catalog.gettext("Open") == "Öffnen"
+        # Fuzzy entries are left out, as msgfmt does
+        assert catalog.gettext("Close") == "Close"
+
+    def test_get_compiled_languages(self, tmp_path):
+        compiler = self._project(tmp_path, langs=())
+        assert compiler.get_compiled_languages() == []
+        base = tmp_path / "usr" / "share" / "locale"
+        for lang, name in (("de", "app.mo"), ("fr", "other.mo")):
+            (base / lang / "LC_MESSAGES").mkdir(parents=True)
+            (base / lang / "LC_MESSAGES" / name).write_bytes(b"")
+        assert compiler.get_compiled_languages() == ["de"]
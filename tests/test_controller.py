@@ -0,0 +1,47 @@
+"""Tests for core.controller — worker lifecycle without any API calls."""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "usr" / "share" / "langforge"))
+
+from core.controller import TranslationController
+
+
+class TestWorker:
+    def _controller(self):
+        controller = TranslationController(settings=None)
+        threads = []
+
+        def fake_run_file(*args):
+            threads.append(threading.current_thread())
+            controller.is_translating = False
+
+        controller._run_file = fake_run_file
+        return controller, threads
+
+    def _start(self, controller):
+        controller.start_file(
+            Path("strings.json"),
+            languages=["de"],
+            on_phase=None,
+            on_lang_progress=None,
+            on_complete=None,
+            on_error=None,
+        )
+        controller._future.result(timeout=5)
+
+    def test_runs_reuse_one_worker_thread(self):
+        controller, threads = self._controller()
+        self._start(controller)
+        self._start(controller)
+        assert len(threads) == 2
+        assert threads[0] is threads[1]
+        assert threads[0] is not threading.main_thread()
+        controller.shutdown()
+
+    def test_shutdown_cancels(self):
+        controller, _ = self._controller()
+        controller.shutdown()
+        assert controller.cancelled
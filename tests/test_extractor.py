@@ -0,0 +1,44 @@
+"""Tests for core.extractor — reading the generated .pot."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "usr" / "share" / "langforge"))
+
+import polib
+
+from core.extractor import GettextExtractor
+
+
+class TestExtractedStrings:
+    def _write_pot(self, path, msgids):
+        pot = polib.POFile()
+        for msgid in msgids:
+            pot.append(polib.POEntry(msgid=msgid, msgstr=""))
+        pot.save(str(path))
+
+    def test_missing_pot(self, tmp_path):
+        extractor = GettextExtractor(str(tmp_path), "app")
+        assert extractor.get_extracted_strings() == []
+        assert extractor.get_string_count() == 0
+
+    def test_parse_cached_until_pot_changes(self, tmp_path, monkeypatch):
+        (tmp_path / "locale").mkdir()
+        extractor = GettextExtractor(str(tmp_path), "app")
+        self._write_pot(extractor.pot_file, ["Open", "Save"])
+
+        parses = []
+        original = polib.pofile
+        monkeypatch.setattr(
+            polib, "pofile", lambda *a, **kw: parses.append(a) or original(*a, **kw)
+        )
+        assert extractor.get_extracted_strings() == ["Open", "Save"]
+        assert extractor.get_string_count() == 2
+        assert len(parses) == 1
+
+        self._write_pot(extractor.pot_file, ["Open", "Save", "Quit"])
+        st = extractor.pot_file.stat()
+        os.utime(extractor.pot_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert extractor.get_string_count() == 3
+        assert len(parses) == 2
@@ -53,3 +53,17 @@ class TestAPIFactory:
         api = APIFactory.create("groq", "fake-key", model="llama-3.1-8b-instant")
         # GroqAPI doesn't expose model in get_name(); just verify creation works
         assert "Groq" in api.get_name()
+
+    def test_registry_matches_module_exports(self):
+        import ast
+        import importlib
+
+        for module_name, class_name in APIFactory._ALL_APIS.values():
+            module = importlib.import_module(module_name)
+            assert class_name in module.__all__
+            tree = ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+            defs = [
+                n.name for n in tree.body
+                if isinstance(n, ast.ClassDef) and n.name == class_name
+            ]
+            assert len(defs) == 1, f"{class_name} defined {len(defs)} times"
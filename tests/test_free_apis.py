@@ -0,0 +1,238 @@
+"""Tests for api.free_apis — request shaping without network access."""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace as NS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "usr" / "share" / "langforge"))
+
+from api.free_apis import DeepLFreeAPI
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self.posts = []
+
+    def get(self, url, **kwargs):
+        return FakeResponse({"character_count": 0, "character_limit": 500000})
+
+    def post(self, url, data=None, **kwargs):
+        self.posts.append(data)
+        texts = [v for k, v in data if k == "text"]
+        return FakeResponse({"translations": [{"text": t.upper()} for t in texts]})
+
+
+class TestDeepLBatch:
+    def _api(self):
+        api = DeepLFreeAPI("key:fx")
+        api.session = FakeSession()
+        return api
+
+    def test_batch_sends_multiple_text_fields(self):
+        api = self._api()
+        result = api.translate_batch(["one", "two", "three"], "en", "de")
+        assert result == ["ONE", "TWO", "THREE"]
+        assert len(api.session.posts) == 1
+        assert ("target_lang", "DE") in api.session.posts[0]
+
+    def test_batch_splits_above_limit(self):
+        api = self._api()
+        texts = [f"s{i}" for i in range(120)]
+        result = api.translate_batch(texts, "en", "de")
+        assert result == [t.upper() for t in texts]
+        assert len(api.session.posts) == 3
+
+
+class FakeStreamResponse(FakeResponse):
+    def __init__(self, lines):
+        super().__init__({})
+        self._lines = lines
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestStreaming:
+    def test_sse_deltas_are_yielded_in_order(self):
+        from api._http import iter_sse_content
+
+        lines = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b"",
+            b'data: {"choices": [{"delta": {"content": "Ol"}}]}',
+            b'data: {"choices": [{"delta": {"content": "\\u00e1"}}]}',
+            b"data: [DONE]",
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+        ]
+        assert list(iter_sse_content(FakeStreamResponse(lines))) == ["Ol", "á"]
+
+    def test_default_stream_yields_full_translation(self):
+        from api.base import TranslationAPI
+
+        class Dummy(TranslationAPI):
+            def translate(self, text, source_lang, target_lang):
+                return "Hallo"
+
+            def test_connection(self):
+                return True
+
+            def get_name(self):
+                return "Dummy"
+
+        assert list(Dummy().translate_stream("Hello", "en", "de")) == ["Hallo"]
+
+
+class FakeChatSession:
+    def __init__(self, content):
+        self.content = content
+        self.posts = []
+
+    def send(self, request, **kwargs):
+        assert kwargs["allow_redirects"] is False
+        self.posts.append((request.url, request.headers, json.loads(request.body)))
+        return FakeResponse({
+            "choices": [{"message": {"content": self.content}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        })
+
+
+class TestOpenAICompatible:
+    def test_groq_request_shape(self):
+        from api.free_apis import GroqAPI
+
+        api = GroqAPI("secret")
+        api.session = FakeChatSession(" Olá ")
+        assert api.translate("Hello", "en", "pt-BR") == "Olá"
+        url, headers, payload = api.session.posts[0]
+        assert url == "https://api.groq.com/openai/v1/chat/completions"
+        assert headers["Authorization"] == "Bearer secret"
+        assert payload["model"] == "llama-3.3-70b-versatile"
+        assert payload["messages"][1]["content"] == "Hello"
+
+    def test_grok_disables_reasoning_and_tracks_cost(self):
+        from api.paid_apis import GrokAPI
+
+        api = GrokAPI("secret")
+        api.session = FakeChatSession("[1] Eins|||NEXT|||[2] Zwei")
+        assert api.translate_batch(["One", "Two"], "en", "de") == ["Eins", "Zwei"]
+        payload = api.session.posts[0][2]
+        assert payload["reasoning_effort"] == "none"
+        assert api.get_usage()["cost_usd"] > 0
+        assert api.get_name() == "Grok (grok-4-fast)"
+
+
+class TestDeepLTarget:
+    def test_unsupported_language_fails_before_any_request(self):
+        import pytest
+
+        api = DeepLFreeAPI("key:fx")
+        api.session = FakeSession()
+        with pytest.raises(ValueError, match="not supported"):
+            api.translate_batch(["a", "b"], "en", "he")
+        assert api.session.posts == []
+        assert not api._resolved
+
+
+class GlossarySession(FakeSession):
+    def __init__(self):
+        super().__init__()
+        self.gets = []
+
+    def get(self, url, **kwargs):
+        self.gets.append(url)
+        return FakeResponse({"source_lang": "en", "target_lang": "de"})
+
+
+class TestDeepLGlossary:
+    def _api(self):
+        api = DeepLFreeAPI("key:fx", glossary_id="g-123")
+        api.session = GlossarySession()
+        return api
+
+    def test_glossary_sent_for_matching_target(self):
+        api = self._api()
+        api.translate_batch(["one", "two"], "en", "de")
+        api.translate_batch(["three", "four"], "en", "de")
+        assert ("glossary_id", "g-123") in api.session.posts[0]
+        assert ("tag_handling", "xml") in api.session.posts[0]
+        # Glossary metadata is fetched only once
+        assert sum("/glossaries/" in url for url in api.session.gets) == 1
+
+    def test_glossary_skipped_for_other_targets(self):
+        api = self._api()
+        api.translate_batch(["one", "two"], "en", "fr")
+        assert all(k != "glossary_id" for k, _ in api.session.posts[0])
+
+
+class FakeOpenAIClient:
+    """Minimal stand-in for the files/batches parts of the OpenAI SDK."""
+
+    def __init__(self):
+        self.uploaded = None
+        self.files = NS(create=self._create_file, content=self._content)
+        self.batches = NS(create=lambda **kw: NS(id="batch_1"), retrieve=self._retrieve)
+        self.status = "in_progress"
+
+    def _create_file(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = [json.loads(line) for line in file[1].splitlines()]
+        return NS(id="file_in")
+
+    def _retrieve(self, batch_id):
+        return NS(
+            status=self.status,
+            output_file_id="file_out",
+            request_counts=NS(total=len(self.uploaded)),
+        )
+
+    def _content(self, file_id):
+        # Results come back out of order; the last request failed
+        lines = [
+            {"custom_id": "1", "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": " Zwei "}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 2}}}},
+            {"custom_id": "0", "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": "Eins"}}]}}},
+            {"custom_id": "2", "response": {"status_code": 500, "body": {}}},
+        ]
+        return NS(content=b"\n".join(json.dumps(x).encode() for x in lines))
+
+
+class TestOpenAIBatchJob:
+    def test_submit_and_fetch_preserve_order(self):
+        from api.paid_apis import OpenAIAPI
+
+        api = OpenAIAPI.__new__(OpenAIAPI)
+        api.model = "gpt-4o-mini"
+        api._reset_usage()
+        api.client = FakeOpenAIClient()
+
+        assert api.submit_batch(["One", "Two", "Three"], "en", "de") == "batch_1"
+        assert [r["custom_id"] for r in api.client.uploaded] == ["0", "1", "2"]
+        assert api.client.uploaded[2]["body"]["messages"][1]["content"] == "Three"
+
+        assert api.fetch_batch("batch_1") is None
+        api.client.status = "completed"
+        assert api.fetch_batch("batch_1") == ["Eins", "Zwei", ""]
+        assert api.get_usage()["input_tokens"] == 10
@@ -21,6 +21,18 @@ class TestProjectScanner:
         assert len(files) == 2
         assert all(f.suffix == ".py" for f in files)
 
+    def test_find_python_files_skips_build_dirs(self, tmp_path):
+        (tmp_path / "main.py").write_text("x = 1")
+        for skipped in (".git", "venv", "node_modules", "__pycache__"):
+            (tmp_path / skipped).mkdir()
+            (tmp_path / skipped / "mod.py").write_text("x = 1")
+
+        scanner = ProjectScanner(str(tmp_path))
+        assert scanner.find_python_files() == [tmp_path / "main.py"]
+        # The walk is cached per scanner instance
+        (tmp_path / "late.py").write_text("x = 1")
+        assert len(scanner.find_python_files()) == 1
+
     def test_find_python_files_empty_dir(self, tmp_path):
         scanner = ProjectScanner(str(tmp_path))
         assert scanner.find_python_files() == []
@@ -67,6 +79,25 @@ class TestProjectScanner:
         scanner = ProjectScanner(str(tmp_path))
         assert scanner.count_translatable_strings() == 3
 
+    def test_scan_reads_each_file_once(self, tmp_path, monkeypatch):
+        (tmp_path / "app.py").write_text(
+            'import gettext\ngettext.textdomain("myapp")\n_("A")\n_("B")\n'
+        )
+        (tmp_path / "other.py").write_text('_("C")\n')
+        reads = []
+        original = Path.read_bytes
+
+        def counting_read(self, *args, **kwargs):
+            reads.append(self.name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read)
+        scanner = ProjectScanner(str(tmp_path))
+        assert scanner.validate_project() is True
+        assert scanner.detect_textdomain() == "myapp"
+        assert scanner.count_translatable_strings() == 3
+        assert sorted(reads) == ["app.py", "other.py"]
+
     def test_count_translatable_strings_none(self, tmp_path):
         (tmp_path / "app.py").write_text("print('no i18n')\n")
         scanner = ProjectScanner(str(tmp_path))
@@ -135,6 +166,16 @@ class TestMultiLanguageDetection:
         scanner = ProjectScanner(str(tmp_path))
         assert scanner.validate_project() is True
 
+    def test_catalogs_found_inside_build_dirs(self, tmp_path):
+        """Only source files are pruned; templates in build/ still count."""
+        (tmp_path / "build" / "po").mkdir(parents=True)
+        (tmp_path / "build" / "po" / "myapp.pot").write_text("# pot\n")
+        (tmp_path / "build" / "gen.py").write_text('_("Hidden")\n')
+        scanner = ProjectScanner(str(tmp_path))
+        assert scanner.detect_textdomain() == "myapp"
+        assert scanner.validate_project() is True
+        assert scanner.find_source_files() == []
+
     def test_detect_textdomain_from_pot(self, tmp_path):
         """Textdomain should be detected from .pot filename."""
         locale = tmp_path / "locale"
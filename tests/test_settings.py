@@ -70,3 +70,87 @@ class TestSettings:
         s = Settings()
         s.set_api_type("paid")
         assert s.get_api_type() == "paid"
+
+    def test_get_cache_invalidated_by_setters(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        s = Settings()
+        assert s.get("fix_context.reference_lang") == "fr"
+        assert s.get("free_api.keys.groq", "none") == "none"
+        s.set_reference_lang("es")
+        s.set_provider_key("free_api", "groq", "k")
+        assert s.get("fix_context.reference_lang") == "es"
+        assert s.get("free_api.keys.groq", "none") == "k"
+
+    def test_save_skips_unchanged_file(self, tmp_path, monkeypatch):
+        import os
+
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        s = Settings()
+        s.save()
+        config_file = tmp_path / ".config" / "langforge" / "config.json"
+        os.utime(config_file, ns=(0, 0))
+        s.save()
+        assert config_file.stat().st_mtime_ns == 0
+        s.set("paid_api.model", "gpt-4o")
+        s.save()
+        assert config_file.stat().st_mtime_ns != 0
+        assert json.loads(config_file.read_text())["paid_api"]["model"] == "gpt-4o"
+
+    def test_setting_same_value_does_not_mark_dirty(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        s = Settings()
+        s.save()
+        s.set("free_api.provider", "groq")
+        s.set_api_type("free")
+        assert s._dirty is False
+        s.set_api_type("paid")
+        assert s._dirty is True
+        s.save()
+        assert s._dirty is False
+        assert Settings().get_api_type() == "paid"
+
+    def test_configured_providers_cached_until_change(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        s = Settings()
+        free = s.get_configured_providers("free")
+        assert free == [("LibreTranslate", "libretranslate")]
+        assert s.get_configured_providers("paid") == []
+        assert s.get_configured_providers("free") is free
+        s.set_provider_key("paid_api", "grok", "xai-key")
+        assert s.get_configured_providers("paid") == [("Grok (xAI)", "grok")]
+
+    def test_update_sets_dotted_keys_at_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        s = Settings()
+        s.save()
+        assert s.get("paid_api.model") == "gpt-4o-mini"
+        s.update({"api_type": "free", "free_api.provider": "groq"})
+        assert s._dirty is False
+        s.update({"paid_api.model": "gpt-5-mini", "paid_api.keys.openai": "sk"})
+        assert s._dirty is True
+        assert s.get("paid_api.model") == "gpt-5-mini"
+        assert s.get_provider_key("paid_api", "openai") == "sk"
+
+    def test_recovered_keys_and_corrupt_file_are_written_back(
+        self, tmp_path, monkeypatch
+    ):
+        import config.settings as settings_mod
+
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        config_file = tmp_path / ".config" / "langforge" / "config.json"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text("{not json")
+        Settings().save()
+        assert json.loads(config_file.read_text())["api_type"] == "free"
+
+        monkeypatch.setattr(
+            settings_mod,
+            "_lookup_secret",
+            lambda name: "gsk-1" if name == "free_api_groq_key" else "",
+        )
+        data = json.loads(config_file.read_text())
+        data["free_api"]["keys"] = {"groq": ""}
+        config_file.write_text(json.dumps(data))
+        Settings().save()
+        saved = json.loads(config_file.read_text())
+        assert saved["free_api"]["keys"]["groq"] == "gsk-1"
@@ -49,6 +49,12 @@ class TestProtectPlaceholders:
         protected, tokens = _protect_placeholders(text)
         assert len(tokens) == 3
 
+    def test_nested_formats_are_one_placeholder(self):
+        text = "Value: {%s} and %(n)d"
+        protected, tokens = _protect_placeholders(text)
+        assert protected == "Value: <x1/> and <x2/>"
+        assert [t[1] for t in tokens] == ["{%s}", "%(n)d"]
+
     def test_empty_string(self):
         text = ""
         protected, tokens = _protect_placeholders(text)
@@ -158,6 +164,14 @@ class TestBuildTranslationPrompt:
         prompt = build_translation_prompt("en", "de", app_name="my_cool_app")
         assert "My Cool App" in prompt
 
+    def test_stable_prefix_across_runs(self):
+        a = build_translation_prompt("en", "de", app_name="foo", context_entries=["A"])
+        b = build_translation_prompt("fr", "ja", app_name="bar")
+        # Rules must precede every variable part for provider prompt caching
+        prefix = a[: a.index("Application:")]
+        assert b.startswith(prefix)
+        assert "CRITICAL RULES" in prefix
+
 
 class TestSetContext:
     def test_set_context_stores_values(self):
@@ -189,6 +203,322 @@ class TestSetContext:
         assert api._context_entries == []
 
 
+class TestTranslateMany:
+    def _api(self, concurrency):
+        import threading
+        import time
+
+        class SlowAPI(TranslationAPI):
+            MAX_CONCURRENCY = concurrency
+
+            def __init__(self):
+                self.active = 0
+                self.peak = 0
+                self.lock = threading.Lock()
+
+            def translate(self, text, source_lang, target_lang):
+                with self.lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                time.sleep(0.01)
+                with self.lock:
+                    self.active -= 1
+                return text.upper()
+
+            def test_connection(self):
+                return True
+
+            def get_name(self):
+                return "Slow"
+
+        return SlowAPI()
+
+    def test_preserves_order_and_runs_concurrently(self):
+        api = self._api(4)
+        texts = [f"s{i}" for i in range(12)]
+        assert api.translate_many(texts, "en", "de") == [t.upper() for t in texts]
+        assert 1 < api.peak <= 4
+
+    def test_default_is_serial(self):
+        api = self._api(1)
+        api.translate_many(["a", "b", "c"], "en", "de")
+        assert api.peak == 1
+
+
+class TestTranslateProject:
+    def _pot(self, tmp_path):
+        import polib
+
+        pot = polib.POFile()
+        for msgid in ("Open", "Save %s", "Quit"):
+            pot.append(polib.POEntry(msgid=msgid, msgstr=""))
+        path = tmp_path / "po" / "app.pot"
+        path.parent.mkdir()
+        pot.save(str(path))
+        return path
+
+    def test_languages_run_in_parallel(self, tmp_path):
+        import polib
+        from core.translator import TranslationEngine
+
+        api = TestTranslateMany()._api(3)
+        events = []
+        engine = TranslationEngine(api, "app")
+        results = engine.translate_project(
+            self._pot(tmp_path),
+            tmp_path,
+            progress_callback=lambda *args: events.append(args),
+            languages=["de", "fr", "es", "it"],
+        )
+        assert results == {"de": True, "fr": True, "es": True, "it": True}
+        assert 1 < api.peak <= 3
+        finished = [e for e in events if e[1].startswith("success")]
+        assert sorted(e[2] for e in finished) == [1, 2, 3, 4]
+        po = polib.pofile(str(tmp_path / "po" / "fr.po"))
+        assert po.find("Save %s").msgstr == "SAVE %s"
+
+    def test_parallel_languages_share_the_rate_limit(self, tmp_path):
+        import time
+        from core.translator import TranslationEngine
+
+        api = TestTranslateMany()._api(4)
+        api.batch_delay = 0.05
+        starts = []
+        api.translate_batch = lambda texts, **kw: starts.append(
+            time.monotonic()
+        ) or [t.upper() for t in texts]
+        engine = TranslationEngine(api, "app", batch_size=2)
+        results = engine.translate_project(
+            self._pot(tmp_path), tmp_path, languages=["de", "fr", "es", "it"]
+        )
+        assert results == {"de": True, "fr": True, "es": True, "it": True}
+        # 4 languages x 2 batches: 8 requests, one per batch_delay overall
+        assert len(starts) == 8
+        assert max(starts) - min(starts) >= 7 * api.batch_delay * 0.95
+
+    def test_batch_size_controls_request_grouping(self, tmp_path):
+        from core.translator import TranslationEngine
+
+        api = TestTranslateMany()._api(1)
+        sizes = []
+        api.translate_batch = lambda texts, **kw: sizes.append(len(texts)) or [
+            t.upper() for t in texts
+        ]
+        engine = TranslationEngine(api, "app", batch_size=2)
+        engine.translate_project(self._pot(tmp_path), tmp_path, languages=["de"])
+        assert sizes == [2, 1]
+
+    def test_repeated_msgid_translated_once(self, tmp_path):
+        import polib
+        from core.translator import TranslationEngine
+
+        pot = polib.POFile()
+        pot.append(polib.POEntry(msgid="Open", msgctxt="menu", msgstr=""))
+        pot.append(polib.POEntry(msgid="Open", msgctxt="button", msgstr=""))
+        pot.append(polib.POEntry(msgid="Close", msgstr=""))
+        pot_path = tmp_path / "app.pot"
+        pot.save(str(pot_path))
+
+        api = TestTranslateMany()._api(1)
+        sent = []
+        api.translate_batch = lambda texts, **kw: sent.extend(texts) or [
+            t.upper() for t in texts
+        ]
+        engine = TranslationEngine(api, "app")
+        assert engine.translate_language(pot_path, "de", tmp_path) == 3
+        assert sent == ["Open", "Close"]
+        po = polib.pofile(str(tmp_path / "de.po"))
+        assert [e.msgstr for e in po] == ["OPEN", "OPEN", "CLOSE"]
+
+    def test_pot_parsed_once_and_left_untouched(self, tmp_path, monkeypatch):
+        import polib
+        from core.translator import TranslationEngine
+
+        pot_path = self._pot(tmp_path)
+        parsed = []
+        original = polib.pofile
+
+        def counting_pofile(path, *args, **kwargs):
+            result = original(path, *args, **kwargs)
+            if path.endswith(".pot"):
+                parsed.append(result)
+            return result
+
+        monkeypatch.setattr(polib, "pofile", counting_pofile)
+        engine = TranslationEngine(TestTranslateMany()._api(2), "app")
+        engine.translate_project(pot_path, tmp_path, languages=["de", "fr", "es"])
+        assert len(parsed) == 1
+        assert all(not e.msgstr for e in parsed[0])
+
+    def test_cancelled_languages_are_not_reported(self, tmp_path):
+        import threading
+        from core.translator import TranslationEngine
+
+        cancel = threading.Event()
+        cancel.set()
+        engine = TranslationEngine(TestTranslateMany()._api(4), "app")
+        results = engine.translate_project(
+            self._pot(tmp_path), tmp_path, cancel_event=cancel, languages=["de", "fr"]
+        )
+        assert results == {}
+
+    def test_fix_context_fixes_languages_in_parallel(self, tmp_path):
+        import polib
+        from core.translator import TranslationEngine
+
+        pot_path = self._pot(tmp_path)
+        ref = polib.POFile()
+        for msgid in ("Open", "Save %s", "Quit"):
+            ref.append(polib.POEntry(msgid=msgid, msgstr=msgid.lower()))
+        ref.save(str(pot_path.parent / "fr.po"))
+
+        api = TestTranslateMany()._api(3)
+        events = []
+        engine = TranslationEngine(api, "app")
+        results = engine.fix_context(
+            pot_path,
+            tmp_path,
+            "fr",
+            progress_callback=lambda *args: events.append(args),
+            languages=["fr", "de", "es", "it"],
+        )
+        assert results == {"fr": True, "de": True, "es": True, "it": True}
+        assert 1 < api.peak <= 3
+        finished = [e for e in events if e[1].startswith("success: fixed")]
+        assert sorted(e[2] for e in finished) == [2, 3, 4]
+        po = polib.pofile(str(pot_path.parent / "de.po"))
+        assert po.find("Quit").msgstr == "QUIT"
+        assert not (pot_path.parent / ".langforge_context_cache.json").exists()
+
+    def test_fix_context_shares_the_rate_limit(self, tmp_path):
+        import polib
+        import time
+        from core.translator import TranslationEngine
+
+        pot_path = self._pot(tmp_path)
+        ref = polib.POFile()
+        for msgid in ("Open", "Save %s", "Quit"):
+            ref.append(polib.POEntry(msgid=msgid, msgstr=msgid.lower()))
+        ref.save(str(pot_path.parent / "fr.po"))
+
+        api = TestTranslateMany()._api(3)
+        api.batch_delay = 0.05
+        starts = []
+        api.translate_batch = lambda texts, **kw: starts.append(
+            time.monotonic()
+        ) or [t.upper() for t in texts]
+        engine = TranslationEngine(api, "app", batch_size=2)
+        results = engine.fix_context(
+            pot_path, tmp_path, "fr", languages=["fr", "de", "es", "it"]
+        )
+        assert results == {"fr": True, "de": True, "es": True, "it": True}
+        # Every request, reference check included, is one batch_delay apart
+        assert max(starts) - min(starts) >= (len(starts) - 1) * 0.05 * 0.95
+
+
+class TestImplausibleFallback:
+    def test_fallback_reaches_the_api_and_skips_the_memory(self, tmp_path):
+        import polib
+        from api._cache import cached, cached_batch
+        from core.translator import TranslationEngine
+
+        class ShiftingAPI(TranslationAPI):
+            def __init__(self):
+                self.single = []
+
+            @cached_batch
+            def translate_batch(self, texts, source_lang, target_lang):
+                return ["Fichier ouvert avec succès dans l'éditeur" for _ in texts]
+
+            @cached
+            def translate(self, text, source_lang, target_lang):
+                self.single.append(text)
+                return "Ouvrir"
+
+            def test_connection(self):
+                return True
+
+            def get_name(self):
+                return "Shifting"
+
+        pot = polib.POFile()
+        pot.append(polib.POEntry(msgid="Open", msgstr=""))
+        pot_path = tmp_path / "app.pot"
+        pot.save(str(pot_path))
+
+        api = ShiftingAPI()
+        TranslationEngine(api, "app").translate_language(pot_path, "fr", tmp_path)
+        assert api.single == ["Open"]
+        entry = polib.pofile(str(tmp_path / "fr.po")).find("Open")
+        assert entry.msgstr == "Ouvrir"
+        # The memory now holds the accepted translation, not the rejected one
+        assert api.translate("Open", "en", "fr") == "Ouvrir"
+        assert api.single == ["Open"]
+
+
+class TestCloneEntry:
+    def test_clone_is_independent(self):
+        import polib
+        from core.translator import _clone_entry
+
+        entry = polib.POEntry(
+            msgid="%d file",
+            msgid_plural="%d files",
+            msgstr_plural={0: "", 1: ""},
+            msgctxt="count",
+            occurrences=[("app.py", "10")],
+            flags=["python-format"],
+            comment="extracted",
+        )
+        clone = _clone_entry(entry)
+        assert str(clone) == str(entry)
+        clone.flags.append("fuzzy")
+        clone.msgstr_plural[0] = "%d Datei"
+        assert entry.flags == ["python-format"]
+        assert entry.msgstr_plural[0] == ""
+
+
+class TestConnectionTestCache:
+    def _api_class(self):
+        from api.base import cache_connection_test
+
+        class ProbeAPI(TranslationAPI):
+            def __init__(self, api_key):
+                self.api_key = api_key
+                self.probes = 0
+
+            def translate(self, text, source_lang, target_lang):
+                return text
+
+            @cache_connection_test
+            def test_connection(self):
+                self.probes += 1
+                if self.api_key == "bad":
+                    raise ConnectionError("Probe: invalid key")
+                return True
+
+            def get_name(self):
+                return "Probe"
+
+        return ProbeAPI
+
+    def test_success_is_reused(self):
+        ProbeAPI = self._api_class()
+        first, second = ProbeAPI("good"), ProbeAPI("good")
+        assert first.test_connection()
+        assert second.test_connection()
+        assert first.probes == 1 and second.probes == 0
+
+    def test_failures_are_not_cached(self):
+        import pytest
+
+        api = self._api_class()("bad")
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                api.test_connection()
+        assert api.probes == 2
+
+
 class TestBatchNewlineNormalization:
     def test_prepare_replaces_newlines(self):
         texts = ["Line1\nLine2", "Single"]
@@ -368,6 +698,11 @@ class TestRestorePlaceholdersCorruption:
         tokens = []  # No tokens to restore, but residual should be cleaned
         assert _restore_placeholders(text, tokens) == "Olá  mundo"
 
+    def test_bare_fallback_does_not_touch_longer_numbers(self):
+        text = "x1 e x10"
+        tokens = [("<x1/>", "%s")]
+        assert _restore_placeholders(text, tokens) == "%s e x10"
+
     def test_multiple_corruptions(self):
         text = "A <X1/> B <x2 /> C"
         tokens = [("<x1/>", "%s"), ("<x2/>", "%d")]
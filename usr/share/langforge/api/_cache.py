@@ -0,0 +1,173 @@
+"""Persistent translation memory shared by all providers.
+
+Translations are stored in ~/.cache/langforge/tm.sqlite keyed by a hash of
+provider, model, languages, glossary, prompt context and source text, so strings like
+"Cancel" or "OK" are only paid for once per provider/model.
+"""
+
+import functools
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+# Oldest entries beyond this count are evicted
+_MAX_ENTRIES = 200_000
+# Eviction check frequency (in inserts)
+_EVICT_EVERY = 1000
+
+
+class TranslationMemory:
+    """Small SQLite key/value store; any database error disables the cache."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+        self._inserts = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            path = self._path or Path.home() / ".cache" / "langforge" / "tm.sqlite"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(path), isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tm (k BLOB PRIMARY KEY, v TEXT, ts INTEGER)"
+            )
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            log.warning("Translation memory disabled: %s", e)
+            self._disabled = True
+        return self._conn
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT v FROM tm WHERE k = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE tm SET ts = ? WHERE k = ?", (time.time_ns(), key)
+                    )
+                    return row[0]
+            except sqlite3.Error as e:
+                log.debug("Translation memory read failed: %s", e)
+            return None
+
+    def put(self, key: bytes, value: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO tm (k, v, ts) VALUES (?, ?, ?)",
+                    (key, value, time.time_ns()),
+                )
+                self._inserts += 1
+                if self._inserts % _EVICT_EVERY == 0:
+                    conn.execute(
+                        "DELETE FROM tm WHERE ts < (SELECT ts FROM tm "
+                        "ORDER BY ts DESC LIMIT 1 OFFSET ?)",
+                        (_MAX_ENTRIES,),
+                    )
+            except sqlite3.Error as e:
+                log.debug("Translation memory write failed: %s", e)
+
+    def delete(self, key: bytes) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM tm WHERE k = ?", (key,))
+            except sqlite3.Error as e:
+                log.debug("Translation memory delete failed: %s", e)
+
+
+_memory = TranslationMemory()
+
+
+def _cache_key(api, text: str, source_lang: str, target_lang: str) -> bytes:
+    model = getattr(api, "model", None) or getattr(api, "model_name", "")
+    context = "\x1f".join(getattr(api, "_context_entries", None) or ())
+    raw = "|".join((
+        type(api).__name__,
+        model,
+        source_lang,
+        target_lang,
+        getattr(api, "_app_name", ""),
+        getattr(api, "glossary_id", ""),
+        context,
+        text,
+    ))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+def forget(api, text: str, source_lang: str, target_lang: str) -> None:
+    """Drop a stored translation the caller rejected.
+
+    The decorators store results before the engine validates them; without
+    this, a retry would be served the same bad string from the memory.
+    """
+    _memory.delete(_cache_key(api, text, source_lang, target_lang))
+
+
+def cached(func):
+    """Serve translate() from the translation memory when possible.
+
+    Lookups are skipped when the client's ``use_cache`` is False (forced
+    retranslation), but fresh results are always stored.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, text: str, source_lang: str, target_lang: str) -> str:
+        key = _cache_key(self, text, source_lang, target_lang)
+        if self.use_cache:
+            hit = _memory.get(key)
+            if hit is not None:
+                return hit
+        result = func(self, text, source_lang, target_lang)
+        if result:
+            _memory.put(key, result)
+        return result
+
+    return wrapper
+
+
+def cached_batch(func):
+    """Like cached(), but only sends the cache misses of a batch."""
+
+    @functools.wraps(func)
+    def wrapper(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        keys = [_cache_key(self, t, source_lang, target_lang) for t in texts]
+        results: list[Optional[str]] = [None] * len(texts)
+        if self.use_cache:
+            results = [_memory.get(k) for k in keys]
+        missing = [i for i, r in enumerate(results) if r is None]
+        if not missing:
+            return results
+        fresh = func(self, [texts[i] for i in missing], source_lang, target_lang)
+        for i, translation in zip(missing, fresh):
+            results[i] = translation
+            if translation:
+                _memory.put(keys[i], translation)
+        return results
+
+    return wrapper
@@ -0,0 +1,70 @@
+"""Shared HTTP session used by the requests-based providers."""
+
+from typing import Any, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:  # optional speedup — fall back to the stdlib
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
+
+# For requests whose body is produced by json_dumps()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _build_session() -> requests.Session:
+    """Create a session with a larger connection pool and transport retries.
+
+    HTTP 429 is deliberately left out of the retry list: retry_on_rate_limit
+    already handles it and honors the provider's Retry-After hints.
+    """
+    session = requests.Session()
+    # Advertise every encoding urllib3 can decode natively: gzip/deflate,
+    # plus br/zstd when the optional brotli/zstandard modules are installed
+    session.headers.update(
+        {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+    )
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(("GET", "POST")),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One pool for every provider instance, so clients rebuilt after a settings
+# change keep their warm TLS connections. Never mutate its headers: pass
+# credentials per request instead.
+SESSION = _build_session()
+
+
+def iter_sse_content(response) -> Iterator[str]:
+    """Yield content deltas from an OpenAI-style server-sent event stream."""
+    for line in response.iter_lines():
+        if not line or not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            break
+        choices = json_loads(payload).get("choices") or ()
+        if choices:
+            delta = choices[0].get("delta", {}).get("content")
+            if delta:
+                yield delta
@@ -0,0 +1,192 @@
+"""Base class for providers speaking the OpenAI chat-completions protocol."""
+
+import logging
+from typing import Iterator, Optional
+
+import requests
+
+from api._cache import cached, cached_batch
+from api._http import (
+    JSON_HEADERS,
+    SESSION,
+    iter_sse_content,
+    json_dumps,
+    json_loads,
+)
+from api.base import (
+    TranslationAPI,
+    build_batch_prompt,
+    build_translation_prompt,
+    cache_connection_test,
+    clean_batch_parts,
+    prepare_batch_texts,
+    restore_batch_texts,
+    retry_on_rate_limit,
+)
+
+log = logging.getLogger(__name__)
+
+
+class OpenAICompatibleAPI(TranslationAPI):
+    """Shared implementation for Groq, OpenRouter, Mistral and Grok.
+
+    Subclasses only set the class-level constants below; the request
+    shape, batching protocol and error handling live here.
+    """
+
+    BASE_URL: str = ""
+    DEFAULT_MODEL: str = ""
+    # Display name returned by get_name(); may reference {model}
+    NAME: str = ""
+    # Short provider name used in logs and error messages
+    LABEL: str = ""
+    # Strings per |||NEXT||| batch request
+    SUB_BATCH_SIZE: int = 10
+    EXTRA_HEADERS: dict[str, str] = {}
+
+    def __init__(self, api_key: str, model: Optional[str] = None):
+        self.api_key = api_key
+        self.model = model or self.DEFAULT_MODEL
+        self.session = SESSION
+        self.base_url = self.BASE_URL
+        self._chat_url = f"{self.base_url}/chat/completions"
+        self._models_url = f"{self.base_url}/models"
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            **self.EXTRA_HEADERS,
+            **JSON_HEADERS,
+        }
+        # Extra request body fields (e.g. reasoning_effort)
+        self._extra_params: dict = {}
+        # Headers, auth and cookies are merged once; each call only copies
+        # the template and swaps the body (see _send)
+        self._chat_request = self.session.prepare_request(
+            requests.Request("POST", self._chat_url, headers=self._headers)
+        )
+        self._send_settings = self.session.merge_environment_settings(
+            self._chat_url, {}, None, None, None
+        )
+        self._reset_usage()
+
+    def _payload(self, system_prompt: str, user_msg: str, max_tokens: int) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_msg},
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens,
+            **self._extra_params,
+        }
+
+    def _send(self, payload: dict, timeout: int, stream: bool = False):
+        # copy() keeps the shared template safe for concurrent translate_many
+        request = self._chat_request.copy()
+        request.prepare_body(json_dumps(payload), None)
+        settings = {**self._send_settings, "stream": stream}
+        # API endpoints never redirect
+        return self.session.send(
+            request, timeout=timeout, allow_redirects=False, **settings
+        )
+
+    def _chat(self, payload: dict, timeout: int) -> str:
+        response = self._send(payload, timeout)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        usage = data.get("usage")
+        if usage:
+            self._track_usage(
+                usage.get("prompt_tokens", 0),
+                usage.get("completion_tokens", 0),
+            )
+        return data["choices"][0]["message"]["content"].strip()
+
+    @cached
+    @retry_on_rate_limit
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Traduz texto usando o endpoint de chat completions."""
+        system_prompt = build_translation_prompt(
+            source_lang,
+            target_lang,
+            getattr(self, "_app_name", ""),
+            getattr(self, "_context_entries", None),
+        )
+        return self._chat(self._payload(system_prompt, text, 512), timeout=30)
+
+    def translate_stream(
+        self, text: str, source_lang: str, target_lang: str
+    ) -> Iterator[str]:
+        """Stream the translation token by token."""
+        system_prompt = build_translation_prompt(
+            source_lang,
+            target_lang,
+            getattr(self, "_app_name", ""),
+            getattr(self, "_context_entries", None),
+        )
+        payload = self._payload(system_prompt, text, 512)
+        payload["stream"] = True
+        with self._send(payload, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            yield from iter_sse_content(response)
+
+    @cached_batch
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        """Translate multiple texts in sub-batches of SUB_BATCH_SIZE."""
+        if len(texts) == 1:
+            return [self.translate(texts[0], source_lang, target_lang)]
+        size = self.SUB_BATCH_SIZE
+        results: list[str] = []
+        for start in range(0, len(texts), size):
+            if start > 0:
+                self.throttle()
+            chunk = texts[start : start + size]
+            results.extend(self._do_batch(chunk, source_lang, target_lang))
+        return results
+
+    @retry_on_rate_limit
+    def _do_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        system_prompt = build_batch_prompt(
+            source_lang,
+            target_lang,
+            getattr(self, "_app_name", ""),
+            getattr(self, "_context_entries", None),
+        )
+        user_msg = "|||NEXT|||".join(prepare_batch_texts(texts))
+        content = self._chat(self._payload(system_prompt, user_msg, 2048), timeout=60)
+        parts = restore_batch_texts(clean_batch_parts(content))
+        if len(parts) != len(texts):
+            log.warning(
+                "%s batch mismatch: expected %d, got %d. Translating remaining individually.",
+                self.LABEL,
+                len(texts),
+                len(parts),
+            )
+            if len(parts) < len(texts):
+                for t in texts[len(parts):]:
+                    parts.append(self.translate(t, source_lang, target_lang))
+            else:
+                parts = parts[: len(texts)]
+        return parts
+
+    @cache_connection_test
+    def test_connection(self) -> bool:
+        """Testa conexão listando os modelos disponíveis."""
+        try:
+            response = self.session.get(
+                self._models_url,
+                headers=self._headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            log.debug("%s test error: %s", self.LABEL, e)
+            raise ConnectionError(f"{self.LABEL}: {e}") from e
+
+    def get_name(self) -> str:
+        return self.NAME.format(model=self.model)
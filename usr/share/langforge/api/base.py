@@ -1,9 +1,14 @@
 """Interface abstrata para APIs de tradução."""
 
+import functools
+import hashlib
+import importlib.util
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 
 from core.languages import SUPPORTED_LANGUAGES
 
@@ -14,19 +19,38 @@ _MAX_RETRIES = 5
 _INITIAL_BACKOFF = 2.0  # seconds
 _BACKOFF_FACTOR = 2.0
 
-# Shared prompt template for all LLM-based translation APIs.
-# Placeholders: {source}, {target}, {app_name}, {context_section}
+# Successful connection tests are reused for this many seconds
+_CONNECTION_TEST_TTL = 60.0
+_connection_tests: dict[tuple[str, str], float] = {}
+_connection_tests_lock = threading.Lock()
+
+
+def sdk_available(module: str) -> bool:
+    """Check whether an optional SDK is installed without importing it."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ModuleNotFoundError:  # parent package (e.g. 'google') missing
+        return False
 
 
 def _resolve_lang(code: str) -> str:
     """Resolve a language code to its full name for clearer LLM prompts."""
     return SUPPORTED_LANGUAGES.get(code, code)
+
+
+# Shared prompt templates for all LLM-based translation APIs.
+# Placeholders: {source}, {target}, {app_name}, {context_section}
+#
+# The rules come first and contain no placeholders, so every request starts
+# with a byte-identical prefix that provider-side prompt caching (OpenAI,
+# DeepSeek, Gemini) can reuse across language pairs. Everything that varies
+# per run is appended at the end.
 _TRANSLATION_PROMPT = (
     "You are a professional translator specializing in software localization. "
-    "You are translating UI strings for the application '{app_name}'. "
-    "Translate the following text from {source} to {target}.\n\n"
+    "You translate UI strings for the application named at the end of these "
+    "instructions.\n\n"
     "CRITICAL RULES:\n"
-    "1. NEVER translate the application name '{app_name}' or any variation of it — "
+    "1. NEVER translate the application name or any variation of it — "
     "it is a proper noun and must remain exactly as written.\n"
     "2. NEVER translate brand names, product names, project names, or proper nouns.\n"
     "3. Use natural, contextual translation appropriate for a software UI — "
@@ -36,7 +60,9 @@ _TRANSLATION_PROMPT = (
     "{{}}, %s, %d, and formatting codes EXACTLY as they are. "
     "Do NOT translate, rename, or modify ANY text inside curly braces {{}} or XML tags. "
     "For example, {{total}} must stay as {{total}}, NOT be translated.\n"
-    "6. Return ONLY the translated text, nothing else.\n"
+    "6. Return ONLY the translated text, nothing else.\n\n"
+    "Application: '{app_name}' (keep '{app_name}' untranslated).\n"
+    "Translate the following text from {source} to {target}.\n"
     "{context_section}"
 )
 
@@ -67,20 +93,35 @@ def build_translation_prompt(
         app_name: Application textdomain / identifier (e.g. 'ashy-term').
         context_entries: Sample msgid strings for disambiguation.
     """
+    return _format_prompt(
+        _TRANSLATION_PROMPT, source, target, app_name, _context_key(context_entries)
+    )
+
+
+def _context_key(context_entries: Optional[list[str]]) -> tuple[str, ...]:
+    """Hashable form of the context samples actually used in prompts."""
+    return tuple(context_entries[:15]) if context_entries else ()
+
+
+@functools.lru_cache(maxsize=256)
+def _format_prompt(
+    template: str, source: str, target: str, app_name: str, samples: tuple[str, ...]
+) -> str:
+    """Format a prompt template; memoized since a run reuses one language pair."""
     # Derive a human-readable display name from the textdomain
     display_name = (
         app_name.replace("-", " ").replace("_", " ").title() if app_name else "unknown"
     )
 
     context_section = ""
-    if context_entries:
-        samples = "\n".join(f"  - {entry}" for entry in context_entries[:15])
+    if samples:
+        lines = "\n".join(f"  - {entry}" for entry in samples)
         context_section = (
             f"\nFor context, other UI strings from this application include:\n"
-            f"{samples}\n"
+            f"{lines}\n"
         )
 
-    return _TRANSLATION_PROMPT.format(
+    return template.format(
         source=_resolve_lang(source),
         target=_resolve_lang(target),
         app_name=display_name,
@@ -90,10 +131,10 @@ def build_translation_prompt(
 
 _BATCH_PROMPT = (
     "You are a professional translator specializing in software localization. "
-    "You are translating UI strings for the application '{app_name}'. "
-    "Translate ALL the following texts from {source} to {target}.\n\n"
+    "You translate UI strings for the application named at the end of these "
+    "instructions.\n\n"
     "CRITICAL RULES:\n"
-    "1. NEVER translate the application name '{app_name}' — it is a proper noun.\n"
+    "1. NEVER translate the application name — it is a proper noun.\n"
     "2. NEVER translate brand names, product names, or proper nouns.\n"
     "3. Use natural, contextual translation for a software UI.\n"
     "4. Preserve XML tags (<x1/>, <x2/>), placeholders ({{}}, %s, %d) EXACTLY as-is. "
@@ -102,7 +143,9 @@ _BATCH_PROMPT = (
     "with the SAME numbering.\n"
     "6. Use the separator |||NEXT||| between each translation.\n"
     "7. Do NOT add bullet points or any extra text beyond the numbers.\n"
-    "8. Preserve the token <NL> exactly as-is — it represents a line break.\n"
+    "8. Preserve the token <NL> exactly as-is — it represents a line break.\n\n"
+    "Application: '{app_name}' (keep '{app_name}' untranslated).\n"
+    "Translate ALL the following texts from {source} to {target}.\n"
     "{context_section}"
 )
 
@@ -114,21 +157,8 @@ def build_batch_prompt(
     context_entries: Optional[list[str]] = None,
 ) -> str:
     """Build a batch translation system prompt."""
-    display_name = (
-        app_name.replace("-", " ").replace("_", " ").title() if app_name else "unknown"
-    )
-    context_section = ""
-    if context_entries:
-        samples = "\n".join(f"  - {entry}" for entry in context_entries[:15])
-        context_section = (
-            f"\nFor context, other UI strings from this application include:\n"
-            f"{samples}\n"
-        )
-    return _BATCH_PROMPT.format(
-        source=_resolve_lang(source),
-        target=_resolve_lang(target),
-        app_name=display_name,
-        context_section=context_section,
+    return _format_prompt(
+        _BATCH_PROMPT, source, target, app_name, _context_key(context_entries)
     )
 
 
@@ -192,6 +222,20 @@ class TranslationAPI(ABC):
     # Format: (input_cost_per_1M, output_cost_per_1M)
     _token_pricing: tuple[float, float] = (0.0, 0.0)
 
+    # Max requests in flight for translate_many(). 1 keeps calls serial.
+    MAX_CONCURRENCY: int = 1
+
+    # Earliest monotonic time for the next paced request (see throttle())
+    _next_request_at: float = 0.0
+    _throttle_lock = threading.Lock()
+
+    # Guards usage counters updated from concurrent requests
+    _usage_lock = threading.Lock()
+
+    # Serve repeated strings from the persistent translation memory
+    # (api/_cache.py). Set to False to force fresh translations.
+    use_cache: bool = True
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
@@ -204,16 +248,17 @@ class TranslationAPI(ABC):
 
     def _track_usage(self, input_tokens: int, output_tokens: int) -> None:
         """Accumulate token usage and compute cost."""
-        if not hasattr(self, "_total_input_tokens"):
-            self._reset_usage()
-        self._total_input_tokens += input_tokens
-        self._total_output_tokens += output_tokens
-        self._api_calls += 1
         inp_price, out_price = self._token_pricing
-        self._total_cost_usd += (
-            input_tokens * inp_price / 1_000_000
-            + output_tokens * out_price / 1_000_000
-        )
+        with self._usage_lock:
+            if not hasattr(self, "_total_input_tokens"):
+                self._reset_usage()
+            self._total_input_tokens += input_tokens
+            self._total_output_tokens += output_tokens
+            self._api_calls += 1
+            self._total_cost_usd += (
+                input_tokens * inp_price / 1_000_000
+                + output_tokens * out_price / 1_000_000
+            )
 
     def get_usage(self) -> dict:
         """Return accumulated usage statistics.
@@ -267,6 +312,51 @@ class TranslationAPI(ABC):
         """
         return [self.translate(t, source_lang, target_lang) for t in texts]
 
+    def throttle(self) -> None:
+        """Wait for this instance's next request slot, batch_delay apart.
+
+        Slots are shared by every thread using the instance, so languages
+        translated in parallel stay within the RPM budget that batch_delay
+        was tuned for instead of each worker pacing itself.
+        """
+        if self.batch_delay <= 0:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + self.batch_delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    def translate_many(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        """Translate texts individually with up to MAX_CONCURRENCY in flight.
+
+        Results keep the input order. Rate-limited items are retried by
+        retry_on_rate_limit inside translate(), honoring Retry-After.
+        """
+        workers = min(self.MAX_CONCURRENCY, len(texts))
+        if workers <= 1:
+            return [self.translate(t, source_lang, target_lang) for t in texts]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda t: self.translate(t, source_lang, target_lang), texts
+                )
+            )
+
+    def translate_stream(
+        self, text: str, source_lang: str, target_lang: str
+    ) -> Iterator[str]:
+        """Yield the translation incrementally (when supported).
+
+        Default implementation yields the whole result of translate().
+        Chat-completion subclasses override this to yield tokens as they
+        arrive, so callers can render progressively or stop early.
+        """
+        yield self.translate(text, source_lang, target_lang)
+
     @abstractmethod
     def test_connection(self) -> bool:
         """
@@ -301,7 +391,6 @@ def retry_on_rate_limit(func):
 
     Respects Retry-After header and Gemini's retryDelay field.
     """
-    import functools
     import requests
 
     @functools.wraps(func)
@@ -355,3 +444,32 @@ def retry_on_rate_limit(func):
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def cache_connection_test(func):
+    """Reuse a successful test_connection() result for 60 seconds.
+
+    Keyed by provider class and a hash of its credential (API key or URL),
+    so repeated checks from the settings UI don't hit the network — or, for
+    Gemini, burn generation quota. Failures are never cached.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self) -> bool:
+        credential = getattr(self, "api_key", None) or getattr(self, "url", "")
+        key = (
+            type(self).__name__,
+            hashlib.blake2b(credential.encode(), digest_size=8).hexdigest(),
+        )
+        now = time.monotonic()
+        with _connection_tests_lock:
+            checked_at = _connection_tests.get(key)
+        if checked_at is not None and now - checked_at < _CONNECTION_TEST_TTL:
+            return True
+        ok = func(self)
+        if ok:
+            with _connection_tests_lock:
+                _connection_tests[key] = now
+        return ok
+
+    return wrapper
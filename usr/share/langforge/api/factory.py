@@ -1,8 +1,17 @@
 """Factory para criação de clientes de API."""
 
+import importlib
+from functools import lru_cache
+
 from api.base import TranslationAPI
 
 
+@lru_cache(maxsize=None)
+def _resolve(module_name: str, class_name: str) -> type:
+    """Import dinâmico do módulo do provider, resolvido uma única vez."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class APIFactory:
     """Factory para criar clientes de API de tradução."""
 
@@ -23,6 +32,8 @@ class APIFactory:
         "deepseek": ("api.paid_apis", "DeepSeekAPI"),
     }
 
+    _ALL_APIS = {**_FREE_APIS, **_PAID_APIS}
+
     @classmethod
     def create(cls, provider: str, api_key: str = "", **kwargs) -> TranslationAPI:
         """
@@ -39,24 +50,20 @@ class APIFactory:
         Raises:
             ValueError: Se provider for desconhecido
         """
-        all_apis = {**cls._FREE_APIS, **cls._PAID_APIS}
-
-        if provider not in all_apis:
+        if provider not in cls._ALL_APIS:
             raise ValueError(f"Provider desconhecido: {provider}")
 
-        module_name, class_name = all_apis[provider]
-
-        # Import dinâmico
-        import importlib
-
-        module = importlib.import_module(module_name)
-        api_class = getattr(module, class_name)
+        api_class = _resolve(*cls._ALL_APIS[provider])
 
         # LibreTranslate usa URL ao invés de API key
         if provider == "libretranslate":
             url = kwargs.get("url", "https://libretranslate.com")
             return api_class(url)
 
+        # DeepL aceita um glossário opcional
+        if provider == "deepl-free":
+            return api_class(api_key, glossary_id=kwargs.get("glossary_id", ""))
+
         # Outros usam api_key e opcionalmente model
         model = kwargs.get("model")
         if model:
@@ -87,6 +94,10 @@ class APIFactory:
                 )
                 return cls.create(provider, url=url)
 
+            if provider == "deepl-free":
+                glossary_id = settings.get("free_api.deepl_glossary_id", "")
+                return cls.create(provider, api_key, glossary_id=glossary_id)
+
             if model:
                 return cls.create(provider, api_key, model=model)
             return cls.create(provider, api_key)
@@ -111,4 +122,4 @@ class APIFactory:
     @classmethod
     def is_valid_provider(cls, provider: str) -> bool:
         """Verifica se provider é válido."""
-        return provider in cls._FREE_APIS or provider in cls._PAID_APIS
+        return provider in cls._ALL_APIS
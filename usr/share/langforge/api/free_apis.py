@@ -1,27 +1,49 @@
 """Implementações de APIs de tradução com tier gratuito."""
 
 import logging
-
-import requests
-
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+from api._cache import cached, cached_batch
+from api._http import JSON_HEADERS, SESSION, json_dumps, json_loads
+from api._openai_compat import OpenAICompatibleAPI
 from api.base import (
     TranslationAPI,
     build_batch_prompt,
     build_translation_prompt,
+    cache_connection_test,
     clean_batch_parts,
     prepare_batch_texts,
     restore_batch_texts,
     retry_on_rate_limit,
+    sdk_available,
 )
 from core.languages import get_api_lang_code
 
+__all__ = [
+    "GroqAPI",
+    "LibreTranslateAPI",
+    "DeepLFreeAPI",
+    "GeminiFreeAPI",
+    "OpenRouterAPI",
+    "MistralFreeAPI",
+]
+
 log = logging.getLogger(__name__)
 
 # Maximum strings per batch call
 _BATCH_SIZE = 15
 
+# DeepL allows ~5 requests in flight; shared by every DeepLFreeAPI instance
+_DEEPL_EXECUTOR = ThreadPoolExecutor(max_workers=5, thread_name_prefix="deepl")
+
 
-class GroqAPI(TranslationAPI):
+class GroqAPI(OpenAICompatibleAPI):
     """
     Groq - Super rápido com LPU hardware.
     Limite: 14,400 requests/dia (melhor opção gratuita!)
@@ -30,116 +52,15 @@ class GroqAPI(TranslationAPI):
     """
 
     batch_delay = 2.0  # Groq free: 30 RPM
+    MAX_CONCURRENCY = 10
 
-    def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile"):
-        self.api_key = api_key
-        self.model = model
-        self.session = requests.Session()
-        self.base_url = "https://api.groq.com/openai/v1"
-
-    @retry_on_rate_limit
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Traduz texto usando Groq."""
-        system_prompt = build_translation_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 512,
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"].strip()
-
-    def translate_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        """Translate multiple texts using Groq with sub-batches of 8.
-
-        Llama models struggle to align |||NEXT||| separators with 15+ items,
-        so we use smaller sub-batches to reduce mismatch and rate limit hits.
-        """
-        import time as _time
-
-        if len(texts) == 1:
-            return [self.translate(texts[0], source_lang, target_lang)]
-        sub_batch_size = 8
-        results: list[str] = []
-        for start in range(0, len(texts), sub_batch_size):
-            if start > 0:
-                _time.sleep(self.batch_delay)
-            chunk = texts[start : start + sub_batch_size]
-            results.extend(self._do_batch(chunk, source_lang, target_lang))
-        return results
-
-    @retry_on_rate_limit
-    def _do_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        system_prompt = build_batch_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        user_msg = "|||NEXT|||".join(prepare_batch_texts(texts))
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_msg},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 2048,
-            },
-            timeout=60,
-        )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"].strip()
-        parts = restore_batch_texts(clean_batch_parts(content))
-        if len(parts) != len(texts):
-            log.warning(
-                "Groq batch mismatch: expected %d, got %d. Translating remaining individually.",
-                len(texts),
-                len(parts),
-            )
-            if len(parts) < len(texts):
-                for t in texts[len(parts):]:
-                    parts.append(self.translate(t, source_lang, target_lang))
-            else:
-                parts = parts[: len(texts)]
-        return parts
-
-    def test_connection(self) -> bool:
-        """Testa conexão com Groq."""
-        try:
-            response = self.session.get(
-                f"{self.base_url}/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=10,
-            )
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            raise ConnectionError(f"Groq: {e}") from e
-
-    def get_name(self) -> str:
-        return "Groq (14.4k req/dia)"
+    BASE_URL = "https://api.groq.com/openai/v1"
+    DEFAULT_MODEL = "llama-3.3-70b-versatile"
+    NAME = "Groq (14.4k req/dia)"
+    LABEL = "Groq"
+    # Llama models struggle to align |||NEXT||| separators with 15+ items,
+    # so smaller sub-batches reduce mismatches and rate limit hits.
+    SUB_BATCH_SIZE = 8
 
 
 class LibreTranslateAPI(TranslationAPI):
@@ -151,8 +72,11 @@ class LibreTranslateAPI(TranslationAPI):
 
     def __init__(self, url: str = "https://libretranslate.com"):
         self.url = url.rstrip("/")
-        self.session = requests.Session()
+        self.session = SESSION
+        self._translate_url = f"{self.url}/translate"
+        self._languages_url = f"{self.url}/languages"
 
+    @cached
     @retry_on_rate_limit
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Traduz texto usando LibreTranslate."""
@@ -160,17 +84,21 @@ class LibreTranslateAPI(TranslationAPI):
         target = get_api_lang_code(target_lang)
 
         response = self.session.post(
-            f"{self.url}/translate",
-            json={"q": text, "source": source, "target": target, "format": "text"},
+            self._translate_url,
+            headers=JSON_HEADERS,
+            data=json_dumps(
+                {"q": text, "source": source, "target": target, "format": "text"}
+            ),
             timeout=30,
         )
         response.raise_for_status()
-        return response.json()["translatedText"]
+        return json_loads(response.content)["translatedText"]
 
+    @cache_connection_test
     def test_connection(self) -> bool:
         """Testa conexão com LibreTranslate."""
         try:
-            response = self.session.get(f"{self.url}/languages", timeout=10)
+            response = self.session.get(self._languages_url, timeout=10)
             response.raise_for_status()
             return True
         except Exception as e:
@@ -188,6 +116,8 @@ class DeepLFreeAPI(TranslationAPI):
     Requires: Free API key from https://www.deepl.com/pro-api
     """
 
+    MAX_CONCURRENCY = 5
+
     # DeepL supported target languages (as of 2024)
     DEEPL_LANG_MAP = {
         "bg": "BG",
@@ -219,18 +149,30 @@ class DeepLFreeAPI(TranslationAPI):
         # Not supported by DeepL: he (Hebrew), hr (Croatian), is (Icelandic)
     }
 
-    def __init__(self, api_key: str):
-        import time
+    # DeepL accepts at most 50 text fields per /translate request
+    _MAX_TEXTS = 50
 
+    def __init__(self, api_key: str, glossary_id: str = ""):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.glossary_id = glossary_id
+        self.session = SESSION
+        self._headers = {"Authorization": f"DeepL-Auth-Key {api_key}"}
+        # Fields shared by every /translate request
+        self._base_payload = {
+            "source_lang": "EN",
+            "tag_handling": "xml",
+            "ignore_tags": "x",
+        }
+        # Glossary target language, fetched on first use
+        self._glossary_lang: Optional[str] = None
         # Keys ending in ':fx' use the free API, others use the pro API
         if api_key.strip().endswith(":fx"):
-            self.base_url = "https://api-free.deepl.com/v2"
+            self._set_base_url("https://api-free.deepl.com/v2")
         else:
-            self.base_url = "https://api.deepl.com/v2"
-        self._time = time
-        self._last_request: float = 0.0
+            self._set_base_url("https://api.deepl.com/v2")
+        # Send times of the last 5 requests: at most 5 requests per second
+        self._bucket: deque[float] = deque(maxlen=5)
+        self._bucket_lock = threading.Lock()
         self._resolved = False
 
     def _ensure_endpoint(self) -> None:
@@ -239,8 +181,8 @@ class DeepLFreeAPI(TranslationAPI):
             return
         try:
             r = self.session.get(
-                f"{self.base_url}/usage",
-                headers={"Authorization": f"DeepL-Auth-Key {self.api_key}"},
+                self._usage_url,
+                headers=self._headers,
                 timeout=10,
             )
             if r.status_code != 403:
@@ -250,50 +192,142 @@ class DeepLFreeAPI(TranslationAPI):
             pass
         # Swap endpoint and retry
         if "api-free" in self.base_url:
-            self.base_url = "https://api.deepl.com/v2"
+            self._set_base_url("https://api.deepl.com/v2")
         else:
-            self.base_url = "https://api-free.deepl.com/v2"
+            self._set_base_url("https://api-free.deepl.com/v2")
         self._resolved = True
 
+    def _set_base_url(self, base_url: str) -> None:
+        self.base_url = base_url
+        self._translate_url = f"{base_url}/translate"
+        self._usage_url = f"{base_url}/usage"
+        self._document_url = f"{base_url}/document"
+
+    def _payload(self, target: str) -> dict:
+        """Static request fields plus target language and glossary."""
+        payload = {**self._base_payload, "target_lang": target}
+        if self.glossary_id:
+            if self._glossary_lang is None:
+                response = self.session.get(
+                    f"{self.base_url}/glossaries/{self.glossary_id}",
+                    headers=self._headers,
+                    timeout=10,
+                )
+                response.raise_for_status()
+                self._glossary_lang = json_loads(response.content)["target_lang"]
+            # A glossary covers a single language pair (e.g. EN→DE)
+            if target.split("-")[0].lower() == self._glossary_lang.lower():
+                payload["glossary_id"] = self.glossary_id
+        return payload
+
+    @classmethod
+    def _deepl_target(cls, target_lang: str) -> str:
+        """Map a LangForge language code to DeepL's target_lang value."""
+        target = cls.DEEPL_LANG_MAP.get(target_lang)
+        if not target:
+            raise ValueError(f"Language '{target_lang}' is not supported by DeepL")
+        return target
+
+    def _throttle(self) -> None:
+        """Block until a request slot is free (max 5 requests/second)."""
+        with self._bucket_lock:
+            now = time.monotonic()
+            if len(self._bucket) == self._bucket.maxlen:
+                wait = 1.0 - (now - self._bucket[0])
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+            self._bucket.append(now)
+
+    @cached
     @retry_on_rate_limit
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translate text using DeepL."""
+        target = self._deepl_target(target_lang)
         self._ensure_endpoint()
-        target = self.DEEPL_LANG_MAP.get(target_lang)
-        if not target:
-            raise ValueError(f"Language '{target_lang}' is not supported by DeepL")
+        payload = self._payload(target)
+        self._throttle()
+        response = self.session.post(
+            self._translate_url,
+            headers=self._headers,
+            data={"text": text, **payload},
+            timeout=30,
+        )
+
+        if response.status_code == 456:
+            raise RuntimeError("DeepL quota exceeded (500k chars/month)")
+        response.raise_for_status()
+        return json_loads(response.content)["translations"][0]["text"]
+
+    @cached_batch
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        """Translate texts using DeepL's native multi-text requests.
 
-        # Rate limiting: max 5 requests/second
-        elapsed = self._time.time() - self._last_request
-        if elapsed < 0.2:
-            self._time.sleep(0.2 - elapsed)
+        DeepL accepts up to 50 `text` fields per call and returns the
+        translations in the same order, so no separator protocol is needed.
+        Chunks are sent concurrently; _throttle() keeps us within 5 req/s.
+        """
+        if len(texts) == 1:
+            return [self.translate(texts[0], source_lang, target_lang)]
+        # Validate the language and resolve the endpoint once, before any
+        # request is sent or work is fanned out to worker threads
+        target = self._deepl_target(target_lang)
+        self._ensure_endpoint()
+        payload = self._payload(target)
+        chunks = [
+            texts[start : start + self._MAX_TEXTS]
+            for start in range(0, len(texts), self._MAX_TEXTS)
+        ]
+        if len(chunks) == 1:
+            return self._do_batch(chunks[0], source_lang, target_lang, payload)
+        futures = [
+            _DEEPL_EXECUTOR.submit(
+                self._do_batch, chunk, source_lang, target_lang, payload
+            )
+            for chunk in chunks
+        ]
+        results: list[str] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
 
+    @retry_on_rate_limit
+    def _do_batch(
+        self, texts: list[str], source_lang: str, target_lang: str, payload: dict
+    ) -> list[str]:
+        self._throttle()
+        data = [("text", t) for t in texts]
+        data.extend(payload.items())
         response = self.session.post(
-            f"{self.base_url}/translate",
-            headers={"Authorization": f"DeepL-Auth-Key {self.api_key}"},
-            data={
-                "text": text,
-                "source_lang": "EN",
-                "target_lang": target,
-                "tag_handling": "xml",
-                "ignore_tags": "x",
-            },
-            timeout=30,
+            self._translate_url,
+            headers=self._headers,
+            data=data,
+            timeout=60,
         )
-        self._last_request = self._time.time()
 
         if response.status_code == 456:
             raise RuntimeError("DeepL quota exceeded (500k chars/month)")
         response.raise_for_status()
-        return response.json()["translations"][0]["text"]
+        translations = json_loads(response.content)["translations"]
+        if len(translations) != len(texts):
+            log.warning(
+                "DeepL batch mismatch: expected %d, got %d. Translating individually.",
+                len(texts),
+                len(translations),
+            )
+            return [self.translate(t, source_lang, target_lang) for t in texts]
+        return [t["text"] for t in translations]
 
+    @cache_connection_test
     def test_connection(self) -> bool:
         """Test connection with DeepL."""
         self._ensure_endpoint()
         try:
             response = self.session.get(
-                f"{self.base_url}/usage",
-                headers={"Authorization": f"DeepL-Auth-Key {self.api_key}"},
+                self._usage_url,
+                headers=self._headers,
                 timeout=10,
             )
             if response.status_code == 403:
@@ -305,6 +339,64 @@ class DeepLFreeAPI(TranslationAPI):
         except Exception as e:
             raise ConnectionError(f"DeepL: {e}") from e
 
+    def translate_document(
+        self,
+        path: Path,
+        target_lang: str,
+        output_path: Optional[Path] = None,
+        poll_interval: float = 2.0,
+    ) -> Path:
+        """Translate a whole file with DeepL's document API.
+
+        One upload and one download instead of a request per string.
+        Supports the formats DeepL documents (.txt, .srt, .html, .docx,
+        .xlf, ...). Returns the path of the translated file.
+        """
+        target = self._deepl_target(target_lang)
+        self._ensure_endpoint()
+        payload = self._payload(target)
+        # Tag handling options do not apply to whole documents
+        for field in ("tag_handling", "ignore_tags"):
+            payload.pop(field, None)
+
+        with open(path, "rb") as f:
+            response = self.session.post(
+                self._document_url,
+                headers=self._headers,
+                data=payload,
+                files={"file": (path.name, f)},
+                timeout=120,
+            )
+        if response.status_code == 456:
+            raise RuntimeError("DeepL quota exceeded (500k chars/month)")
+        response.raise_for_status()
+        handle = json_loads(response.content)
+        status_url = f"{self._document_url}/{handle['document_id']}"
+        key = {"document_key": handle["document_key"]}
+
+        while True:
+            response = self.session.post(
+                status_url, headers=self._headers, data=key, timeout=30
+            )
+            response.raise_for_status()
+            status = json_loads(response.content)
+            if status["status"] == "done":
+                break
+            if status["status"] == "error":
+                raise RuntimeError(
+                    f"DeepL document translation failed: {status.get('message', '')}"
+                )
+            time.sleep(status.get("seconds_remaining") or poll_interval)
+
+        response = self.session.post(
+            f"{status_url}/result", headers=self._headers, data=key, timeout=120
+        )
+        response.raise_for_status()
+        if output_path is None:
+            output_path = path.with_name(f"{path.stem}.{target_lang}{path.suffix}")
+        output_path.write_bytes(response.content)
+        return output_path
+
     def get_usage(self) -> dict:
         """Fetch DeepL usage statistics.
 
@@ -312,12 +404,12 @@ class DeepLFreeAPI(TranslationAPI):
         """
         self._ensure_endpoint()
         response = self.session.get(
-            f"{self.base_url}/usage",
-            headers={"Authorization": f"DeepL-Auth-Key {self.api_key}"},
+            self._usage_url,
+            headers=self._headers,
             timeout=10,
         )
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
 
     def get_name(self) -> str:
         return "DeepL Free (500k chars/month)"
@@ -333,17 +425,14 @@ class GeminiFreeAPI(TranslationAPI):
     """
 
     batch_delay = 5.0  # 12 RPM — safely under 15 RPM limit
+    MAX_CONCURRENCY = 1  # 15 RPM leaves no room for parallel requests
 
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash-lite"):
-        try:
-            from google import genai
-        except ImportError:
+        # Fail fast without paying the SDK import until the first request
+        if not sdk_available("google.genai"):
             raise ImportError("Install: pip install google-genai")
 
-        self.client = genai.Client(
-            api_key=api_key,
-            http_options={"timeout": 60_000},
-        )
+        self.api_key = api_key
         self.model_name = model
 
         # Disable thinking for 2.5+ models — saves tokens on free tier
@@ -351,6 +440,16 @@ class GeminiFreeAPI(TranslationAPI):
         if "2.5" in model or "2.6" in model:
             self._no_think = {"thinking_config": {"thinking_budget": 0}}
 
+    @cached_property
+    def client(self):
+        from google import genai
+
+        return genai.Client(
+            api_key=self.api_key,
+            http_options={"timeout": 60_000},
+        )
+
+    @cached
     @retry_on_rate_limit
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Traduz texto usando Gemini."""
@@ -368,19 +467,18 @@ class GeminiFreeAPI(TranslationAPI):
         )
         return response.text.strip()
 
+    @cached_batch
     def translate_batch(
         self, texts: list[str], source_lang: str, target_lang: str
     ) -> list[str]:
         """Gemini Free has strict rate limits (15 RPM) — use sub-batches."""
-        import time as _time
-
         if len(texts) == 1:
             return [self.translate(texts[0], source_lang, target_lang)]
         sub_batch_size = 15
         results: list[str] = []
         for start in range(0, len(texts), sub_batch_size):
             if start > 0:
-                _time.sleep(self.batch_delay)
+                self.throttle()
             chunk = texts[start : start + sub_batch_size]
             results.extend(self._do_batch(chunk, source_lang, target_lang))
         return results
@@ -416,6 +514,7 @@ class GeminiFreeAPI(TranslationAPI):
                 parts = parts[: len(texts)]
         return parts
 
+    @cache_connection_test
     def test_connection(self) -> bool:
         """Test Gemini connection with actual generation."""
         try:
@@ -439,7 +538,7 @@ class GeminiFreeAPI(TranslationAPI):
         return "Gemini Free (1k req/dia)"
 
 
-class OpenRouterAPI(TranslationAPI):
+class OpenRouterAPI(OpenAICompatibleAPI):
     """
     OpenRouter - 18 modelos gratuitos.
     Limite: Varia por modelo (muitos ilimitados)
@@ -448,125 +547,20 @@ class OpenRouterAPI(TranslationAPI):
     """
 
     batch_delay = 2.0  # Conservative for varied free model limits
-
-    def __init__(
-        self, api_key: str, model: str = "meta-llama/llama-3.1-8b-instruct:free"
-    ):
-        self.api_key = api_key
-        self.model = model
-        self.session = requests.Session()
-        self.base_url = "https://openrouter.ai/api/v1"
-
-    @retry_on_rate_limit
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Traduz texto usando OpenRouter."""
-        system_prompt = build_translation_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "HTTP-Referer": "https://github.com/translation-automator",
-                "X-Title": "Translation Automator",
-            },
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 512,
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"].strip()
-
-    def translate_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        """Sub-batch of 8 for free models (varied RPM limits)."""
-        import time as _time
-
-        if len(texts) == 1:
-            return [self.translate(texts[0], source_lang, target_lang)]
-        sub_batch_size = 8
-        results: list[str] = []
-        for start in range(0, len(texts), sub_batch_size):
-            if start > 0:
-                _time.sleep(self.batch_delay)
-            chunk = texts[start : start + sub_batch_size]
-            results.extend(self._do_batch(chunk, source_lang, target_lang))
-        return results
-
-    @retry_on_rate_limit
-    def _do_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        system_prompt = build_batch_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        user_msg = "|||NEXT|||".join(prepare_batch_texts(texts))
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "HTTP-Referer": "https://github.com/translation-automator",
-                "X-Title": "Translation Automator",
-            },
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_msg},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 2048,
-            },
-            timeout=60,
-        )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"].strip()
-        parts = restore_batch_texts(clean_batch_parts(content))
-        if len(parts) != len(texts):
-            log.warning(
-                "OpenRouter batch mismatch: expected %d, got %d. Translating remaining individually.",
-                len(texts),
-                len(parts),
-            )
-            if len(parts) < len(texts):
-                for t in texts[len(parts):]:
-                    parts.append(self.translate(t, source_lang, target_lang))
-            else:
-                parts = parts[: len(texts)]
-        return parts
-
-    def test_connection(self) -> bool:
-        """Testa conexão com OpenRouter."""
-        try:
-            response = self.session.get(
-                f"{self.base_url}/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=10,
-            )
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            raise ConnectionError(f"OpenRouter: {e}") from e
-
-    def get_name(self) -> str:
-        return "OpenRouter (18 modelos grátis)"
+    MAX_CONCURRENCY = 5
+
+    BASE_URL = "https://openrouter.ai/api/v1"
+    DEFAULT_MODEL = "meta-llama/llama-3.1-8b-instruct:free"
+    NAME = "OpenRouter (18 modelos grátis)"
+    LABEL = "OpenRouter"
+    SUB_BATCH_SIZE = 8  # Free models have varied RPM limits
+    EXTRA_HEADERS = {
+        "HTTP-Referer": "https://github.com/translation-automator",
+        "X-Title": "Translation Automator",
+    }
 
 
-class MistralFreeAPI(TranslationAPI):
+class MistralFreeAPI(OpenAICompatibleAPI):
     """
     Mistral - Tier "Experiment" gratuito.
     Limite: Generoso para teste
@@ -575,109 +569,10 @@ class MistralFreeAPI(TranslationAPI):
     """
 
     batch_delay = 2.0  # Conservative for free tier
+    MAX_CONCURRENCY = 5
 
-    def __init__(self, api_key: str, model: str = "mistral-small-latest"):
-        self.api_key = api_key
-        self.model = model
-        self.session = requests.Session()
-        self.base_url = "https://api.mistral.ai/v1"
-
-    @retry_on_rate_limit
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Traduz texto usando Mistral."""
-        system_prompt = build_translation_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 512,
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"].strip()
-
-    def translate_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        """Sub-batch of 10 for Mistral free tier."""
-        import time as _time
-
-        if len(texts) == 1:
-            return [self.translate(texts[0], source_lang, target_lang)]
-        sub_batch_size = 10
-        results: list[str] = []
-        for start in range(0, len(texts), sub_batch_size):
-            if start > 0:
-                _time.sleep(self.batch_delay)
-            chunk = texts[start : start + sub_batch_size]
-            results.extend(self._do_batch(chunk, source_lang, target_lang))
-        return results
-
-    @retry_on_rate_limit
-    def _do_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        system_prompt = build_batch_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        user_msg = "|||NEXT|||".join(prepare_batch_texts(texts))
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_msg},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 2048,
-            },
-            timeout=60,
-        )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"].strip()
-        parts = restore_batch_texts(clean_batch_parts(content))
-        if len(parts) != len(texts):
-            log.warning(
-                "Mistral batch mismatch: expected %d, got %d. Translating remaining individually.",
-                len(texts),
-                len(parts),
-            )
-            if len(parts) < len(texts):
-                for t in texts[len(parts):]:
-                    parts.append(self.translate(t, source_lang, target_lang))
-            else:
-                parts = parts[: len(texts)]
-        return parts
-
-    def test_connection(self) -> bool:
-        """Testa conexão com Mistral."""
-        try:
-            response = self.session.get(
-                f"{self.base_url}/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=10,
-            )
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            raise ConnectionError(f"Mistral: {e}") from e
-
-    def get_name(self) -> str:
-        return "Mistral Free"
+    BASE_URL = "https://api.mistral.ai/v1"
+    DEFAULT_MODEL = "mistral-small-latest"
+    NAME = "Mistral Free"
+    LABEL = "Mistral"
+    SUB_BATCH_SIZE = 10
@@ -1,41 +1,76 @@
 """Implementações de APIs de tradução pagas."""
 
 import logging
+from functools import cached_property, lru_cache
+from typing import Iterator, Optional
 
-import requests
-
+from api._cache import cached, cached_batch
+from api._http import json_dumps, json_loads
+from api._openai_compat import OpenAICompatibleAPI
 from api.base import (
     TranslationAPI,
     build_batch_prompt,
     build_translation_prompt,
+    cache_connection_test,
     clean_batch_parts,
     prepare_batch_texts,
     restore_batch_texts,
     retry_on_rate_limit,
+    sdk_available,
 )
 
+__all__ = ["OpenAIAPI", "GeminiAPI", "GrokAPI", "DeepSeekAPI"]
+
 log = logging.getLogger(__name__)
 
 # Maximum strings per batch call (keep token usage under control)
 _BATCH_SIZE = 15
 
 
+@lru_cache(maxsize=1)
+def _shared_http_client():
+    """httpx client shared by every OpenAI-SDK provider.
+
+    Negotiates HTTP/2 when the optional 'h2' package is installed, so
+    concurrent requests are multiplexed over one TLS connection.
+    """
+    import httpx
+    from openai import DefaultHttpxClient
+
+    return DefaultHttpxClient(
+        http2=sdk_available("h2"),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+
 class OpenAIAPI(TranslationAPI):
     """API paga do OpenAI (GPT-4, GPT-4o-mini, etc)."""
 
+    MAX_CONCURRENCY = 20
+
     # GPT-4o-mini pricing (USD per 1M tokens)
     _token_pricing = (0.15, 0.60)
 
     def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        try:
-            from openai import OpenAI
-        except ImportError:
+        # Fail fast without paying the SDK import until the first request
+        if not sdk_available("openai"):
             raise ImportError("Install openai: pip install openai")
 
-        self.client = OpenAI(api_key=api_key, timeout=60.0, max_retries=0)
+        self.api_key = api_key
         self.model = model
         self._reset_usage()
 
+    @cached_property
+    def client(self):
+        from openai import OpenAI
+
+        return OpenAI(
+            api_key=self.api_key,
+            timeout=60.0,
+            max_retries=0,
+            http_client=_shared_http_client(),
+        )
+
     def _track_openai_response(self, response) -> None:
         """Extract and track token usage from an OpenAI response."""
         usage = getattr(response, "usage", None)
@@ -45,6 +80,7 @@ class OpenAIAPI(TranslationAPI):
                 usage.completion_tokens or 0,
             )
 
+    @cached
     @retry_on_rate_limit
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Traduz texto usando OpenAI."""
@@ -67,6 +103,31 @@ class OpenAIAPI(TranslationAPI):
         content = response.choices[0].message.content
         return content.strip() if content else ""
 
+    def translate_stream(
+        self, text: str, source_lang: str, target_lang: str
+    ) -> Iterator[str]:
+        """Stream the translation from OpenAI token by token."""
+        system_prompt = build_translation_prompt(
+            source_lang,
+            target_lang,
+            getattr(self, "_app_name", ""),
+            getattr(self, "_context_entries", None),
+        )
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            temperature=0.3,
+            max_tokens=512,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    @cached_batch
     def translate_batch(
         self, texts: list[str], source_lang: str, target_lang: str
     ) -> list[str]:
@@ -116,6 +177,87 @@ class OpenAIAPI(TranslationAPI):
                 parts = parts[: len(texts)]
         return parts
 
+    def submit_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> str:
+        """Queue texts on OpenAI's Batch API and return the batch id.
+
+        Batch jobs cost about half of synchronous requests but complete
+        asynchronously (within 24h), so this is meant for large initial
+        localizations. Keep the returned id and pass it to fetch_batch().
+        """
+        system_prompt = build_translation_prompt(
+            source_lang,
+            target_lang,
+            getattr(self, "_app_name", ""),
+            getattr(self, "_context_entries", None),
+        )
+        lines = [
+            json_dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": text},
+                    ],
+                    "temperature": 0.3,
+                    "max_tokens": 512,
+                },
+            })
+            for i, text in enumerate(texts)
+        ]
+        batch_file = self.client.files.create(
+            file=("langforge-batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        log.info("Submitted OpenAI batch %s (%d texts)", batch.id, len(texts))
+        return batch.id
+
+    def fetch_batch(self, batch_id: str) -> Optional[list[str]]:
+        """Collect the results of a submit_batch() job.
+
+        Returns None while the job is still running, otherwise the
+        translations in the original order ("" for items that failed).
+        Token usage is tracked at synchronous prices, so reported cost is
+        an upper bound.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"OpenAI batch {batch_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+
+        results = [""] * batch.request_counts.total
+        if not batch.output_file_id:
+            return results
+        output = self.client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = json_loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            body = response["body"]
+            usage = body.get("usage")
+            if usage:
+                self._track_usage(
+                    usage.get("prompt_tokens", 0),
+                    usage.get("completion_tokens", 0),
+                )
+            content = body["choices"][0]["message"]["content"]
+            results[int(item["custom_id"])] = content.strip() if content else ""
+        return results
+
+    @cache_connection_test
     def test_connection(self) -> bool:
         """Testa conexão com OpenAI."""
         try:
@@ -139,19 +281,15 @@ class GeminiAPI(TranslationAPI):
     """
 
     batch_delay = 0.1  # Paid tier has 2000 RPM; retry handles bursts
+    MAX_CONCURRENCY = 4
     # Gemini Flash pricing (USD per 1M tokens) — non-thinking output
     _token_pricing = (0.15, 0.60)
 
     def __init__(self, api_key: str, model: str = "gemini-2.0-flash-exp"):
-        try:
-            from google import genai
-        except ImportError:
+        if not sdk_available("google.genai"):
             raise ImportError("Install: pip install google-genai")
 
-        self.client = genai.Client(
-            api_key=api_key,
-            http_options={"timeout": 60_000},
-        )
+        self.api_key = api_key
         self.model_name = model
         self._reset_usage()
 
@@ -161,6 +299,15 @@ class GeminiAPI(TranslationAPI):
         if "2.5" in model or "2.6" in model:
             self._no_think = {"thinking_config": {"thinking_budget": 0}}
 
+    @cached_property
+    def client(self):
+        from google import genai
+
+        return genai.Client(
+            api_key=self.api_key,
+            http_options={"timeout": 60_000},
+        )
+
     def _track_gemini_response(self, response) -> None:
         """Extract and track token usage from a Gemini response."""
         meta = getattr(response, "usage_metadata", None)
@@ -170,6 +317,7 @@ class GeminiAPI(TranslationAPI):
                 meta.candidates_token_count or 0,
             )
 
+    @cached
     @retry_on_rate_limit
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Traduz texto usando Gemini."""
@@ -188,6 +336,7 @@ class GeminiAPI(TranslationAPI):
         self._track_gemini_response(response)
         return response.text.strip()
 
+    @cached_batch
     def translate_batch(
         self, texts: list[str], source_lang: str, target_lang: str
     ) -> list[str]:
@@ -196,15 +345,13 @@ class GeminiAPI(TranslationAPI):
         Sub-batches of 15 strings each with a small delay between them.
         Paid tier (2000 RPM) needs minimal delay; retry handles bursts.
         """
-        import time as _time
-
         if len(texts) == 1:
             return [self.translate(texts[0], source_lang, target_lang)]
         sub_batch_size = 15
         results: list[str] = []
         for start in range(0, len(texts), sub_batch_size):
             if start > 0:
-                _time.sleep(self.batch_delay)
+                self.throttle()
             chunk = texts[start : start + sub_batch_size]
             results.extend(self._do_batch(chunk, source_lang, target_lang))
         return results
@@ -242,6 +389,7 @@ class GeminiAPI(TranslationAPI):
                 parts = parts[: len(texts)]
         return parts
 
+    @cache_connection_test
     def test_connection(self) -> bool:
         """Test Gemini connection with actual generation."""
         try:
@@ -266,144 +414,30 @@ class GeminiAPI(TranslationAPI):
         return f"Gemini ({self.model_name})"
 
 
-class GrokAPI(TranslationAPI):
+class GrokAPI(OpenAICompatibleAPI):
     """
     xAI Grok API - $25 créditos iniciais + $150/mês.
     Contexto: 2M tokens (maior do mercado)
     """
 
+    MAX_CONCURRENCY = 5
+
     # Grok pricing (USD per 1M tokens) — grok-4-fast
     _token_pricing = (3.00, 15.00)
 
-    def __init__(self, api_key: str, model: str = "grok-4-fast"):
-        self.api_key = api_key
-        self.model = model
-        self.session = requests.Session()
-        self.base_url = "https://api.x.ai/v1"
-        self._reset_usage()
+    BASE_URL = "https://api.x.ai/v1"
+    DEFAULT_MODEL = "grok-4-fast"
+    NAME = "Grok ({model})"
+    LABEL = "Grok"
+    SUB_BATCH_SIZE = 10
 
+    def __init__(self, api_key: str, model: str = "grok-4-fast"):
+        super().__init__(api_key, model)
         # Disable reasoning for grok-3+/grok-4+ models — translation
         # doesn't need it and reasoning tokens are very expensive
-        self._extra_params: dict = {}
-        if any(tag in model for tag in ("grok-3", "grok-4")):
+        if any(tag in self.model for tag in ("grok-3", "grok-4")):
             self._extra_params["reasoning_effort"] = "none"
 
-    def _track_grok_response(self, data: dict) -> None:
-        """Extract and track token usage from a Grok JSON response."""
-        usage = data.get("usage")
-        if usage:
-            self._track_usage(
-                usage.get("prompt_tokens", 0),
-                usage.get("completion_tokens", 0),
-            )
-
-    @retry_on_rate_limit
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Traduz texto usando Grok."""
-        system_prompt = build_translation_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 512,
-                **self._extra_params,
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
-        self._track_grok_response(data)
-        return data["choices"][0]["message"]["content"].strip()
-
-    def translate_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        """Translate multiple texts using Grok with sub-batches of 10."""
-        import time as _time
-
-        if len(texts) == 1:
-            return [self.translate(texts[0], source_lang, target_lang)]
-        sub_batch_size = 10
-        results: list[str] = []
-        for start in range(0, len(texts), sub_batch_size):
-            if start > 0 and self.batch_delay > 0:
-                _time.sleep(self.batch_delay)
-            chunk = texts[start : start + sub_batch_size]
-            results.extend(self._do_batch(chunk, source_lang, target_lang))
-        return results
-
-    @retry_on_rate_limit
-    def _do_batch(
-        self, texts: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        system_prompt = build_batch_prompt(
-            source_lang,
-            target_lang,
-            getattr(self, "_app_name", ""),
-            getattr(self, "_context_entries", None),
-        )
-        user_msg = "|||NEXT|||".join(prepare_batch_texts(texts))
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_msg},
-                ],
-                "temperature": 0.3,
-                "max_tokens": 2048,
-                **self._extra_params,
-            },
-            timeout=60,
-        )
-        response.raise_for_status()
-        data = response.json()
-        self._track_grok_response(data)
-        content = data["choices"][0]["message"]["content"].strip()
-        parts = restore_batch_texts(clean_batch_parts(content))
-        if len(parts) != len(texts):
-            log.warning(
-                "Grok batch mismatch: expected %d, got %d. Translating remaining individually.",
-                len(texts),
-                len(parts),
-            )
-            if len(parts) < len(texts):
-                for t in texts[len(parts):]:
-                    parts.append(self.translate(t, source_lang, target_lang))
-            else:
-                parts = parts[: len(texts)]
-        return parts
-
-    def test_connection(self) -> bool:
-        """Testa conexão com Grok."""
-        try:
-            response = self.session.get(
-                f"{self.base_url}/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=10,
-            )
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            log.debug("Grok test error: %s", e)
-            raise ConnectionError(f"Grok: {e}") from e
-
-    def get_name(self) -> str:
-        return f"Grok ({self.model})"
-
 
 class DeepSeekAPI(TranslationAPI):
     """
@@ -412,23 +446,30 @@ class DeepSeekAPI(TranslationAPI):
     high-volume translation. Strongest on EN↔ZH; competent on PT/ES/EU langs.
     """
 
+    MAX_CONCURRENCY = 10
+
     # deepseek-chat pricing (USD per 1M tokens, cache-miss rate)
     _token_pricing = (0.27, 1.10)
 
     def __init__(self, api_key: str, model: str = "deepseek-chat"):
-        try:
-            from openai import OpenAI
-        except ImportError:
+        if not sdk_available("openai"):
             raise ImportError("Install openai: pip install openai")
 
-        self.client = OpenAI(
-            api_key=api_key,
+        self.api_key = api_key
+        self.model = model
+        self._reset_usage()
+
+    @cached_property
+    def client(self):
+        from openai import OpenAI
+
+        return OpenAI(
+            api_key=self.api_key,
             base_url="https://api.deepseek.com/v1",
             timeout=60.0,
             max_retries=0,
+            http_client=_shared_http_client(),
         )
-        self.model = model
-        self._reset_usage()
 
     def _track_deepseek_response(self, response) -> None:
         """Extract and track token usage from a DeepSeek response."""
@@ -439,6 +480,7 @@ class DeepSeekAPI(TranslationAPI):
                 usage.completion_tokens or 0,
             )
 
+    @cached
     @retry_on_rate_limit
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Traduz texto usando DeepSeek."""
@@ -461,6 +503,31 @@ class DeepSeekAPI(TranslationAPI):
         content = response.choices[0].message.content
         return content.strip() if content else ""
 
+    def translate_stream(
+        self, text: str, source_lang: str, target_lang: str
+    ) -> Iterator[str]:
+        """Stream the translation from DeepSeek token by token."""
+        system_prompt = build_translation_prompt(
+            source_lang,
+            target_lang,
+            getattr(self, "_app_name", ""),
+            getattr(self, "_context_entries", None),
+        )
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            temperature=0.3,
+            max_tokens=512,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    @cached_batch
     def translate_batch(
         self, texts: list[str], source_lang: str, target_lang: str
     ) -> list[str]:
@@ -510,6 +577,7 @@ class DeepSeekAPI(TranslationAPI):
                 parts = parts[: len(texts)]
         return parts
 
+    @cache_connection_test
     def test_connection(self) -> bool:
         """Testa conexão com DeepSeek."""
         try:
@@ -3,7 +3,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -67,6 +67,31 @@ def _lookup_secret(key_name: str) -> str:
         return ""
 
 
+# Marks dotted keys that resolve to nothing in the get() cache
+_MISSING = object()
+
+# Providers offered in the sidebar per API type, as (provider_id, label)
+_PROVIDER_LABELS = {
+    "free": (
+        ("deepl-free", "DeepL Free"),
+        ("groq", "Groq"),
+        ("gemini-free", "Gemini Free"),
+        ("openrouter", "OpenRouter"),
+        ("mistral-free", "Mistral"),
+        ("libretranslate", "LibreTranslate"),
+    ),
+    "paid": (
+        ("openai", "OpenAI"),
+        ("gemini", "Gemini"),
+        ("grok", "Grok (xAI)"),
+        ("deepseek", "DeepSeek"),
+    ),
+}
+
+# Providers that do not require an API key
+_NO_KEY_REQUIRED = frozenset({"libretranslate"})
+
+
 class Settings:
     """Gerencia as configurações persistentes do aplicativo."""
 
@@ -74,7 +99,14 @@ class Settings:
         self.config_dir = Path.home() / ".config" / "langforge"
         self.config_file = self.config_dir / "config.json"
         self._migrate_old_config()
+        # Set by setters that actually change a value, and by _load_config()
+        # when the file needs repairing; cleared by save()
+        self._dirty = False
         self.config = self._load_config()
+        # Resolved dotted keys; cleared by every setter
+        self._get_cache: Dict[str, Any] = {}
+        # get_configured_providers() results by API type; cleared with _get_cache
+        self._providers_cache: Dict[str, List[Tuple[str, str]]] = {}
 
     def _migrate_old_config(self):
         """Migrate config from old 'translation-automator' directory if needed."""
@@ -97,8 +129,10 @@ class Settings:
                     config = json.load(f)
             except Exception:
                 config = self._get_default_config()
+                self._dirty = True  # rewrite the unreadable file
         else:
             config = self._get_default_config()
+            self._dirty = True
         # Recover API keys from keyring if not in file
         for section in ("free_api", "paid_api"):
             keys = config.get(section, {}).get("keys", {})
@@ -109,6 +143,7 @@ class Settings:
                     secret = _lookup_secret(f"{section}_api_key")
                     if secret:
                         config.setdefault(section, {})["api_key"] = secret
+                        self._dirty = True  # write the key back to the file
 
             # Recover per-provider keys from keyring
             for provider in list(keys.keys()):
@@ -116,6 +151,7 @@ class Settings:
                     secret = _lookup_secret(f"{section}_{provider}_key")
                     if secret:
                         keys[provider] = secret
+                        self._dirty = True
             config.setdefault(section, {})["keys"] = keys
 
         return config
@@ -129,6 +165,7 @@ class Settings:
                 "api_key": "",
                 "keys": {},  # Per-provider keys: {"groq": "key1", "deepl-free": "key2"}
                 "libretranslate_url": "https://libretranslate.com",
+                "deepl_glossary_id": "",  # Optional DeepL glossary (single language pair)
                 "model": "",
             },
             "paid_api": {
@@ -147,42 +184,83 @@ class Settings:
 
         Keys are always kept in the JSON file to prevent data loss.
         A copy is also stored in the system keyring when available.
+        Does nothing when no value changed since the last load or save and
+        the loaded file needed no repair (defaults, keys recovered from the
+        keyring), or when the file already holds the current settings.
         """
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        config_to_save = json.loads(json.dumps(self.config))
+        if not self._dirty and self.config_file.exists():
+            return
+        data = json.dumps(self.config, indent=2, ensure_ascii=False)
+        try:
+            if self.config_file.read_text(encoding="utf-8") == data:
+                self._dirty = False
+                return  # Nothing changed since the last save
+        except OSError:
+            pass
 
         # Store a copy of keys in the system keyring (best-effort)
         for section in ("free_api", "paid_api"):
-            api_key = config_to_save.get(section, {}).get("api_key", "")
+            api_key = self.config.get(section, {}).get("api_key", "")
             _store_secret(f"{section}_api_key", api_key)
 
-            keys = config_to_save.get(section, {}).get("keys", {})
+            keys = self.config.get(section, {}).get("keys", {})
             for provider, key in keys.items():
                 _store_secret(f"{section}_{provider}_key", key)
 
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config_to_save, f, indent=2, ensure_ascii=False)
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # One buffered write instead of json.dump's many small ones
+        self.config_file.write_text(data, encoding="utf-8")
+        self._dirty = False
 
     def get(self, key: str, default=None) -> Any:
         """Obtém valor de configuração."""
-        keys = key.split(".")
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self.config
+            for k in key.split("."):
+                if not isinstance(value, dict) or k not in value:
+                    value = _MISSING
+                    break
+                value = value[k]
+            self._get_cache[key] = value
+        return default if value is _MISSING else value
 
     def set(self, key: str, value: Any):
         """Define valor de configuração."""
+        if self._assign(key, value):
+            self._changed()
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Define vários valores de uma vez (chaves com pontos, como em set()).
+
+        Caches are invalidated once for the whole batch; nothing is written
+        until save().
+        """
+        changed = False
+        for key, value in values.items():
+            changed = self._assign(key, value) or changed
+        if changed:
+            self._changed()
+
+    def _assign(self, key: str, value: Any) -> bool:
+        """Store ``value`` under a dotted key; return whether it changed."""
         keys = key.split(".")
         config = self.config
         for k in keys[:-1]:
             if k not in config:
                 config[k] = {}
             config = config[k]
+        if config.get(keys[-1], _MISSING) == value:
+            return False
         config[keys[-1]] = value
+        return True
+
+    def _changed(self) -> None:
+        """Record a modification: invalidate get() and mark for saving."""
+        self._get_cache.clear()
+        self._providers_cache.clear()
+        self._dirty = True
 
     def get_api_type(self) -> str:
         """Retorna tipo de API configurada (free/paid)."""
@@ -190,7 +268,9 @@ class Settings:
 
     def set_api_type(self, api_type: str):
         """Define tipo de API (free/paid)."""
-        self.config["api_type"] = api_type
+        if self.config.get("api_type") != api_type:
+            self.config["api_type"] = api_type
+            self._changed()
 
     def get_free_provider(self) -> str:
         """Retorna provider de API gratuita."""
@@ -229,9 +309,34 @@ class Settings:
             return self.config.get(section, {}).get("api_key", "")
         return ""
 
+    def get_configured_providers(self, kind: str) -> List[Tuple[str, str]]:
+        """Return (label, provider_id) pairs usable for API type ``kind``.
+
+        Free lists providers with a key plus those that need none, so it is
+        never empty; paid lists only providers with a key. Results are
+        cached until the next change, sparing the keyring lookups made for
+        providers without a stored key.
+        """
+        try:
+            return self._providers_cache[kind]
+        except KeyError:
+            pass
+        section = f"{kind}_api"
+        providers = [
+            (label, provider)
+            for provider, label in _PROVIDER_LABELS[kind]
+            if provider in _NO_KEY_REQUIRED
+            or self.get_provider_key(section, provider)
+        ]
+        self._providers_cache[kind] = providers
+        return providers
+
     def set_provider_key(self, section: str, provider: str, key: str) -> None:
         """Set API key for a specific provider."""
-        self.config.setdefault(section, {}).setdefault("keys", {})[provider] = key
+        keys = self.config.setdefault(section, {}).setdefault("keys", {})
+        if keys.get(provider) != key:
+            keys[provider] = key
+            self._changed()
 
     def get_reference_lang(self) -> str:
         """Return the fix_context reference language ('auto' or a code like 'pt-BR')."""
@@ -239,4 +344,7 @@ class Settings:
 
     def set_reference_lang(self, lang: str) -> None:
         """Set the fix_context reference language."""
-        self.config.setdefault("fix_context", {})["reference_lang"] = lang
+        fix_context = self.config.setdefault("fix_context", {})
+        if fix_context.get("reference_lang") != lang:
+            fix_context["reference_lang"] = lang
+            self._changed()
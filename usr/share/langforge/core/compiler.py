@@ -1,8 +1,20 @@
 """Compilador de arquivos .po para .mo."""
 
+import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Callable
+from typing import Callable, Collection, Dict, Optional
+
+import polib
+
+
+@lru_cache(maxsize=1)
+def _msgfmt_path() -> Optional[str]:
+    """Resolve msgfmt once instead of searching PATH on every spawn."""
+    return shutil.which("msgfmt")
 
 
 class MoCompiler:
@@ -23,36 +35,49 @@ class MoCompiler:
         return self.project_path / "locale"
 
     def compile_all(
-        self, progress_callback: Optional[Callable[[str, str, int, int], None]] = None
+        self,
+        progress_callback: Optional[Callable[[str, str, int, int], None]] = None,
+        skip: Collection[str] = (),
     ) -> Dict[str, bool]:
         """
         Compila todos os arquivos .po para .mo.
 
         Args:
             progress_callback: Callback(lang, status, current, total)
+            skip: Nomes de .po (sem extensão) já compilados nesta execução
 
         Returns:
             Dict com resultado de cada idioma {lang: success}
         """
         results = {}
-        po_files = list(self.locale_dir.glob("*.po"))
+        po_files = [p for p in self.locale_dir.glob("*.po") if p.stem not in skip]
         total = len(po_files)
+        if not po_files:
+            return results
         current = 0
 
-        for po_file in po_files:
-            lang = po_file.stem
-            current += 1
-
-            try:
-                self.compile_language(lang)
-                results[lang] = True
-
-                if progress_callback:
-                    progress_callback(lang, "compiled", current, total)
-            except Exception as e:
-                results[lang] = False
-                if progress_callback:
-                    progress_callback(lang, f"error: {e}", current, total)
+        # Each msgfmt runs in its own process; threads just wait on them
+        with ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, total), thread_name_prefix="msgfmt"
+        ) as pool:
+            futures = {
+                pool.submit(self.compile_language, po_file.stem): po_file.stem
+                for po_file in po_files
+            }
+            for future in as_completed(futures):
+                lang = futures[future]
+                current += 1
+
+                try:
+                    future.result()
+                    results[lang] = True
+
+                    if progress_callback:
+                        progress_callback(lang, "compiled", current, total)
+                except Exception as e:
+                    results[lang] = False
+                    if progress_callback:
+                        progress_callback(lang, f"error: {e}", current, total)
 
         return results
 
@@ -80,31 +105,44 @@ class MoCompiler:
         # Cria diretórios
         mo_dir.mkdir(parents=True, exist_ok=True)
 
-        # Compila com msgfmt
-        try:
-            subprocess.run(
-                ["msgfmt", str(po_file), "-o", str(mo_file)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Erro ao compilar {lang}: {e.stderr}")
-        except FileNotFoundError:
-            raise RuntimeError("msgfmt não encontrado. Instale o pacote gettext.")
+        msgfmt = _msgfmt_path()
+        if msgfmt is None:
+            # Sem gettext instalado: compila em processo com o polib
+            try:
+                polib.pofile(str(po_file)).save_as_mofile(str(mo_file))
+            except (OSError, ValueError) as e:
+                raise RuntimeError(f"Erro ao compilar {lang}: {e}")
+            return
+
+        # Compila com msgfmt; stdout is unused and stderr is only decoded
+        # on failure. close_fds stays at its default: with several compiles
+        # running at once, inherited pipe fds would keep stderr reads open.
+        proc = subprocess.run(
+            [msgfmt, str(po_file), "-o", str(mo_file)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if proc.returncode != 0:
+            stderr = proc.stderr.decode("utf-8", "replace")
+            raise RuntimeError(f"Erro ao compilar {lang}: {stderr}")
 
     def get_compiled_languages(self) -> list[str]:
         """Retorna lista de idiomas já compilados."""
         compiled: list[str] = []
         mo_base = self.project_path / "usr" / "share" / "locale"
+        mo_name = f"{self.textdomain}.mo"
 
-        if not mo_base.exists():
+        try:
+            it = os.scandir(mo_base)
+        except OSError:
             return compiled
 
-        for lang_dir in mo_base.iterdir():
-            if lang_dir.is_dir():
-                mo_file = lang_dir / "LC_MESSAGES" / f"{self.textdomain}.mo"
-                if mo_file.exists():
-                    compiled.append(lang_dir.name)
+        with it:
+            for entry in it:
+                # is_dir() comes from the dirent; one lexists() per language
+                if entry.is_dir() and os.path.lexists(
+                    os.path.join(entry.path, "LC_MESSAGES", mo_name)
+                ):
+                    compiled.append(entry.name)
 
         return compiled
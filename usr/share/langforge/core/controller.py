@@ -3,17 +3,16 @@
 import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
 from api.base import TranslationAPI
 from api.factory import APIFactory
 from config.settings import Settings
-from core.compiler import MoCompiler
-from core.extractor import GettextExtractor
 from core.file_translator import FileTranslator, is_supported_file
+from core.languages import resolve_po_path
 from core.scanner import ProjectScanner
-from core.translator import TranslationEngine
 from utils.i18n import _
 
 log = logging.getLogger(__name__)
@@ -32,6 +31,15 @@ class TranslationController:
         self._cancel_event = threading.Event()
         self._api_client: Optional[TranslationAPI] = None
         self._last_usage: dict = {}
+        # One reusable worker for every run; runs never overlap
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="langforge-translate"
+        )
+        self._future: Optional[Future] = None
+        # Disk-bound side work (.mo compilation) overlapped with translation
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="langforge-io"
+        )
 
     def _capture_usage(self) -> None:
         """Snapshot API usage stats into _last_usage and log if paid."""
@@ -120,31 +128,31 @@ class TranslationController:
         compile_mo: bool = True,
         force_retranslate: bool = False,
         on_detail: Optional[Callable[[str, list[tuple[str, str, str]]], None]] = None,
+        on_compile_progress: Optional[Callable[[int, int], None]] = None,
     ) -> None:
-        """Run the full project pipeline in a background thread.
+        """Run the full project pipeline on the worker thread.
 
         Callbacks are invoked **from the worker thread** — the caller
         is responsible for marshalling to the UI thread (GLib.idle_add).
+        on_compile_progress(current, total) counts the .mo files compiled
+        after translation, which are not tied to a selected language.
         """
         self.is_translating = True
         self._cancel_event.clear()
 
-        thread = threading.Thread(
-            target=self._run,
-            args=(
-                project_path,
-                languages,
-                on_phase,
-                on_lang_progress,
-                on_complete,
-                on_error,
-                compile_mo,
-                force_retranslate,
-                on_detail,
-            ),
-            daemon=True,
+        self._future = self._executor.submit(
+            self._run,
+            project_path,
+            languages,
+            on_phase,
+            on_lang_progress,
+            on_complete,
+            on_error,
+            compile_mo,
+            force_retranslate,
+            on_detail,
+            on_compile_progress,
         )
-        thread.start()
 
     def start_file(
         self,
@@ -157,29 +165,34 @@ class TranslationController:
         on_error: Callable[[Exception], None],
         on_detail: Optional[Callable[[str, list[tuple[str, str, str]]], None]] = None,
     ) -> None:
-        """Run file translation in a background thread."""
+        """Run file translation on the worker thread."""
         self.is_translating = True
         self._cancel_event.clear()
 
-        thread = threading.Thread(
-            target=self._run_file,
-            args=(
-                file_path,
-                languages,
-                on_phase,
-                on_lang_progress,
-                on_complete,
-                on_error,
-                on_detail,
-            ),
-            daemon=True,
+        self._future = self._executor.submit(
+            self._run_file,
+            file_path,
+            languages,
+            on_phase,
+            on_lang_progress,
+            on_complete,
+            on_error,
+            on_detail,
         )
-        thread.start()
 
     def cancel(self) -> None:
         """Signal the worker thread to stop at the next safe point."""
         self._cancel_event.set()
 
+    def shutdown(self) -> None:
+        """Cancel any run and release the worker (call when the window closes).
+
+        Does not block: the running job stops at its next cancellation check.
+        """
+        self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
     @property
     def cancelled(self) -> bool:
         return self._cancel_event.is_set()
@@ -197,7 +210,14 @@ class TranslationController:
         compile_mo: bool,
         force_retranslate: bool,
         on_detail: Optional[Callable] = None,
+        on_compile_progress: Optional[Callable[[int, int], None]] = None,
     ) -> None:
+        # Pipeline stages are imported here rather than at module level, so
+        # opening the window does not load them before the first run
+        from core.compiler import MoCompiler
+        from core.extractor import GettextExtractor
+        from core.translator import TranslationEngine
+
         try:
             on_phase("extracting")
 
@@ -213,6 +233,23 @@ class TranslationController:
             translator = TranslationEngine(self._api_client, textdomain)
             start_time = time.monotonic()
 
+            # Compile each language's .mo as soon as its .po is final,
+            # while the remaining languages are still being translated
+            compiler = MoCompiler(project_path, textdomain) if compile_mo else None
+            compiling: dict[str, Future] = {}
+
+            if compiler is None:
+                progress = on_lang_progress
+            else:
+
+                def progress(lang, status, current, total):
+                    on_lang_progress(lang, status, current, total)
+                    if status.startswith("success"):
+                        stem = resolve_po_path(compiler.locale_dir, lang).stem
+                        compiling[stem] = self._io_pool.submit(
+                            compiler.compile_language, stem
+                        )
+
             if force_retranslate:
                 # Smart context fix: detect changed translations in a reference
                 # language, then fix only those entries in all languages
@@ -223,7 +260,7 @@ class TranslationController:
                     extractor.pot_file,
                     project_path,
                     reference_lang=ref_lang,
-                    progress_callback=on_lang_progress,
+                    progress_callback=progress,
                     cancel_event=self._cancel_event,
                     languages=languages,
                     detail_callback=on_detail,
@@ -232,7 +269,7 @@ class TranslationController:
                 results = translator.translate_project(
                     extractor.pot_file,
                     project_path,
-                    on_lang_progress,
+                    progress,
                     cancel_event=self._cancel_event,
                     languages=languages,
                     detail_callback=on_detail,
@@ -240,10 +277,24 @@ class TranslationController:
 
             elapsed = time.monotonic() - start_time
 
-            if compile_mo and not self._cancel_event.is_set():
+            if compiler is not None and not self._cancel_event.is_set():
                 on_phase("compiling")
-                compiler = MoCompiler(project_path, textdomain)
-                compiler.compile_all()
+                done = set()
+                for stem, future in compiling.items():
+                    try:
+                        future.result()
+                        done.add(stem)
+                    except Exception as e:
+                        log.warning("Compiling %s failed: %s", stem, e)
+
+                def compile_progress(stem, status, current, total):
+                    if status != "compiled":
+                        log.warning("Compiling %s failed: %s", stem, status)
+                    if on_compile_progress:
+                        on_compile_progress(current, total)
+
+                # Other .po files in the project (not part of this run)
+                compiler.compile_all(compile_progress, skip=done)
 
             # Capture usage BEFORE on_complete so the UI callback can read it
             self._capture_usage()
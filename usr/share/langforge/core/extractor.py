@@ -3,7 +3,7 @@
 import logging
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 import polib
 
 log = logging.getLogger(__name__)
@@ -67,6 +67,8 @@ class GettextExtractor:
         self.textdomain = textdomain
         self.locale_dir = self._find_locale_dir()
         self.pot_file = self.locale_dir / f"{textdomain}.pot"
+        # ((mtime_ns, size), msgids) of the last parsed .pot
+        self._cached_strings: Optional[Tuple[Tuple[int, int], List[str]]] = None
 
     def _find_locale_dir(self) -> Path:
         """Find locale dir containing .pot/.po files, fallback to <root>/locale."""
@@ -205,14 +207,23 @@ class GettextExtractor:
         Returns:
             Lista de strings extraídas
         """
-        if not self.pot_file.exists():
+        try:
+            st = self.pot_file.stat()
+        except FileNotFoundError:
             return []
 
+        # Re-parse only when the .pot changed since the last call
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._cached_strings is not None and self._cached_strings[0] == stamp:
+            return list(self._cached_strings[1])
+
         try:
             pot = polib.pofile(str(self.pot_file))
-            return [entry.msgid for entry in pot if entry.msgid]
+            strings = [entry.msgid for entry in pot if entry.msgid]
         except Exception as e:
             raise RuntimeError(f"Erro ao ler .pot: {e}")
+        self._cached_strings = (stamp, strings)
+        return list(strings)
 
     def get_string_count(self) -> int:
         """Retorna número de strings extraídas."""
@@ -32,6 +32,9 @@ SUPPORTED_LANGUAGES = {
     "zh": "Chinese",
 }
 
+# Códigos suportados, na ordem de SUPPORTED_LANGUAGES (calculado uma vez)
+LANG_CODES = tuple(SUPPORTED_LANGUAGES)
+
 # Mapeamento de códigos de idioma para LibreTranslate/APIs
 LANGUAGE_CODE_MAP = {
     "pt-BR": "pt",  # LibreTranslate usa 'pt' para português
@@ -1,8 +1,11 @@
 """Module for scanning projects and detecting gettext usage."""
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # Source file extensions to scan for gettext usage
 _SOURCE_EXTENSIONS = {
@@ -24,42 +27,51 @@ _SOURCE_EXTENSIONS = {
     ".bash",  # Shell scripts
 }
 
-# Patterns that indicate gettext usage across different languages
-_GETTEXT_PATTERNS = [
-    # Python
-    re.compile(r"import\s+gettext"),
-    re.compile(r"from\s+gettext\s+import"),
-    # JavaScript / GNOME Shell extensions
-    re.compile(r"gettext\s+as\s+_"),
-    re.compile(r"imports\.gettext"),
-    re.compile(r"Gettext\.gettext"),
-    re.compile(r"GLib\.dgettext"),
-    # C / Vala
-    re.compile(r'#\s*include\s+[<"].*gettext\.h[>"]'),
-    re.compile(r"\b[dn]?gettext\s*\("),
-    re.compile(r"\bN?_\s*\("),
-    # Shell
-    re.compile(r"\$\(\s*gettext\b"),
-    re.compile(r"eval_gettext"),
-    # Generic _() usage (common across all)
-    re.compile(r'_\s*\(\s*["\']'),
-]
+# Patterns that indicate gettext usage across different languages,
+# combined into one alternation so each file is searched only once.
+# All patterns are bytes: files are scanned without decoding them
+_GETTEXT_RE = re.compile(
+    b"|".join(
+        [
+            # Python
+            rb"import\s+gettext",
+            rb"from\s+gettext\s+import",
+            # JavaScript / GNOME Shell extensions
+            rb"gettext\s+as\s+_",
+            rb"imports\.gettext",
+            rb"Gettext\.gettext",
+            rb"GLib\.dgettext",
+            # C / Vala
+            rb'#\s*include\s+[<"].*gettext\.h[>"]',
+            rb"\b[dn]?gettext\s*\(",
+            rb"\bN?_\s*\(",
+            # Shell
+            rb"\$\(\s*gettext\b",
+            rb"eval_gettext",
+            # Generic _() usage (common across all)
+            rb'_\s*\(\s*["\']',
+        ]
+    )
+)
 
 # Patterns for detecting textdomain declarations across languages
 _TEXTDOMAIN_PATTERNS = [
     # Python: gettext.textdomain("name")
-    re.compile(r'gettext\.textdomain\s*\(\s*["\']([^"\']+)["\']\s*\)'),
+    re.compile(rb'gettext\.textdomain\s*\(\s*["\']([^"\']+)["\']\s*\)'),
     # C/Vala: textdomain("name") or GETTEXT_PACKAGE
-    re.compile(r'textdomain\s*\(\s*["\']([^"\']+)["\']\s*\)'),
-    re.compile(r'GETTEXT_PACKAGE\s*=\s*["\']([^"\']+)["\']'),
+    re.compile(rb'textdomain\s*\(\s*["\']([^"\']+)["\']\s*\)'),
+    re.compile(rb'GETTEXT_PACKAGE\s*=\s*["\']([^"\']+)["\']'),
     # JavaScript: Extension metadata or GLib.textdomain
-    re.compile(r'textdomain\s*[=:]\s*["\']([^"\']+)["\']'),
+    re.compile(rb'textdomain\s*[=:]\s*["\']([^"\']+)["\']'),
     # Meson build: i18n definition
-    re.compile(r"i18n\.gettext\s*\(\s*'([^']+)'"),
+    re.compile(rb"i18n\.gettext\s*\(\s*'([^']+)'"),
     # Shell: TEXTDOMAIN=name
-    re.compile(r'TEXTDOMAIN\s*=\s*["\']?([^\s"\']+)'),
+    re.compile(rb'TEXTDOMAIN\s*=\s*["\']?([^\s"\']+)'),
 ]
 
+# Translatable string literals: _("text") / _('text')
+_STRING_CALL_RE = re.compile(rb'_\s*\(\s*["\']([^"\']+)["\']\s*\)')
+
 
 # Directories to skip during source file scanning
 _SKIP_DIRS = {
@@ -68,45 +80,124 @@ _SKIP_DIRS = {
 }
 
 
+def _scan_file(path: Path) -> Tuple[Optional[str], bool, int]:
+    """Return (textdomain, uses gettext, string count) for one source file."""
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None, False, 0
+    textdomain = None
+    if path.name != "scanner.py":
+        for pattern in _TEXTDOMAIN_PATTERNS:
+            match = pattern.search(content)
+            if match:
+                textdomain = match.group(1).decode("utf-8", "replace")
+                break
+    uses_gettext = _GETTEXT_RE.search(content) is not None
+    return textdomain, uses_gettext, len(_STRING_CALL_RE.findall(content))
+
+
+@dataclass
+class ScanResult:
+    """Gettext signals collected from the project's source files."""
+
+    textdomain: Optional[str] = None
+    uses_gettext: bool = False
+    string_count: int = 0
+
+
 class ProjectScanner:
     """Project scanner with multi-language gettext detection."""
 
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
+        # Files by suffix, filled by the first _walk()
+        self._files: Optional[Dict[str, List[Path]]] = None
+        self._scan_result: Optional[ScanResult] = None
 
-    def _is_excluded(self, path: Path) -> bool:
-        """Check if path is inside a build/cache directory."""
-        return bool(_SKIP_DIRS & set(path.parts))
+    def _walk(self) -> Dict[str, List[Path]]:
+        """Walk the project once and group files by suffix.
 
-    def find_source_files(self) -> List[Path]:
-        """Find all source files that could use gettext."""
+        Source files under _SKIP_DIRS are ignored, but .pot/.po files are
+        collected everywhere (a template may live in build/ or dist/).
+        Uses os.scandir so directory/file checks come from the dirent
+        instead of a stat() per entry; the result is cached on the instance.
+        """
+        if self._files is not None:
+            return self._files
         if not self.project_path.exists():
             raise FileNotFoundError(f"Directory not found: {self.project_path}")
 
-        files = []
-        for ext in _SOURCE_EXTENSIONS:
-            for f in self.project_path.rglob(f"*{ext}"):
-                if not self._is_excluded(f.relative_to(self.project_path)):
-                    files.append(f)
+        catalogs = {".pot", ".po"}
+        wanted = _SOURCE_EXTENSIONS | catalogs
+        files: Dict[str, List[Path]] = {suffix: [] for suffix in wanted}
+        # (directory, inside a skipped dir: only catalogs are collected)
+        stack = [(str(self.project_path), False)]
+        while stack:
+            path, skipped = stack.pop()
+            try:
+                it = os.scandir(path)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, skipped or entry.name in _SKIP_DIRS))
+                        continue
+                    suffix = os.path.splitext(entry.name)[1]
+                    if suffix in (catalogs if skipped else wanted):
+                        files[suffix].append(Path(entry.path))
+        for paths in files.values():
+            paths.sort()
+        self._files = files
         return files
 
+    def find_source_files(self) -> List[Path]:
+        """Find all source files that could use gettext."""
+        files = self._walk()
+        return [f for ext in sorted(_SOURCE_EXTENSIONS) for f in files[ext]]
+
     def find_python_files(self) -> List[Path]:
         """Find all .py files recursively (kept for compatibility)."""
-        if not self.project_path.exists():
-            raise FileNotFoundError(f"Directory not found: {self.project_path}")
-        return list(self.project_path.rglob("*.py"))
+        return list(self._walk()[".py"])
 
     def _find_pot_files(self) -> List[Path]:
         """Find valid .pot template files in the project."""
         return [
             p
-            for p in self.project_path.rglob("*.pot")
+            for p in self._walk()[".pot"]
             if p.stem and p.stem != "." and not p.stem.startswith(".")
         ]
 
     def _find_po_files(self) -> List[Path]:
         """Find .po translation files in the project."""
-        return list(self.project_path.rglob("*.po"))
+        return list(self._walk()[".po"])
+
+    def scan(self) -> ScanResult:
+        """Read every source file once and collect all gettext signals.
+
+        The result is cached, so detect_textdomain(), validate_project() and
+        count_translatable_strings() share a single pass over the files.
+        """
+        if self._scan_result is not None:
+            return self._scan_result
+
+        files = self.find_source_files()
+        result = ScanResult()
+        # Files are independent: overlap reads and regex work across threads.
+        # map() keeps file order, so the first textdomain found stays stable.
+        with ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, max(len(files), 1)),
+            thread_name_prefix="scan",
+        ) as pool:
+            for textdomain, uses_gettext, count in pool.map(_scan_file, files):
+                if result.textdomain is None:
+                    result.textdomain = textdomain
+                result.uses_gettext = result.uses_gettext or uses_gettext
+                result.string_count += count
+
+        self._scan_result = result
+        return result
 
     def detect_textdomain(self) -> str:
         """Detect the project's textdomain name.
@@ -121,21 +212,8 @@ class ProjectScanner:
         if pot_files:
             return pot_files[0].stem
 
-        # Priority 2: textdomain in source code
-        for src_file in self.find_source_files():
-            if src_file.name == "scanner.py":
-                continue
-            try:
-                content = src_file.read_text(encoding="utf-8")
-                for pattern in _TEXTDOMAIN_PATTERNS:
-                    match = pattern.search(content)
-                    if match:
-                        return match.group(1)
-            except Exception:
-                continue
-
-        # Fallback: directory name
-        return self.project_path.name
+        # Priority 2: textdomain in source code, fallback: directory name
+        return self.scan().textdomain or self.project_path.name
 
     def validate_project(self) -> bool:
         """Check if this is a valid project with gettext.
@@ -150,15 +228,7 @@ class ProjectScanner:
             return True
 
         # Check source files for gettext patterns
-        for src_file in self.find_source_files():
-            try:
-                content = src_file.read_text(encoding="utf-8")
-                if any(p.search(content) for p in _GETTEXT_PATTERNS):
-                    return True
-            except Exception:
-                continue
-
-        return False
+        return self.scan().uses_gettext
 
     def count_translatable_strings(self) -> int:
         """Count approximately how many strings are translatable.
@@ -178,12 +248,4 @@ class ProjectScanner:
                 pass
 
         # Fallback: regex count across source files
-        pattern = re.compile(r'_\s*\(\s*["\']([^"\']+)["\']\s*\)')
-        count = 0
-        for src_file in self.find_source_files():
-            try:
-                content = src_file.read_text(encoding="utf-8")
-                count += len(pattern.findall(content))
-            except Exception:
-                continue
-        return count
+        return self.scan().string_count
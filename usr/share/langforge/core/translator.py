@@ -4,21 +4,32 @@ import logging
 import re
 import threading
 import polib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple, Callable, Optional
 from datetime import datetime
 
-from core.languages import SUPPORTED_LANGUAGES, resolve_po_path
+from core.languages import LANG_CODES, SUPPORTED_LANGUAGES, resolve_po_path
+from api._cache import forget
 from api.base import TranslationAPI
 
 log = logging.getLogger(__name__)
 
-# Padrões de formato Python que devem ser preservados durante a tradução
-_FORMAT_PATTERNS = [
-    re.compile(r"%\([^)]+\)[sdifcr]"),  # %(name)s, %(count)d
-    re.compile(r"%[sdifcr%]"),  # %s, %d, %i, %f, %c, %r, %%
-    re.compile(r"\{[^}]*\}"),  # {}, {0}, {name}, {count:.2f}
-]
+# Padrões de formato Python que devem ser preservados durante a tradução,
+# combinados numa única alternação para varrer o texto uma só vez
+_FORMAT_RE = re.compile(
+    r"(?P<named>%\([^)]+\)[sdifcr])"  # %(name)s, %(count)d
+    r"|(?P<percent>%[sdifcr%])"  # %s, %d, %i, %f, %c, %r, %%
+    r"|(?P<brace>\{[^}]*\})"  # {}, {0}, {name}, {count:.2f}
+)
+
+
+def _placeholders_by_kind(text: str) -> Dict[str, List[str]]:
+    """Group the placeholders in *text* by pattern name, in order."""
+    found: Dict[str, List[str]] = {"named": [], "percent": [], "brace": []}
+    for match in _FORMAT_RE.finditer(text):
+        found[match.lastgroup].append(match.group())
+    return found
 
 
 def _protect_placeholders(text: str) -> Tuple[str, List[Tuple[str, str]]]:
@@ -29,27 +40,19 @@ def _protect_placeholders(text: str) -> Tuple[str, List[Tuple[str, str]]]:
     Cada ocorrência recebe um token único, mesmo que o placeholder se repita.
     """
     tokens: List[Tuple[str, str]] = []
-
-    # Coleta todos os matches com posição (para substituir de trás para frente)
-    all_matches: List[Tuple[int, int, str]] = []
-    for pattern in _FORMAT_PATTERNS:
-        for match in pattern.finditer(text):
-            all_matches.append((match.start(), match.end(), match.group()))
-
-    # Ordena por posição (de trás para frente) para não invalidar offsets
-    all_matches.sort(key=lambda m: m[0], reverse=True)
-
-    # Atribui tokens em ordem reversa
-    counter = len(all_matches)
-    for start, end, placeholder in all_matches:
+    parts: List[str] = []
+    pos = 0
+    # Uma única passada em ordem: copia o texto entre os matches e o token
+    for counter, match in enumerate(_FORMAT_RE.finditer(text), 1):
         token = f"<x{counter}/>"
-        tokens.append((token, placeholder))
-        text = text[:start] + token + text[end:]
-        counter -= 1
-
-    # Reverte a lista para que tokens fiquem em ordem natural (x1, x2, ...)
-    tokens.reverse()
-    return text, tokens
+        tokens.append((token, match.group()))
+        parts.append(text[pos : match.start()])
+        parts.append(token)
+        pos = match.end()
+    if not tokens:
+        return text, tokens
+    parts.append(text[pos:])
+    return "".join(parts), tokens
 
 
 def _match_newlines(msgid: str, msgstr: str) -> str:
@@ -73,49 +76,51 @@ def _match_newlines(msgid: str, msgstr: str) -> str:
     return msgstr
 
 
+# Tokens <xN/> as returned by the APIs, including the corruptions LLMs
+# commonly produce: <x1 />, < x1/>, <X1/>, <x1>, &lt;x1/&gt;, [x1], </x1>
+_TOKEN_RE = re.compile(
+    r"<\s*[xX](?P<tag>\d+)\s*/?\s*>"
+    r"|&lt;\s*[xX](?P<html>\d+)\s*/?\s*&gt;"
+    r"|\[[xX](?P<bracket>\d+)\]"
+    r"|</\s*[xX]\d+\s*>"
+)
+
+
 def _restore_placeholders(text: str, tokens: List[Tuple[str, str]]) -> str:
     """Restaura placeholders originais a partir dos tokens XML.
 
     Handles common API corruptions: extra spaces, case changes,
     HTML-encoded tags, and stray residuals.
     """
-    for token, original in tokens:
-        # Extract the number from <xN/>
-        num = re.search(r"x(\d+)", token)
-        if num:
-            n = num.group(1)
-            # Try multiple corruption patterns LLMs commonly produce
-            variants = [
-                token,                          # <x1/>
-                f"<x{n} />",                    # <x1 />
-                f"< x{n}/>",                    # < x1/>
-                f"< x{n} />",                   # < x1 />
-                f"<X{n}/>",                      # <X1/>
-                f"<X{n} />",                    # <X1 />
-                f"&lt;x{n}/&gt;",               # HTML-encoded
-                f"<x{n}>",                      # Missing / (not self-closing)
-                f"[x{n}]",                      # Bracket variant
-                f"x{n}",                        # Stripped tags entirely
-            ]
-            for variant in variants:
-                if variant in text:
-                    text = text.replace(variant, original)
-                    break
-        else:
-            text = text.replace(token, original)
-    # Remove any residual XML placeholder tokens the API might have mangled
-    text = re.sub(r"</?[xX]\d+\s*/?>", "", text)
+    # "<x12/>" -> "12"
+    originals = {token[2:-2]: original for token, original in tokens}
+    restored: set[str] = set()
+
+    def _replace(match: re.Match) -> str:
+        kind = match.lastgroup
+        if kind is None:  # closing tag residual
+            return ""
+        num = match.group(kind)
+        original = originals.get(num)
+        if original is None:
+            # Unknown XML-like residuals are dropped, other text is kept
+            return "" if kind == "tag" else match.group()
+        restored.add(num)
+        return original
+
+    text = _TOKEN_RE.sub(_replace, text)
+
+    # Last resort: the API stripped the tags entirely ("x1")
+    for num in originals.keys() - restored:
+        text = re.sub(rf"\bx{num}\b", lambda _m, o=originals[num]: o, text)
     return text
 
 
 def _validate_placeholders(original: str, translated: str) -> bool:
     """Valida se todos os placeholders do original existem na tradução."""
-    for pattern in _FORMAT_PATTERNS:
-        orig_matches = sorted(pattern.findall(original))
-        trans_matches = sorted(pattern.findall(translated))
-        if orig_matches != trans_matches:
-            return False
-    return True
+    orig_matches = sorted(m.group() for m in _FORMAT_RE.finditer(original))
+    trans_matches = sorted(m.group() for m in _FORMAT_RE.finditer(translated))
+    return orig_matches == trans_matches
 
 
 def _fix_placeholders(original: str, translated: str) -> str:
@@ -127,9 +132,10 @@ def _fix_placeholders(original: str, translated: str) -> str:
     2. Placeholder with corrupted syntax (e.g. {word without closing }).
     3. Placeholder missing entirely — append it.
     """
-    for pattern in _FORMAT_PATTERNS:
-        orig_matches = pattern.findall(original)
-        trans_matches = pattern.findall(translated)
+    orig_by_kind = _placeholders_by_kind(original)
+    for kind, orig_matches in orig_by_kind.items():
+        # Earlier kinds may have edited the translation
+        trans_matches = _placeholders_by_kind(translated)[kind]
 
         if not orig_matches:
             # No placeholders in original — remove any the LLM invented
@@ -149,7 +155,7 @@ def _fix_placeholders(original: str, translated: str) -> str:
             extra = [p for p in trans_matches if p not in orig_matches]
             for p in extra:
                 translated = translated.replace(p, "", 1)
-            trans_matches = pattern.findall(translated)
+            trans_matches = _placeholders_by_kind(translated)[kind]
 
         for placeholder in orig_matches:
             if placeholder not in trans_matches:
@@ -176,15 +182,38 @@ def _is_translation_plausible(msgid: str, msgstr: str) -> bool:
         return False
 
     # If original has no format placeholders but translation does → wrong
-    orig_has_ph = any(p.search(msgid) for p in _FORMAT_PATTERNS)
-    trans_has_ph = any(p.search(msgstr) for p in _FORMAT_PATTERNS)
-    if not orig_has_ph and trans_has_ph:
+    if not _FORMAT_RE.search(msgid) and _FORMAT_RE.search(msgstr):
         log.debug("Translation has placeholders but original doesn't: '%s'", msgid[:40])
         return False
 
     return True
 
 
+def _clone_entry(entry: polib.POEntry) -> polib.POEntry:
+    """Copy a template entry so each language can edit its own.
+
+    Only the mutable containers (flags, occurrences, plural msgstrs) are
+    copied; the strings are shared, which is far cheaper than deepcopy.
+    """
+    return polib.POEntry(
+        msgid=entry.msgid,
+        msgstr=entry.msgstr,
+        msgid_plural=entry.msgid_plural,
+        msgstr_plural=dict(entry.msgstr_plural),
+        msgctxt=entry.msgctxt,
+        obsolete=entry.obsolete,
+        encoding=entry.encoding,
+        comment=entry.comment,
+        tcomment=entry.tcomment,
+        occurrences=list(entry.occurrences),
+        flags=list(entry.flags),
+        previous_msgctxt=entry.previous_msgctxt,
+        previous_msgid=entry.previous_msgid,
+        previous_msgid_plural=entry.previous_msgid_plural,
+        linenum=entry.linenum,
+    )
+
+
 def _save_context_cache(
     cache_path: Path,
     checked: set[str],
@@ -210,9 +239,23 @@ def _save_context_cache(
 class TranslationEngine:
     """Motor de tradução para projetos gettext."""
 
-    def __init__(self, api_client: TranslationAPI, textdomain: str):
+    def __init__(
+        self,
+        api_client: TranslationAPI,
+        textdomain: str,
+        max_workers: int = 8,
+        batch_size: int = 15,
+    ):
         self.api = api_client
         self.textdomain = textdomain
+        # Languages translated in parallel (capped by api.MAX_CONCURRENCY)
+        self.max_workers = max_workers
+        # msgids handed to api.translate_batch() per request
+        self.batch_size = batch_size
+        # (lang, msgid) -> msgstr produced during this engine's run
+        self._translation_cache: Dict[Tuple[str, str], str] = {}
+        # Header date shared by every .po file created in this run
+        self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M%z")
 
     def translate_project(
         self,
@@ -238,37 +281,59 @@ class TranslationEngine:
         Returns:
             Dict com resultado de cada idioma {lang: success}
         """
-        lang_list = languages if languages else list(SUPPORTED_LANGUAGES.keys())
+        lang_list = languages if languages else LANG_CODES
         results = {}
         total_langs = len(lang_list)
+        # Languages finished so far; only updated from this thread
         current = 0
+        # Parsed once and only read by the language workers
+        pot = polib.pofile(str(pot_file))
 
-        for lang_code in lang_list:
+        def _translate(lang_code: str) -> Optional[int]:
             if cancel_event and cancel_event.is_set():
-                break
-            current += 1
+                return None
 
             # Report batch-level progress within each language
-            def _batch_progress(done: int, total: int, _lc: str = lang_code) -> None:
+            def _batch_progress(done: int, total: int) -> None:
                 if progress_callback and total > 0:
-                    sub_fraction = done / total
                     progress_callback(
-                        _lc,
+                        lang_code,
                         f"translating: {done}/{total} strings",
-                        current,
+                        current + 1,
                         total_langs,
                     )
 
-            try:
-                strings_translated = self.translate_language(
-                    pot_file,
-                    lang_code,
-                    project_path,
-                    force_retranslate=force_retranslate,
-                    cancel_event=cancel_event,
-                    detail_callback=(lambda pairs, _lc=lang_code: detail_callback(_lc, pairs)) if detail_callback else None,
-                    batch_progress=_batch_progress,
-                )
+            return self.translate_language(
+                pot_file,
+                lang_code,
+                project_path,
+                force_retranslate=force_retranslate,
+                cancel_event=cancel_event,
+                detail_callback=(lambda pairs: detail_callback(lang_code, pairs)) if detail_callback else None,
+                batch_progress=_batch_progress,
+                pot=pot,
+            )
+
+        # Each language writes its own .po file, so languages are independent;
+        # the provider's MAX_CONCURRENCY bounds the parallel requests and
+        # api.throttle() keeps their combined rate within batch_delay.
+        workers = max(1, min(self.max_workers, self.api.MAX_CONCURRENCY, total_langs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as pool:
+            futures = {pool.submit(_translate, code): code for code in lang_list}
+            for future in as_completed(futures):
+                lang_code = futures[future]
+                try:
+                    strings_translated = future.result()
+                except Exception as e:
+                    current += 1
+                    results[lang_code] = False
+                    if progress_callback:
+                        progress_callback(lang_code, f"error: {e}", current, total_langs)
+                    continue
+
+                if strings_translated is None:  # cancelled before starting
+                    continue
+                current += 1
                 results[lang_code] = True
 
                 if progress_callback:
@@ -278,10 +343,6 @@ class TranslationEngine:
                         current,
                         total_langs,
                     )
-            except Exception as e:
-                results[lang_code] = False
-                if progress_callback:
-                    progress_callback(lang_code, f"error: {e}", current, total_langs)
 
         return results
 
@@ -295,6 +356,7 @@ class TranslationEngine:
         batch_progress: Optional[Callable[[int, int], None]] = None,
         cancel_event: Optional[threading.Event] = None,
         detail_callback: Optional[Callable[[List[Tuple[str, str, str]]], None]] = None,
+        pot: Optional[polib.POFile] = None,
     ) -> int:
         """
         Traduz um idioma específico.
@@ -305,16 +367,20 @@ class TranslationEngine:
             project_path: Diretório do projeto
             force_retranslate: If True, retranslate ALL entries (fix context)
             batch_progress: Optional callback(done_strings, total_strings)
+            pot: Already parsed pot_file, shared read-only between languages
 
         Returns:
             Número de strings traduzidas
         """
         # Carrega template .pot
-        pot = polib.pofile(str(pot_file))
+        if pot is None:
+            pot = polib.pofile(str(pot_file))
 
         # Provide app context to LLM-based APIs (name + sample strings)
         context_strings = [e.msgid for e in pot if e.msgid][:20]
         self.api.set_context(self.textdomain, context_strings)
+        # Forced/fix runs want fresh output, not the translation memory
+        self.api.use_cache = not (force_retranslate or fix_msgids)
 
         # Caminho do arquivo .po — derive from pot_file location.
         # Use POSIX/gettext form (pt_BR.po, not pt-BR.po) for new files;
@@ -332,8 +398,9 @@ class TranslationEngine:
             po = polib.POFile()
             po.metadata = self._create_metadata(lang)
             # Copia entries do pot
+            # Copies: the parsed pot is shared by every language
             for entry in pot:
-                po.append(entry)
+                po.append(_clone_entry(entry))
 
         if force_retranslate:
             # Retranslate ALL entries (including already translated ones)
@@ -351,19 +418,31 @@ class TranslationEngine:
                 if entry.msgid in fix_msgids and entry.msgid not in existing_ids:
                     entries_to_translate.append(entry)
 
+        # The same msgid can appear under several msgctxt values: translate it
+        # once and copy the result to the other entries afterwards.
+        memo = self._translation_cache
+        seen: set[str] = set()
+        unique_entries = []
+        followers = []
+        for entry in entries_to_translate:
+            if (lang, entry.msgid) in memo or entry.msgid in seen:
+                followers.append(entry)
+            else:
+                seen.add(entry.msgid)
+                unique_entries.append(entry)
+        entries_to_translate = unique_entries
+
         translated_count = 0
 
         # Use batch translation when available (reduces API calls dramatically)
-        batch_size = 15
+        batch_size = self.batch_size
         for batch_start in range(0, len(entries_to_translate), batch_size):
             if cancel_event and cancel_event.is_set():
                 break
 
-            # Respect API rate limits between outer batches
-            if batch_start > 0 and self.api.batch_delay > 0:
-                import time as _time
-
-                _time.sleep(self.api.batch_delay)
+            # Respect API rate limits; the slots are shared with the other
+            # languages being translated in parallel
+            self.api.throttle()
 
             batch_entries = entries_to_translate[batch_start : batch_start + batch_size]
             batch_entries = [e for e in batch_entries if e.msgid]
@@ -395,8 +474,8 @@ class TranslationEngine:
                     except Exception:
                         translations.append(None)
 
-            for entry, translation, tokens in zip(
-                batch_entries, translations, token_maps
+            for entry, translation, tokens, protected in zip(
+                batch_entries, translations, token_maps, protected_texts
             ):
                 if translation is None:
                     if "fuzzy" not in entry.flags:
@@ -415,14 +494,15 @@ class TranslationEngine:
                         "Implausible translation rejected for '%s': '%s'",
                         entry.msgid[:40], translation[:40],
                     )
-                    # Fall back to individual translation
+                    # Fall back to individual translation; the rejected
+                    # string is evicted so the provider is asked again
+                    forget(self.api, protected, "en", lang)
                     try:
-                        protected, single_tokens = _protect_placeholders(entry.msgid)
                         single_trans = self.api.translate(
                             text=protected, source_lang="en", target_lang=lang
                         )
-                        if single_tokens:
-                            single_trans = _restore_placeholders(single_trans, single_tokens)
+                        if tokens:
+                            single_trans = _restore_placeholders(single_trans, tokens)
                         translation = single_trans
                     except Exception:
                         translation = entry.msgid
@@ -433,6 +513,7 @@ class TranslationEngine:
                 if not _validate_placeholders(entry.msgid, translation):
                     translation = _fix_placeholders(entry.msgid, translation)
                     if not _validate_placeholders(entry.msgid, translation):
+                        forget(self.api, protected, "en", lang)
                         translation = entry.msgid
                         if "fuzzy" not in entry.flags:
                             entry.flags.append("fuzzy")
@@ -441,6 +522,8 @@ class TranslationEngine:
                 if _validate_placeholders(entry.msgid, entry.msgstr):
                     if "fuzzy" in entry.flags:
                         entry.flags.remove("fuzzy")
+                if "fuzzy" not in entry.flags:
+                    memo[(lang, entry.msgid)] = entry.msgstr
                 translated_count += 1
 
             # Emit detail pairs for live viewer
@@ -458,6 +541,15 @@ class TranslationEngine:
                     len(entries_to_translate),
                 )
 
+        for entry in followers:
+            msgstr = memo.get((lang, entry.msgid))
+            if msgstr is None:  # first occurrence failed or was cancelled
+                continue
+            entry.msgstr = msgstr
+            if "fuzzy" in entry.flags:
+                entry.flags.remove("fuzzy")
+            translated_count += 1
+
         # Final validation pass — catch any remaining placeholder issues
         fixed_in_validation = 0
         for entry in po:
@@ -505,6 +597,7 @@ class TranslationEngine:
         pot = polib.pofile(str(pot_file))
         context_strings = [e.msgid for e in pot if e.msgid][:20]
         self.api.set_context(self.textdomain, context_strings)
+        self.api.use_cache = False
 
         locale_dir = pot_file.parent
         ref_po_path = resolve_po_path(locale_dir, reference_lang)
@@ -555,16 +648,13 @@ class TranslationEngine:
                 )
 
             # Process in batches for efficiency
-            batch_size = 15
+            batch_size = self.batch_size
             for batch_start in range(0, len(remaining), batch_size):
                 if cancel_event and cancel_event.is_set():
                     break
 
                 # Respect API rate limits between outer batches
-                if batch_start > 0 and self.api.batch_delay > 0:
-                    import time as _time
-
-                    _time.sleep(self.api.batch_delay)
+                self.api.throttle()
 
                 batch_entries = remaining[batch_start : batch_start + batch_size]
                 batch_entries = [e for e in batch_entries if e.msgid]
@@ -655,7 +745,7 @@ class TranslationEngine:
             return {}
 
         # Phase 2: fix those entries in all other languages
-        lang_list = languages if languages else list(SUPPORTED_LANGUAGES.keys())
+        lang_list = languages if languages else LANG_CODES
         # Remove reference language (already fixed) and already-fixed langs
         other_langs = [
             lc for lc in lang_list if lc != reference_lang and lc not in fixed_langs
@@ -688,67 +778,82 @@ class TranslationEngine:
                     total_langs,
                 )
 
-        for i, lang in enumerate(other_langs):
+        # Languages finished so far; only updated from this thread
+        current = done_count
+
+        def _fix(lang: str) -> Optional[bool]:
             if cancel_event and cancel_event.is_set():
-                break
-            lang_idx = done_count + i + 1
+                return None
             log.info(
                 "fix_context phase2: translating %s (%d/%d)",
                 lang,
-                lang_idx,
+                current + 1,
                 total_langs,
             )
 
             # Sub-language progress callback for UI feedback
-            def _batch_cb(
-                done_strings: int, total_strings: int, _lang=lang, _idx=lang_idx
-            ) -> None:
+            def _batch_cb(done_strings: int, total_strings: int) -> None:
                 if progress_callback:
                     progress_callback(
-                        _lang,
+                        lang,
                         f"translating: {done_strings}/{total_strings} strings",
-                        _idx,
+                        current + 1,
                         total_langs,
                     )
 
             if progress_callback:
                 progress_callback(
-                    lang, "translating: starting...", lang_idx, total_langs
+                    lang, "translating: starting...", current + 1, total_langs
                 )
 
-            try:
-                self.translate_language(
-                    pot_file,
-                    lang,
-                    project_path,
-                    fix_msgids=changed_msgids,
-                    batch_progress=_batch_cb,
-                    cancel_event=cancel_event,
-                    detail_callback=(lambda pairs, _lc=lang: detail_callback(_lc, pairs)) if detail_callback else None,
-                )
-                results[lang] = True
-                fixed_langs.add(lang)
-                if progress_callback:
-                    progress_callback(
-                        lang,
-                        f"success: fixed {len(changed_msgids)} entries",
-                        done_count + i + 1,
-                        total_langs,
-                    )
-            except Exception as e:
-                results[lang] = False
-                if progress_callback:
-                    progress_callback(
-                        lang, f"error: {e}", done_count + i + 1, total_langs
-                    )
-
-            # Save cache periodically for resume
-            _save_context_cache(
-                cache_path, already_checked, changed_msgids, fixed_langs
+            self.translate_language(
+                pot_file,
+                lang,
+                project_path,
+                fix_msgids=changed_msgids,
+                batch_progress=_batch_cb,
+                cancel_event=cancel_event,
+                detail_callback=(lambda pairs: detail_callback(lang, pairs)) if detail_callback else None,
+                pot=pot,
             )
+            return True
+
+        # Like translate_project: languages are independent .po files, so
+        # they are fixed in parallel within the provider's MAX_CONCURRENCY,
+        # and translate_language paces their requests via api.throttle().
+        # Results, progress and the resume cache are handled on this thread.
+        workers = max(1, min(self.max_workers, self.api.MAX_CONCURRENCY, len(other_langs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fix-context") as pool:
+            futures = {pool.submit(_fix, lang): lang for lang in other_langs}
+            for future in as_completed(futures):
+                lang = futures[future]
+                try:
+                    if future.result() is None:  # cancelled before starting
+                        continue
+                except Exception as e:
+                    current += 1
+                    results[lang] = False
+                    if progress_callback:
+                        progress_callback(lang, f"error: {e}", current, total_langs)
+                else:
+                    current += 1
+                    results[lang] = True
+                    fixed_langs.add(lang)
+                    if progress_callback:
+                        progress_callback(
+                            lang,
+                            f"success: fixed {len(changed_msgids)} entries",
+                            current,
+                            total_langs,
+                        )
+
+                # Save cache periodically for resume
+                _save_context_cache(
+                    cache_path, already_checked, changed_msgids, fixed_langs
+                )
 
         # If all languages completed, remove cache
-        all_langs = set(languages if languages else SUPPORTED_LANGUAGES.keys())
+        all_langs = set(languages if languages else LANG_CODES)
         if fixed_langs | {reference_lang} >= all_langs:
             cache_path.unlink(missing_ok=True)
 
@@ -759,8 +864,8 @@ class TranslationEngine:
         return {
             "Project-Id-Version": self.textdomain,
             "Report-Msgid-Bugs-To": "",
-            "POT-Creation-Date": datetime.now().strftime("%Y-%m-%d %H:%M%z"),
-            "PO-Revision-Date": datetime.now().strftime("%Y-%m-%d %H:%M%z"),
+            "POT-Creation-Date": self._timestamp,
+            "PO-Revision-Date": self._timestamp,
             "Last-Translator": "Translation Automator <auto@translator.ai>",
             "Language-Team": f"{SUPPORTED_LANGUAGES[lang]} <{lang}@li.org>",
             "Language": lang,
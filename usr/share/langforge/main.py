@@ -1,12 +1,13 @@
 """Entry point for LangForge."""
 
 import logging
+import os
 import sys
-from pathlib import Path
 
-# Configure logging
+# Configure logging; LANGFORGE_DEBUG=1 also shows debug messages, such as
+# connection test errors, which are otherwise never formatted
 logging.basicConfig(
-    level=logging.WARNING,
+    level=logging.DEBUG if os.environ.get("LANGFORGE_DEBUG") else logging.WARNING,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     stream=sys.stderr,
 )
@@ -19,18 +20,13 @@ for _logger_name in (
 ):
     logging.getLogger(_logger_name).setLevel(logging.INFO)
 
-# Add src directory to path for imports
-src_dir = Path(__file__).parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
-
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Adw, Gio, Gtk
 
-from ui.main_window import MainWindow
+from ui.main_window import MainWindow, load_css
 from utils.i18n import _
 
 try:
@@ -55,6 +51,7 @@ class LangForgeApp(Adw.Application):
     def do_startup(self):
         """Configure menu actions and keyboard shortcuts."""
         Adw.Application.do_startup(self)
+        load_css()
 
         # Action: Settings
         settings_action = Gio.SimpleAction.new("settings", None)
@@ -4,19 +4,26 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, GLib, Gdk, Gio
+gi.require_version("PangoCairo", "1.0")
+from gi.repository import Gtk, Adw, GLib, Gdk, Gio, Pango, PangoCairo
+import cairo
+import logging
 import math
+import queue
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from config.settings import Settings
 from core.controller import TranslationController
 from core.file_translator import SUPPORTED_EXTENSIONS
-from core.languages import SUPPORTED_LANGUAGES
-from ui.settings_dialog import SettingsDialog
-from ui.translation_viewer import TranslationViewer
+from core.languages import LANG_CODES, SUPPORTED_LANGUAGES
 from utils.i18n import _
 from utils.tooltip_helper import TooltipHelper
 
+log = logging.getLogger(__name__)
+
 
 def _humanize_error(e: Exception) -> str:
     """Convert common exceptions to user-friendly messages (M5)."""
@@ -51,38 +58,155 @@ def _humanize_error(e: Exception) -> str:
     return text
 
 
+# Strings used on every progress update, translated once at import.
+# Templates keep their placeholders; .format() is applied at the call site.
+_PHASE_LABELS = {
+    "extracting": _("Extracting strings..."),
+    "translating": _("Translating..."),
+    "compiling": _("Compiling..."),
+    "checking context": _("Checking context-aware translations..."),
+}
+_RING_LABEL = _("Translation progress: {}%")
+_COMPILING_TEMPLATE = _("Compiling... {current}/{total}")
+_RESUMING_TEMPLATE = _("Resuming… {current}/{total} languages already done")
+_ETA_TEMPLATE = _("{name} ({current}/{total}) · ~{eta} remaining")
+_CANCELLED_TEMPLATE = _("{} languages translated before cancellation")
+_START_TRANSLATION = _("Start Translation")
+_TRANSLATING = _("Translating...")
+_ERROR = _("Error")
+_CANCELLED = _("Cancelled")
+_SUCCESS_TEMPLATE = _("{langs} languages translated in {time}")
+_SELECTION_TEMPLATE = _("{count} of {total} languages selected")
+# Project summary shown after every project/file load
+_PROJECT_INFO_TEMPLATE = _("{strings} strings · {langs} languages")
+_FILE_INFO_TEMPLATE = _("{items} items · {langs} languages")
+_PROJECT_LOADED_TEMPLATE = _("Project loaded: {}")
+_FILE_LOADED_TEMPLATE = _("File loaded: {}")
+# Sidebar API dropdowns, rebuilt after every settings change
+_API_TYPE_LABELS = ((_("Free"), "free"), (_("Paid"), "paid"))
+_API_TYPE_TITLE = _("API Type")
+_PROVIDER_TITLE = _("Provider")
+
+# Sub-progress in statuses like "translating: 435/582 subtitles"
+_SUB_PROGRESS_RE = re.compile(r"(\d+)/(\d+)")
+
+# Language grid item states; each one is also the item's CSS class
+_LANG_STATES = ("pending", "translating", "success", "error", "reference")
+
+# Accessible status read out by screen readers, translated once
+_STATUS_LABELS = {
+    "pending": _("pending"),
+    "translating": _("translating"),
+    "success": _("completed"),
+    "error": _("error"),
+    "reference": _("reference"),
+}
+
+# Display name lookup for progress labels, bound once
+_lang_name = SUPPORTED_LANGUAGES.get
+
+# Icon shown in a language grid item for each status
+_STATUS_ICONS = {
+    "pending": "content-loading-symbolic",
+    "translating": "emblem-synchronizing-symbolic",
+    "success": "emblem-ok-symbolic",
+    "error": "dialog-error-symbolic",
+    "reference": "starred-symbolic",
+}
+
+
+# Application stylesheet, installed on the display by the first load_css()
+_css_provider = None
+
+
+def load_css():
+    """Install the application stylesheet on the default display.
+
+    Called once from the application's startup, so opening a window does
+    not read and parse style.css again; later calls are no-ops.
+    """
+    global _css_provider
+    if _css_provider is not None:
+        return
+    css_path = Path(__file__).parent / "style.css"
+    if not css_path.exists():
+        return
+    _css_provider = Gtk.CssProvider()
+    _css_provider.load_from_path(str(css_path))
+    Gtk.StyleContext.add_provider_for_display(
+        Gdk.Display.get_default(),
+        _css_provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    )
+
+
+# Minimum time between two ProgressRing repaints (~30 Hz): the ring moves
+# in 1% steps, so faster repaints would not show anything new
+_RING_REDRAW_MS = 33
+
+# Ring geometry: stroke width, arc start (12 o'clock) and a full turn
+_RING_LINE_WIDTH = 6
+_ARC_START = -math.pi / 2
+_FULL_TURN = 2 * math.pi
+
+
 class ProgressRing(Gtk.DrawingArea):
     """Circular progress widget with accessibility support."""
 
     def __init__(self):
         super().__init__()
         self._progress = 0.0
+        self._progress_bp = 0  # progress in basis points (0..10000)
+        self._last_pct = -1  # percentage shown by the last scheduled redraw
+        self._pending = False  # a throttled redraw is already scheduled
+        # Percentage label layout on the widget's own Pango context, which
+        # GTK keeps in sync with font settings and scale; font set only once
+        self._pango_layout = self.create_pango_layout("")
+        self._pango_layout.set_font_description(Pango.FontDescription("Sans Bold 16"))
+        # (percent, width, height) the layout text and position were set for
+        self._text_key = None
+        self._text_xy = (0.0, 0.0)
+        # Pre-rendered background circle and the (size, scale, color) it fits
+        self._bg_surface = None
+        self._bg_key = None
+        # Center and radius for the current allocation, set by _on_resize
+        self._set_geometry(80, 80)
         self.set_size_request(80, 80)
         self.set_draw_func(self._draw)
+        self.connect("resize", self._on_resize)
+        self.connect("notify::scale-factor", self._on_scale_changed)
+        self.connect("unmap", self._drop_background)
         # Accessibility: announce as a progress indicator
         self.update_property(
             [Gtk.AccessibleProperty.LABEL],
             [_("Translation progress")],
         )
 
+    def _set_geometry(self, width, height):
+        self._cx, self._cy = width / 2, height / 2
+        self._radius = min(width, height) / 2 - _RING_LINE_WIDTH
+
+    def _on_resize(self, area, width, height):
+        self._set_geometry(width, height)
+
     def _draw(self, area, cr, width, height):
-        cx, cy = width / 2, height / 2
-        radius = min(width, height) / 2 - 6
-        line_width = 6
+        cx, cy = self._cx, self._cy
 
         # Query Adwaita theme colors for consistent appearance
         style = self.get_style_context()
         fg_ok, fg_color = style.lookup_color("window_fg_color")
+        win_ok, win_color = style.lookup_color("window_bg_color")
         accent_ok, accent_color = style.lookup_color("accent_bg_color")
 
-        cr.set_line_width(line_width)
         if fg_ok:
-            cr.set_source_rgba(fg_color.red, fg_color.green, fg_color.blue, 0.15)
+            bg_rgba = (fg_color.red, fg_color.green, fg_color.blue, 0.15)
         else:
-            cr.set_source_rgba(0.3, 0.3, 0.3, 0.5)
-        cr.arc(cx, cy, radius, 0, 2 * math.pi)
-        cr.stroke()
+            bg_rgba = (0.3, 0.3, 0.3, 0.5)
+        fill = (win_color.red, win_color.green, win_color.blue) if win_ok else None
+        cr.set_source_surface(self._background(width, height, bg_rgba, fill), 0, 0)
+        cr.paint()
 
+        cr.set_line_width(_RING_LINE_WIDTH)
         if self._progress > 0:
             cr.set_line_cap(1)
             if accent_ok:
@@ -91,32 +215,86 @@ class ProgressRing(Gtk.DrawingArea):
                 )
             else:
                 cr.set_source_rgba(0.35, 0.55, 0.95, 1.0)
-            start = -math.pi / 2
-            end = start + (2 * math.pi * self._progress)
-            cr.arc(cx, cy, radius, start, end)
+            end = _ARC_START + _FULL_TURN * self._progress
+            cr.arc(cx, cy, self._radius, _ARC_START, end)
             cr.stroke()
 
         if fg_ok:
             cr.set_source_rgba(fg_color.red, fg_color.green, fg_color.blue, 0.9)
         else:
             cr.set_source_rgba(1, 1, 1, 0.9)
-        cr.select_font_face("Sans", 0, 1)
-        cr.set_font_size(16)
-        text = f"{int(self._progress * 100)}%"
-        ext = cr.text_extents(text)
-        cr.move_to(cx - ext.width / 2, cy + ext.height / 3)
-        cr.show_text(text)
+        layout = self._pango_layout
+        # Redraws with the same percentage and size reuse the measured text
+        pct = self._progress_bp // 100
+        text_key = (pct, width, height)
+        if text_key != self._text_key:
+            layout.set_text(f"{pct}%", -1)
+            ink, _logical = layout.get_pixel_extents()
+            self._text_xy = (cx - ink.x - ink.width / 2, cy - ink.y - ink.height / 2)
+            self._text_key = text_key
+        cr.move_to(*self._text_xy)
+        PangoCairo.show_layout(cr, layout)
+
+    def _background(self, width, height, rgba, fill=None):
+        """Return the dim full circle, rendered once per size/scale/color.
+
+        With a known window background ``fill`` the surface is opaque RGB24,
+        which blits without alpha blending; otherwise it stays ARGB32.
+        """
+        scale = self.get_scale_factor()
+        key = (width, height, scale, rgba, fill)
+        if self._bg_key != key:
+            fmt = cairo.FORMAT_ARGB32 if fill is None else cairo.FORMAT_RGB24
+            surface = cairo.ImageSurface(fmt, width * scale, height * scale)
+            surface.set_device_scale(scale, scale)
+            cr = cairo.Context(surface)
+            if fill is not None:
+                cr.set_source_rgb(*fill)
+                cr.paint()
+            cr.set_line_width(_RING_LINE_WIDTH)
+            cr.set_source_rgba(*rgba)
+            cr.arc(self._cx, self._cy, self._radius, 0, _FULL_TURN)
+            cr.stroke()
+            self._bg_surface = surface
+            self._bg_key = key
+        return self._bg_surface
+
+    def _drop_background(self, *_args):
+        self._bg_surface = None
+        self._bg_key = None
+
+    def _on_scale_changed(self, *_args):
+        # Font metrics depend on the scale: re-measure on next draw
+        self._pango_layout.context_changed()
+        self._text_key = None
 
     def set_progress(self, value: float):
-        self._progress = max(0.0, min(1.0, value))
-        self.queue_draw()
+        # Integer basis points make repeated values cheap to detect
+        bp = max(0, min(10000, int(value * 10000)))
+        if bp == self._progress_bp:
+            return
+        self._progress_bp = bp
+        self._progress = bp / 10000.0
+        # Nothing visible changes until the shown percentage does
+        pct = bp // 100
+        if pct == self._last_pct:
+            return
+        self._last_pct = pct
+        # At most one redraw per _RING_REDRAW_MS, however fast updates arrive
+        if not self._pending:
+            self._pending = True
+            GLib.timeout_add(_RING_REDRAW_MS, self._do_draw)
         # Update accessible description so Orca announces progress changes
-        pct = int(self._progress * 100)
         self.update_property(
             [Gtk.AccessibleProperty.LABEL],
-            [_("Translation progress: {}%").format(pct)],
+            [_RING_LABEL.format(pct)],
         )
 
+    def _do_draw(self):
+        self._pending = False
+        self.queue_draw()
+        return GLib.SOURCE_REMOVE
+
 
 class MainWindow(Adw.ApplicationWindow):
     """Main window - Modern Adwaita Split View."""
@@ -130,28 +308,39 @@ class MainWindow(Adw.ApplicationWindow):
         self.selected_file = None
         self._string_count = 0
         self._mode = "project"  # "project" or "file"
+        # Worker events (progress and posted calls), applied by _drain_events
+        self._event_q: queue.Queue = queue.Queue()
+        self._draining = False
+        self._drain_source = None
+        # Grid statuses buffered by the running _drain_events, else None
+        self._pending_status = None
+        # Languages shown as translating; several at once in parallel runs
+        self._translating_langs: set[str] = set()
+        # The progress page is built by the first translation run
+        self._progress_page_built = False
+        # Language grid items by code, reused by every run
+        self._lang_items = {}
+        # Model of the sidebar API type row, built by _build_api_dropdowns
+        self._api_type_model = None
+        # Settings dialog, built on first open and hidden (not destroyed) on close
+        self._settings_dialog = None
+        self._welcome_settings_open = False
+        # Project/file validation scans the disk: keep it off the main thread
+        self._validator = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="langforge-validate"
+        )
 
         self.set_title("LangForge")
         self.set_default_size(1020, 720)
+        self.connect("close-request", self._on_close_request)
 
-        self._load_css()
         self._build_ui()
 
-    def _load_css(self):
-        css_path = Path(__file__).parent / "style.css"
-        if css_path.exists():
-            provider = Gtk.CssProvider()
-            provider.load_from_path(str(css_path))
-            Gtk.StyleContext.add_provider_for_display(
-                Gdk.Display.get_default(),
-                provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-
     def _build_ui(self):
         """Build the main UI with split view layout."""
         # Toast overlay wraps everything
         self.toast_overlay = Adw.ToastOverlay()
+        self._toast = None  # toast currently shown by _show_toast
         self.set_content(self.toast_overlay)
 
         # Split view: sidebar + content
@@ -259,7 +448,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         self._lang_checks: dict[str, Gtk.CheckButton] = {}
         saved_langs = self.settings.get(
-            "selected_languages", list(SUPPORTED_LANGUAGES.keys())
+            "selected_languages", list(LANG_CODES)
         )
 
         for code, name in SUPPORTED_LANGUAGES.items():
@@ -303,7 +492,7 @@ class MainWindow(Adw.ApplicationWindow):
         header.set_show_start_title_buttons(False)
 
         # Centered translate button as title widget
-        self.translate_button = Gtk.Button(label=_("Start Translation"))
+        self.translate_button = Gtk.Button(label=_START_TRANSLATION)
         self.translate_button.add_css_class("suggested-action")
         self.translate_button.set_sensitive(False)
         self.translate_button.connect("clicked", self._on_start_translation)
@@ -334,14 +523,15 @@ class MainWindow(Adw.ApplicationWindow):
 
         self._build_drop_page()
         self._build_project_page()
-        self._build_progress_page()
         self._build_welcome_page()
         self._build_success_page()
 
-        # Drop target on stack
-        drop_target = Gtk.DropTarget.new(Gio.File, Gdk.DragAction.COPY)
-        drop_target.connect("drop", self._on_drop)
-        self.stack.add_controller(drop_target)
+        # Drop target on stack, detached while the progress page is shown
+        self._drop_target = Gtk.DropTarget.new(Gio.File, Gdk.DragAction.COPY)
+        self._drop_target.connect("drop", self._on_drop)
+        self.stack.add_controller(self._drop_target)
+        self._drop_target_attached = True
+        self.stack.connect("notify::visible-child-name", self._on_stack_page_changed)
 
         toolbar.set_content(self.stack)
 
@@ -436,7 +626,14 @@ class MainWindow(Adw.ApplicationWindow):
         self.stack.add_named(page, "project")
 
     def _build_progress_page(self):
-        """Build the translation progress page with embedded live viewer."""
+        """Build the translation progress page with embedded live viewer.
+
+        Deferred until a translation starts, so opening the window does not
+        pay for the ring, the language grid and the viewer.
+        """
+        if self._progress_page_built:
+            return
+        self._progress_page_built = True
         # Vertical paned: progress info on top, live viewer on bottom
         paned = Gtk.Paned(orientation=Gtk.Orientation.VERTICAL)
         paned.set_shrink_start_child(False)
@@ -455,7 +652,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.progress_ring = ProgressRing()
         top.append(self.progress_ring)
 
-        self.progress_title = Gtk.Label(label=_("Translating..."))
+        self.progress_title = Gtk.Label(label=_TRANSLATING)
         self.progress_title.add_css_class("title-3")
         self.progress_title.update_property(
             [Gtk.AccessibleProperty.LABEL],
@@ -475,14 +672,14 @@ class MainWindow(Adw.ApplicationWindow):
         self.lang_grid = Gtk.FlowBox()
         self.lang_grid.set_max_children_per_line(12)
         self.lang_grid.set_min_children_per_line(6)
-        self.lang_grid.set_selection_mode(Gtk.SelectionMode.SINGLE)
+        self.lang_grid.set_selection_mode(Gtk.SelectionMode.NONE)
         self.lang_grid.set_homogeneous(True)
         self.lang_grid.set_margin_top(8)
         self.lang_grid.update_property(
             [Gtk.AccessibleProperty.LABEL],
             [_("Language translation status")],
         )
-        self._populate_lang_grid()
+        # Filled with the selected languages by _begin_translation()
         top.append(self.lang_grid)
 
         # Cancel button
@@ -497,6 +694,8 @@ class MainWindow(Adw.ApplicationWindow):
         paned.set_start_child(top)
 
         # ── Bottom: embedded live viewer ──
+        from ui.translation_viewer import TranslationViewer
+
         self._viewer = TranslationViewer()
         paned.set_end_child(self._viewer)
 
@@ -541,16 +740,8 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_welcome_settings(self, button):
         """Open settings from welcome page, then go to drop page."""
-        dialog = SettingsDialog(self, self.settings)
-        dialog.connect("close-request", self._on_welcome_settings_closed)
-        dialog.present()
-
-    def _on_welcome_settings_closed(self, dialog):
-        """After first-run settings close, go to drop page."""
-        self.settings = Settings()
-        self._refresh_api_dropdowns()
-        self.stack.set_visible_child_name("drop")
-        return False
+        self._welcome_settings_open = True
+        self._present_settings()
 
     def _build_success_page(self):
         """Build the translation success page (U5: Peak-End Rule)."""
@@ -584,7 +775,7 @@ class MainWindow(Adw.ApplicationWindow):
         time_str = f"{mins}m{secs:02d}s" if mins else f"{secs}s"
 
         # Build description with optional cost info
-        desc = _("{langs} languages translated in {time}").format(
+        desc = _SUCCESS_TEMPLATE.format(
             langs=success_count, time=time_str
         )
         usage = getattr(self.controller, "_last_usage", {})
@@ -606,137 +797,139 @@ class MainWindow(Adw.ApplicationWindow):
     # ── Language Grid ───────────────────────────────────────────
 
     def _populate_lang_grid(self, languages: list[str] | None = None):
-        """Populate language grid with selected languages."""
-        # Clear existing children
+        """Populate language grid with selected languages.
+
+        Items are created once per language and kept in _lang_items, so a
+        new run only resets their status instead of rebuilding the widgets.
+        """
+        lang_list = languages if languages else LANG_CODES
+        self.lang_widgets = widgets = {}
+        # Detach items from the previous run; set_child(None) releases the
+        # item from its FlowBoxChild so it can be appended again below
+        grid = self.lang_grid
         while True:
-            child = self.lang_grid.get_first_child()
+            child = grid.get_first_child()
             if child is None:
                 break
-            self.lang_grid.remove(child)
-
-        lang_list = languages if languages else list(SUPPORTED_LANGUAGES.keys())
-        self.lang_widgets = {}
+            child.set_child(None)
+            grid.remove(child)
+
+        cache = self._lang_items
+        # Resolve constructors, enums and the translated status once: the
+        # loop below runs per language and each lookup crosses into PyGObject
+        box_new, label_new = Gtk.Box, Gtk.Label
+        image_new = Gtk.Image.new_from_icon_name
+        horizontal = Gtk.Orientation.HORIZONTAL
+        label_prop = [Gtk.AccessibleProperty.LABEL]
+        pending = _STATUS_LABELS["pending"]
+        grid_append = grid.append
         for code in lang_list:
-            lang_name = SUPPORTED_LANGUAGES[code]
-            item = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-            item.add_css_class("lang-item")
-            item.add_css_class("pending")
-            # Accessibility: describe language and initial status
-            item.update_property(
-                [Gtk.AccessibleProperty.LABEL],
-                [f"{lang_name}: {_('pending')}"],
-            )
-
-            lbl = Gtk.Label(label=code.upper()[:2])
-            lbl.add_css_class("caption")
-            item.append(lbl)
-
-            icon = Gtk.Image.new_from_icon_name("content-loading-symbolic")
-            icon.set_pixel_size(12)
-            item.append(icon)
-
-            item.status_icon = icon
-            item.set_tooltip_text(lang_name)
-            self.lang_grid.append(item)
-            self.lang_widgets[code] = item
+            item = cache.get(code)
+            if item is None:
+                lang_name = SUPPORTED_LANGUAGES[code]
+                item = box_new(orientation=horizontal, spacing=4)
+                item.add_css_class("lang-item")
+                item.add_css_class("pending")
+                # Accessibility: describe language and initial status
+                item.update_property(label_prop, [f"{lang_name}: {pending}"])
+
+                lbl = label_new(label=code.upper()[:2])
+                lbl.add_css_class("caption")
+                item.append(lbl)
+
+                icon = image_new("content-loading-symbolic")
+                icon.set_pixel_size(12)
+                item.append(icon)
+
+                item.status_icon = icon
+                item.current_status = "pending"  # CSS class currently applied
+                item.set_tooltip_text(lang_name)
+                cache[code] = item
+            grid_append(item)
+            widgets[code] = item
+            # Reused items keep the previous run's status until reset here
+            self._update_lang_status(code, "pending")
 
     def _update_lang_status(self, code: str, status: str):
-        if code not in self.lang_widgets:
+        pending = self._pending_status
+        if pending is not None:
+            # Inside _drain_events: keep only the final status per language
+            pending[code] = status
+            return
+        self._apply_lang_status(code, status)
+
+    def _flush_lang_status(self):
+        """Apply the statuses buffered by _update_lang_status during a drain."""
+        pending = self._pending_status
+        for code, status in pending.items():
+            self._apply_lang_status(code, status)
+        pending.clear()
+
+    def _apply_lang_status(self, code: str, status: str):
+        w = self.lang_widgets.get(code)
+        if w is None or w.current_status == status or status not in _LANG_STATES:
             return
-        w = self.lang_widgets[code]
-        for c in ["pending", "translating", "success", "error", "reference"]:
-            w.remove_css_class(c)
+        # Swap only the class that changes: each removal restyles the item
+        w.remove_css_class(w.current_status)
         w.add_css_class(status)
-        icons = {
-            "pending": "content-loading-symbolic",
-            "translating": "emblem-synchronizing-symbolic",
-            "success": "emblem-ok-symbolic",
-            "error": "dialog-error-symbolic",
-            "reference": "starred-symbolic",
-        }
-        w.status_icon.set_from_icon_name(icons.get(status, "content-loading-symbolic"))
+        icon = _STATUS_ICONS.get(status, "content-loading-symbolic")
+        if icon != _STATUS_ICONS.get(w.current_status, "content-loading-symbolic"):
+            w.status_icon.set_from_icon_name(icon)
+        w.current_status = status
         # Update accessible label so Orca announces the new status
         lang_name = SUPPORTED_LANGUAGES.get(code, code)
-        status_labels = {
-            "pending": _("pending"),
-            "translating": _("translating"),
-            "success": _("completed"),
-            "error": _("error"),
-            "reference": _("reference"),
-        }
         w.update_property(
             [Gtk.AccessibleProperty.LABEL],
-            [f"{lang_name}: {status_labels.get(status, status)}"],
+            [f"{lang_name}: {_STATUS_LABELS.get(status, status)}"],
         )
 
     # ── API Dropdowns ───────────────────────────────────────────
 
     def _build_api_dropdowns(self, api_group):
         """Build API type and provider dropdowns reflecting saved config."""
-        self._configured_free_providers = []  # list of (label, provider_key)
-        self._configured_paid_providers = []  # list of (label, provider_key)
-
-        # Providers that do not require an API key
-        _NO_KEY_REQUIRED = {"libretranslate"}
-
-        free_provider_labels = {
-            "deepl-free": "DeepL Free",
-            "groq": "Groq",
-            "gemini-free": "Gemini Free",
-            "openrouter": "OpenRouter",
-            "mistral-free": "Mistral",
-            "libretranslate": "LibreTranslate",
-        }
-
-        # Free: show providers with configured key + those that need no key
-        for key, label in free_provider_labels.items():
-            if key in _NO_KEY_REQUIRED:
-                self._configured_free_providers.append((label, key))
-            elif self.settings.get_provider_key("free_api", key):
-                self._configured_free_providers.append((label, key))
-
-        # Paid: show ONLY providers with configured key
-        paid_provider_labels = {
-            "openai": "OpenAI",
-            "gemini": "Gemini",
-            "grok": "Grok (xAI)",
-            "deepseek": "DeepSeek",
-        }
-
-        for key, label in paid_provider_labels.items():
-            if self.settings.get_provider_key("paid_api", key):
-                self._configured_paid_providers.append((label, key))
+        # (label, provider_key) lists, cached by Settings until a value changes
+        configured = self.settings.get_configured_providers
+        self._configured_free_providers = configured("free")
+        self._configured_paid_providers = configured("paid")
+        # One model and key → position index per type, swapped in by
+        # _update_sidebar_providers instead of rebuilt on every switch
+        self._provider_models = {}
+        self._provider_index = {}
+        for type_key, providers in (
+            ("free", self._configured_free_providers),
+            ("paid", self._configured_paid_providers),
+        ):
+            self._provider_models[type_key] = Gtk.StringList.new(
+                [label for label, _key in providers]
+            )
+            self._provider_index[type_key] = {
+                key: i for i, (_label, key) in enumerate(providers)
+            }
+        self._active_type_key = None
 
         # Always show both API types
-        configured_types = [(_("Free"), "free"), (_("Paid"), "paid")]
-
-        # Ensure at least one free provider (LibreTranslate needs no key)
-        if not self._configured_free_providers:
-            self._configured_free_providers.append(("LibreTranslate", "libretranslate"))
-
+        configured_types = list(_API_TYPE_LABELS)
         self._configured_types = configured_types
+        self._type_index = {key: i for i, (_lbl, key) in enumerate(configured_types)}
 
         # API Type row
-        self.api_type_row = Adw.ComboRow(title=_("API Type"))
-        type_labels = [t[0] for t in configured_types]
-        self.api_type_row.set_model(Gtk.StringList.new(type_labels))
+        self.api_type_row = Adw.ComboRow(title=_API_TYPE_TITLE)
+        # The type labels never change: rebuilt rows share one model
+        if self._api_type_model is None:
+            self._api_type_model = Gtk.StringList.new([t[0] for t in configured_types])
+        self.api_type_row.set_model(self._api_type_model)
         self.api_type_row.connect("notify::selected", self._on_sidebar_api_type_changed)
         self.tooltip_helper.add_tooltip(self.api_type_row, "api_type")
         api_group.add(self.api_type_row)
 
         # Provider row
-        self.api_provider_row = Adw.ComboRow(title=_("Provider"))
+        self.api_provider_row = Adw.ComboRow(title=_PROVIDER_TITLE)
         self.api_provider_row.connect("notify::selected", self._on_sidebar_provider_changed)
         self.tooltip_helper.add_tooltip(self.api_provider_row, "api_provider")
         api_group.add(self.api_provider_row)
 
         # Set initial selection based on saved settings
-        saved_type = self.settings.get_api_type()
-        type_idx = 0
-        for i, (_lbl, key) in enumerate(configured_types):
-            if key == saved_type:
-                type_idx = i
-                break
+        type_idx = self._type_index.get(self.settings.get_api_type(), 0)
         self._updating_dropdowns = True
         self.api_type_row.set_selected(type_idx)
         self._update_sidebar_providers()
@@ -784,30 +977,18 @@ class MainWindow(Adw.ApplicationWindow):
             return
         _lbl, type_key = self._configured_types[idx]
 
-        if type_key == "free":
-            providers = self._configured_free_providers
-        else:
-            providers = self._configured_paid_providers
-
-        if providers:
-            labels = [p[0] for p in providers]
-            self.api_provider_row.set_model(Gtk.StringList.new(labels))
-            self.api_provider_row.set_sensitive(True)
-
-            # Select the saved provider
-            if type_key == "free":
-                saved = self.settings.get("free_api.provider", "")
-            else:
-                saved = self.settings.get("paid_api.provider", "")
+        if type_key == self._active_type_key:
+            return
+        self._active_type_key = type_key
 
-            for i, (_lbl, key) in enumerate(providers):
-                if key == saved:
-                    self.api_provider_row.set_selected(i)
-                    break
-        else:
-            # No configured providers — show empty dropdown
-            self.api_provider_row.set_model(Gtk.StringList.new([]))
-            self.api_provider_row.set_sensitive(False)
+        # Setting a model resets the selection, so do it only on a type change
+        self.api_provider_row.set_model(self._provider_models[type_key])
+        index = self._provider_index[type_key]
+        self.api_provider_row.set_sensitive(bool(index))
+        # Select the saved provider
+        saved = self.settings.get(f"{type_key}_api.provider", "")
+        if saved in index:
+            self.api_provider_row.set_selected(index[saved])
 
     # ── Language selection ─────────────────────────────────────
 
@@ -816,7 +997,7 @@ class MainWindow(Adw.ApplicationWindow):
         count = sum(1 for c in self._lang_checks.values() if c.get_active())
         total = len(self._lang_checks)
         self._lang_expander.set_title(
-            _("{count} of {total} languages selected").format(count=count, total=total)
+            _SELECTION_TEMPLATE.format(count=count, total=total)
         )
 
     def _on_lang_toggled(self, check):
@@ -853,15 +1034,31 @@ class MainWindow(Adw.ApplicationWindow):
     # ── Callbacks ───────────────────────────────────────────────
 
     def _on_settings_clicked(self, button):
-        dialog = SettingsDialog(self, self.settings)
-        dialog.connect("close-request", self._on_settings_closed)
+        self._present_settings()
+
+    def _present_settings(self):
+        """Show the settings dialog, building it only on the first open."""
+        dialog = self._settings_dialog
+        if dialog is None:
+            # Imported on first use: the dialog pulls in the API modules
+            from ui.settings_dialog import SettingsDialog
+
+            dialog = self._settings_dialog = SettingsDialog(self, self.settings)
+            dialog.connect("close-request", self._on_settings_closed)
+        else:
+            # The sidebar may have changed provider/type since the last open
+            dialog.reload(self.settings)
         dialog.present()
 
     def _on_settings_closed(self, dialog):
         """Refresh sidebar dropdowns after settings dialog closes."""
-        # Reload settings from disk
-        self.settings = Settings()
+        # The dialog saved into self.settings in its own close-request
+        # handler (connected first), so there is nothing to reload from disk
         self._refresh_api_dropdowns()
+        # After first-run settings close, go to drop page
+        if self._welcome_settings_open:
+            self._welcome_settings_open = False
+            self.stack.set_visible_child_name("drop")
         return False
 
     def _refresh_api_dropdowns(self):
@@ -911,7 +1108,7 @@ class MainWindow(Adw.ApplicationWindow):
                 self.settings.save()
                 self._validate_and_set_project(path)
         except Exception as e:
-            self._show_toast(f"{_('Error')}: {e}")
+            self._show_toast(f"{_ERROR}: {e}")
 
     def _on_file_selected(self, dialog, result):
         try:
@@ -922,23 +1119,76 @@ class MainWindow(Adw.ApplicationWindow):
                 self.settings.save()
                 self._validate_and_set_file(path)
         except Exception as e:
-            self._show_toast(f"{_('Error')}: {e}")
+            self._show_toast(f"{_ERROR}: {e}")
 
-    def _on_drop(self, target, value, x, y):
-        if isinstance(value, Gio.File):
-            path = value.get_path()
-            if path:
-                p = Path(path)
-                if p.is_dir():
-                    self._validate_and_set_project(path)
-                elif p.is_file():
-                    self._validate_and_set_file(path)
-                return True
+    def _on_close_request(self, _window):
+        """Stop a running translation and release the controller's worker."""
+        self.controller.shutdown()
+        self._validator.shutdown(wait=False, cancel_futures=True)
         return False
 
+    def _on_stack_page_changed(self, stack, _pspec):
+        """Accept drops everywhere except on the translation progress page."""
+        want = stack.get_visible_child_name() != "progress"
+        if want == self._drop_target_attached:
+            return
+        if want:
+            stack.add_controller(self._drop_target)
+        else:
+            stack.remove_controller(self._drop_target)
+        self._drop_target_attached = want
+
+    def _on_drop(self, target, value, x, y):
+        path = value.get_path() if isinstance(value, Gio.File) else None
+        if not path:
+            return False
+        # Even the directory/file check hits the disk: run it off the UI
+        self._validator.submit(self._validate_dropped, path)
+        return True
+
+    def _validate_dropped(self, path: str):
+        """Validate a dropped folder or file (runs on the validator thread)."""
+        p = Path(path)
+        if p.is_dir():
+            self._validate(self.controller.validate_project, path, self._apply_project)
+        elif p.is_file():
+            self._validate(self.controller.validate_file, path, self._apply_file)
+
+    def _validate(self, validate, path: str, apply):
+        """Call ``validate(path)``, then schedule ``apply`` on the UI thread."""
+        try:
+            result, error = validate(path), None
+        except Exception as e:
+            result, error = None, e
+        GLib.idle_add(apply, path, result, error)
+
+    def _validate_in_background(self, validate, path: str, apply):
+        """Run ``validate(path)`` on the validator thread, then ``apply`` on the UI."""
+        self._validator.submit(self._validate, validate, path, apply)
+
+    def _show_validation_error(self, error: Exception):
+        if isinstance(error, ValueError):
+            self._show_toast(str(error))
+        else:
+            self._show_toast(f"{_ERROR}: {_humanize_error(error)}")
+
     def _validate_and_set_project(self, path: str):
+        self._validate_in_background(
+            self.controller.validate_project, path, self._apply_project
+        )
+
+    def _validate_and_set_file(self, path: str):
+        self._validate_in_background(
+            self.controller.validate_file, path, self._apply_file
+        )
+
+    def _apply_project(self, path: str, result, error):
+        """Show a validated project (idle callback from the validator thread)."""
+        if error is not None:
+            self._show_validation_error(error)
+            return GLib.SOURCE_REMOVE
         try:
-            textdomain, strings = self.controller.validate_project(path)
+            textdomain, strings = result
             self.selected_project = Path(path)
             self.selected_file = None
             self._mode = "project"
@@ -948,25 +1198,26 @@ class MainWindow(Adw.ApplicationWindow):
             self.project_name_label.set_label(textdomain)
             lang_count = len(self.get_selected_languages())
             self.project_info_label.set_label(
-                _("{strings} strings · {langs} languages").format(
-                    strings=strings, langs=lang_count
-                )
+                _PROJECT_INFO_TEMPLATE.format(strings=strings, langs=lang_count)
             )
 
             self.translate_button.set_sensitive(True)
             self.compile_switch.set_sensitive(True)
             self.stack.set_visible_child_name("project")
 
-            self._show_toast(_("Project loaded: {}").format(textdomain))
+            self._show_toast(_PROJECT_LOADED_TEMPLATE.format(textdomain))
 
-        except ValueError as e:
-            self._show_toast(str(e))
         except Exception as e:
-            self._show_toast(f"{_('Error')}: {_humanize_error(e)}")
-
-    def _validate_and_set_file(self, path: str):
+            self._show_validation_error(e)
+        return GLib.SOURCE_REMOVE
+
+    def _apply_file(self, path: str, result, error):
+        """Show a validated file (idle callback from the validator thread)."""
+        if error is not None:
+            self._show_validation_error(error)
+            return GLib.SOURCE_REMOVE
         try:
-            filename, count = self.controller.validate_file(path)
+            filename, count = result
             self.selected_file = Path(path)
             self.selected_project = None
             self._mode = "file"
@@ -976,21 +1227,18 @@ class MainWindow(Adw.ApplicationWindow):
             self.project_name_label.set_label(filename)
             lang_count = len(self.get_selected_languages())
             self.project_info_label.set_label(
-                _("{items} items · {langs} languages").format(
-                    items=count, langs=lang_count
-                )
+                _FILE_INFO_TEMPLATE.format(items=count, langs=lang_count)
             )
 
             self.translate_button.set_sensitive(True)
             self.compile_switch.set_sensitive(False)
             self.stack.set_visible_child_name("project")
 
-            self._show_toast(_("File loaded: {}").format(filename))
+            self._show_toast(_FILE_LOADED_TEMPLATE.format(filename))
 
-        except ValueError as e:
-            self._show_toast(str(e))
         except Exception as e:
-            self._show_toast(f"{_('Error')}: {_humanize_error(e)}")
+            self._show_validation_error(e)
+        return GLib.SOURCE_REMOVE
 
     def _on_start_translation(self, button):
         if self.controller.is_translating:
@@ -1059,17 +1307,16 @@ class MainWindow(Adw.ApplicationWindow):
         try:
             self.controller.prepare()
         except Exception as e:
-            self._show_toast(f"{_('Error')}: {_humanize_error(e)}")
+            self._show_toast(f"{_ERROR}: {_humanize_error(e)}")
             return
 
-        import time
-
         selected_langs = self.get_selected_languages()
         self._active_langs = selected_langs  # for progress tracking
 
         self._translation_start = time.monotonic()
+        self._build_progress_page()
         self.translate_button.set_sensitive(False)
-        self.translate_button.set_label(_("Translating..."))
+        self.translate_button.set_label(_TRANSLATING)
         self.cancel_button.set_sensitive(True)
 
         # Clear the embedded viewer for the new translation run
@@ -1081,23 +1328,27 @@ class MainWindow(Adw.ApplicationWindow):
         # Rebuild lang grid with only selected languages
         self._populate_lang_grid(selected_langs)
 
+        self._translating_langs = set(selected_langs[:1])
         if selected_langs:
             self._update_lang_status(selected_langs[0], "translating")
 
+        # UI refresh rate is fixed by the timer, not by translation speed
+        self._draining = True
+        if self._drain_source is None:
+            self._drain_source = GLib.timeout_add(33, self._drain_events)
+
         callbacks = dict(
-            on_phase=lambda phase: GLib.idle_add(self._on_phase, phase),
-            on_lang_progress=lambda *a: GLib.idle_add(self._on_lang_progress, *a),
-            on_complete=lambda *a: GLib.idle_add(self._on_translation_complete, *a),
-            on_error=lambda e: GLib.idle_add(self._on_translation_error, e),
+            on_phase=lambda phase: self._post(self._on_phase, phase),
+            on_lang_progress=lambda *a: self._event_q.put(("progress", a)),
+            on_complete=lambda *a: self._post(self._on_translation_complete, *a),
+            on_error=lambda e: self._post(self._on_translation_error, e),
+            on_detail=lambda lang, pairs: self._post(self._on_detail, lang, pairs),
         )
 
         if self._mode == "file" and self.selected_file:
             self.controller.start_file(
                 self.selected_file,
                 languages=selected_langs,
-                on_detail=lambda lang, pairs: GLib.idle_add(
-                    self._on_detail, lang, pairs
-                ),
                 **callbacks,
             )
         else:
@@ -1106,69 +1357,108 @@ class MainWindow(Adw.ApplicationWindow):
                 languages=selected_langs,
                 compile_mo=self.compile_switch.get_active(),
                 force_retranslate=self.retranslate_switch.get_active(),
-                on_detail=lambda lang, pairs: GLib.idle_add(
-                    self._on_detail, lang, pairs
+                on_compile_progress=lambda *a: self._post(
+                    self._on_compile_progress, *a
                 ),
                 **callbacks,
             )
 
-    # ── Controller callbacks (invoked via GLib.idle_add) ────────
+    def _post(self, fn, *args):
+        """Queue ``fn(*args)`` from the worker to run in the next drain tick."""
+        self._event_q.put(("call", (fn, args)))
+
+    def _drain_events(self):
+        """Apply the worker events queued since the last tick, in order.
+
+        Progress events between two posted calls are coalesced to the newest
+        one per language (languages run in parallel, so each keeps its own),
+        so a burst of updates costs one pass of label/ring changes per frame;
+        posted calls (phase, detail, completion) run in the same dispatch,
+        after the progress that preceded them.
+        """
+        latest: dict[str, tuple] = {}
+        # Grid status changes are buffered too, so a language going
+        # pending → translating → success within one tick restyles once
+        self._pending_status = {}
+
+        def flush():
+            for lang, (status, current, total) in latest.items():
+                self._on_lang_progress(lang, status, current, total)
+            latest.clear()
+
+        get = self._event_q.get_nowait
+        # An exception escaping this timer would remove it for good while
+        # _drain_source stays set, freezing the window: log and go on
+        try:
+            while True:
+                try:
+                    kind, payload = get()
+                except queue.Empty:
+                    break
+                if kind == "progress":
+                    lang, status, current, total = payload
+                    latest.pop(lang, None)  # re-insert: keep arrival order
+                    latest[lang] = (status, current, total)
+                else:
+                    flush()
+                    self._flush_lang_status()
+                    fn, args = payload
+                    try:
+                        fn(*args)
+                    except Exception:
+                        log.exception("UI callback %s failed", fn.__name__)
+            flush()
+            self._flush_lang_status()
+        except Exception:
+            log.exception("Failed to apply translation progress")
+        finally:
+            self._pending_status = None
+        if self._draining:
+            return GLib.SOURCE_CONTINUE
+        self._drain_source = None
+        return GLib.SOURCE_REMOVE
+
+    # ── Controller callbacks (run by _drain_events) ─────────────
 
     def _on_phase(self, phase: str):
         """Update UI when a pipeline phase starts."""
-        labels = {
-            "extracting": _("Extracting strings..."),
-            "translating": _("Translating..."),
-            "compiling": _("Compiling..."),
-            "checking context": _("Checking context-aware translations..."),
-        }
-        label = labels.get(phase, phase)
-        self.progress_subtitle.set_label(label)
+        self.progress_subtitle.set_label(_PHASE_LABELS.get(phase, phase))
 
     def _on_lang_progress(self, lang: str, status: str, current: int, total: int):
         """Update UI per-language progress (M3: ETA display)."""
-        import time
-
-        name = SUPPORTED_LANGUAGES.get(lang, lang)
+        # Statuses are "<kind>" or "<kind>: <detail>"; split once and compare
+        kind, _sep, detail = status.partition(":")
+        detail = detail.strip()
 
         # Phase 1 of fix_context: checking individual entries, not languages
-        if status.startswith("checking context"):
+        if kind == "checking context":
             self.progress_subtitle.set_label(status)
             if total > 0:
                 self.progress_ring.set_progress(current / total)
             return
 
         # Already-fixed langs from resume: mark success but skip ETA calc
-        if "already fixed" in status:
+        if detail == "already fixed":
             self._update_lang_status(lang, "success")
             if total > 0:
                 self.progress_ring.set_progress(current / total)
             self.progress_subtitle.set_label(
-                _("Resuming… {current}/{total} languages already done").format(
-                    current=current, total=total
-                )
+                _RESUMING_TEMPLATE.format(current=current, total=total)
             )
             # Track resumed offset so ETA calc discounts them
             self._resumed_offset = current
             self._resumed_time = time.monotonic()
             return
 
-        # In-progress string-level feedback during fix_context Phase 2
-        if status.startswith("translating:"):
-            # Clear spinner from previous lang if still marked translating
-            prev = getattr(self, "_translating_lang", None)
-            if prev and prev != lang:
-                self._update_lang_status(prev, "pending")
-            self._translating_lang = lang
+        # In-progress string-level feedback; several languages can be active
+        if kind == "translating":
+            self._translating_langs.add(lang)
             self._update_lang_status(lang, "translating")
-            detail = f"{name}: {status.removeprefix('translating:').strip()}"
-            self.progress_subtitle.set_label(detail)
+            self.progress_subtitle.set_label(f"{_lang_name(lang, lang)}: {detail}")
             # Parse sub-progress from "translating: 435/582 subtitles"
             if total > 0:
                 sub_fraction = 0.5
-                import re as _re
-
-                m = _re.search(r"(\d+)/(\d+)", status)
+                m = _SUB_PROGRESS_RE.search(status)
                 if m:
                     sub_done, sub_total = int(m.group(1)), int(m.group(2))
                     if sub_total > 0:
@@ -1176,17 +1466,16 @@ class MainWindow(Adw.ApplicationWindow):
                 self.progress_ring.set_progress((current - 1 + sub_fraction) / total)
             return
 
-        if "error" in status.lower():
+        if kind == "error":
             self._update_lang_status(lang, "error")
-        elif "reference" in status.lower():
+        elif detail == "reference language":
             self._update_lang_status(lang, "reference")
         else:
             self._update_lang_status(lang, "success")
 
-        # Clear translating tracker so next "translating:" callback starts clean
-        if getattr(self, "_translating_lang", None) == lang:
-            self._translating_lang = None
+        self._translating_langs.discard(lang)
 
+        name = _lang_name(lang, lang)
         elapsed = time.monotonic() - getattr(
             self, "_resumed_time", self._translation_start
         )
@@ -1197,7 +1486,7 @@ class MainWindow(Adw.ApplicationWindow):
             remaining = avg_per_lang * (total - current)
             mins, secs = divmod(int(remaining), 60)
             eta_str = f"{mins}m{secs:02d}s" if mins else f"{secs}s"
-            detail = _("{name} ({current}/{total}) · ~{eta} remaining").format(
+            detail = _ETA_TEMPLATE.format(
                 name=name,
                 current=current,
                 total=total,
@@ -1208,24 +1497,33 @@ class MainWindow(Adw.ApplicationWindow):
         self.progress_subtitle.set_label(detail)
         self.progress_ring.set_progress(current / total)
 
+    def _on_compile_progress(self, current: int, total: int):
+        """.mo compilation after translation counts files, not languages."""
+        self.progress_subtitle.set_label(
+            _COMPILING_TEMPLATE.format(current=current, total=total)
+        )
+
     def _on_translation_complete(
         self, results: dict, elapsed: float, was_cancelled: bool
     ):
         """Handle translation pipeline completion."""
+        self._draining = False  # last event of the run: stop the timer
         success = sum(1 for v in results.values() if v)
         failed = sum(1 for v in results.values() if not v)
         mins, secs = divmod(int(elapsed), 60)
         elapsed_str = f"{mins}m{secs:02d}s" if mins else f"{secs}s"
 
         if was_cancelled:
+            # Languages interrupted mid-run go back to pending
+            for lang in self._translating_langs:
+                self._update_lang_status(lang, "pending")
+            self._translating_langs.clear()
             # Cancel UI already shown by _on_cancel_translation; just update
             # with the final cost which may be more accurate.
             usage = getattr(self.controller, "_last_usage", {})
             cost = usage.get("cost_usd", 0)
             if cost > 0:
-                cancel_msg = _("{} languages translated before cancellation").format(
-                    success
-                )
+                cancel_msg = _CANCELLED_TEMPLATE.format(success)
                 cancel_msg += f"\n💰 ${cost:.4f}"
                 self.progress_subtitle.set_label(cancel_msg)
         else:
@@ -1235,27 +1533,25 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_translation_error(self, error: Exception):
         """Handle translation pipeline failure."""
-        self.progress_title.set_label(_("Error"))
+        self._draining = False
+        self.progress_title.set_label(_ERROR)
         self.progress_subtitle.set_label(_humanize_error(error))
-        self._show_toast(f"{_('Error')}: {_humanize_error(error)}")
+        self._show_toast(f"{_ERROR}: {_humanize_error(error)}")
         self._finish_translation()
 
     def _on_cancel_translation(self, button):
         """Signal the translation thread to stop and show cancelled state."""
         self.controller.cancel()
         self.cancel_button.set_sensitive(False)
-        self.progress_title.set_label(_("Cancelled"))
+        self.progress_title.set_label(_CANCELLED)
 
         # Count languages already marked as success in the grid
-        success_count = 0
-        for code, w in self.lang_widgets.items():
-            if w.has_css_class("success"):
-                success_count += 1
-
-        cancel_msg = _("{} languages translated before cancellation").format(
-            success_count
+        success_count = sum(
+            w.current_status == "success" for w in self.lang_widgets.values()
         )
 
+        cancel_msg = _CANCELLED_TEMPLATE.format(success_count)
+
         # Snapshot cost from the live API client
         api = getattr(self.controller, "_api_client", None)
         if api:
@@ -1270,11 +1566,11 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _finish_translation(self):
         self.translate_button.set_sensitive(True)
-        self.translate_button.set_label(_("Start Translation"))
+        self.translate_button.set_label(_START_TRANSLATION)
         self.cancel_button.set_sensitive(False)
 
     def _on_detail(self, lang: str, pairs: list[tuple[str, str, str]]):
-        """Receive translation detail pairs from worker thread (via idle_add)."""
+        """Receive translation detail pairs from worker thread (via _post)."""
         # Detect language switch
         viewer_lang = getattr(self, "_viewer_current_lang", None)
         if viewer_lang != lang:
@@ -1284,6 +1580,15 @@ class MainWindow(Adw.ApplicationWindow):
         self._viewer.add_batch(pairs)
 
     def _show_toast(self, msg: str):
-        toast = Adw.Toast.new(msg)
+        # A toast still on screen is retitled instead of queueing another
+        toast = self._toast
+        if toast is not None:
+            toast.set_title(msg)
+            return
+        toast = self._toast = Adw.Toast.new(msg)
         toast.set_timeout(3)
+        toast.connect("dismissed", self._on_toast_dismissed)
         self.toast_overlay.add_toast(toast)
+
+    def _on_toast_dismissed(self, toast):
+        self._toast = None
@@ -1,6 +1,7 @@
 """Application settings dialog."""
 
 import logging
+import threading
 
 import gi
 
@@ -94,6 +95,144 @@ _RECOMMENDED = {
     "deepseek-chat",                 # Cheapest paid — good enough quality
 }
 
+# Free providers listed outside the "More providers" expander
+_RECOMMENDED_FREE_PROVIDERS = frozenset({"deepl-free", "groq"})
+
+# Title of the free API key entry per provider; None hides the entry
+_API_KEY_TITLE = _("API Key")
+_FREE_KEY_TITLES = {
+    "deepl-free": _("{provider} API Key").format(provider="DeepL"),
+    "groq": _("{provider} API Key").format(provider="Groq"),
+    "gemini-free": _("{provider} API Key").format(provider="Gemini"),
+    "openrouter": _("{provider} API Key").format(provider="OpenRouter"),
+    "mistral-free": _("{provider} API Key").format(provider="Mistral"),
+    "libretranslate": None,
+}
+
+# Paid provider names shown in the provider expander subtitle
+_PAID_PROVIDER_NAMES = {
+    "openai": "OpenAI",
+    "gemini": "Gemini",
+    "grok": "Grok",
+    "deepseek": "DeepSeek",
+}
+
+
+# Provider definitions with contextual help (U4), translated once at import
+_FREE_PROVIDER_DEFS = (
+    {
+        "id": "deepl-free",
+        "name": "DeepL Free",
+        "subtitle": _("500k chars/month — Best translation quality"),
+    },
+    {
+        "id": "groq",
+        "name": "Groq",
+        "subtitle": _("14.4k req/day — Fastest, excellent quality"),
+    },
+    {
+        "id": "gemini-free",
+        "name": "Gemini Free",
+        "subtitle": _("1,000 req/day — Google AI"),
+    },
+    {
+        "id": "openrouter",
+        "name": "OpenRouter",
+        "subtitle": _("18 free models available"),
+    },
+    {
+        "id": "mistral-free",
+        "name": "Mistral Free",
+        "subtitle": _("Free tier — Quality models"),
+    },
+    {
+        "id": "libretranslate",
+        "name": "LibreTranslate",
+        "subtitle": _("Open source — No API key needed"),
+    },
+)
+
+_PAID_PROVIDER_DEFS = (
+    {
+        "id": "openai",
+        "name": "OpenAI",
+        "subtitle": _("GPT-5, GPT-4.1 — Industry standard"),
+    },
+    {
+        "id": "gemini",
+        "name": "Gemini (Google AI)",
+        "subtitle": _("Gemini 2.5 Flash/Pro — Fast and capable"),
+    },
+    {
+        "id": "grok",
+        "name": "Grok (xAI)",
+        "subtitle": _("$25 free credits — 2M context window"),
+    },
+    {
+        "id": "deepseek",
+        "name": "DeepSeek",
+        "subtitle": _("Very low cost — Good for high-volume translation"),
+    },
+)
+
+# Cards shown by the "how to get a free key" help dialog
+_API_HELP_CARDS = (
+    {
+        "name": "DeepL Free",
+        "icon": "starred-symbolic",
+        "badge": _("Recommended"),
+        "limit": _("500k characters/month"),
+        "quality": _("Best translation quality"),
+        "url": "https://www.deepl.com/pro-api",
+        "steps": _("Create account → Free Plan → API Keys"),
+    },
+    {
+        "name": "Groq",
+        "icon": "media-playback-start-symbolic",
+        "badge": _("Fastest"),
+        "limit": _("14,400 requests/day"),
+        "quality": _("LLaMA 3 - Excellent value"),
+        "url": "https://console.groq.com",
+        "steps": _("Create account → API Keys → Create"),
+    },
+    {
+        "name": "Gemini Free",
+        "icon": "applications-science-symbolic",
+        "badge": None,
+        "limit": _("1,000 requests/day"),
+        "quality": _("Google AI - Good quality"),
+        "url": "https://aistudio.google.com/apikey",
+        "steps": _("Google Login → Get API Key"),
+    },
+    {
+        "name": "OpenRouter",
+        "icon": "network-server-symbolic",
+        "badge": None,
+        "limit": _("18 free models"),
+        "quality": _("Multiple models available"),
+        "url": "https://openrouter.ai",
+        "steps": _("Create account → Keys → Create Key"),
+    },
+    {
+        "name": "Mistral Free",
+        "icon": "weather-windy-symbolic",
+        "badge": None,
+        "limit": _("Free tier available"),
+        "quality": _("Quality Mistral models"),
+        "url": "https://console.mistral.ai",
+        "steps": _("Create account → API Keys → Generate"),
+    },
+    {
+        "name": "LibreTranslate",
+        "icon": "emblem-documents-symbolic",
+        "badge": _("No API Key"),
+        "limit": _("Unlimited (self-hosted)"),
+        "quality": _("Open source - Basic quality"),
+        "url": "https://libretranslate.com",
+        "steps": _("Use default URL or your own server"),
+    },
+)
+
 
 def _model_display_name(model_id: str) -> str:
     """Extract a clean display name from a full model ID.
@@ -112,6 +251,29 @@ def _model_display_name(model_id: str) -> str:
     return name
 
 
+def _set_margins(widget: Gtk.Widget, **margins: int) -> None:
+    """Set several margins in one call, e.g. ``_set_margins(box, top=8, end=4)``.
+
+    set_properties() applies them under one freeze_notify(), so the
+    notify:: signals are emitted together after the last margin is set.
+    """
+    widget.set_properties(**{f"margin_{side}": px for side, px in margins.items()})
+
+
+# Combo models of _FREE_MODELS display names, shared by every dialog
+_free_model_lists: dict[str, Gtk.StringList] = {}
+
+
+def _free_model_list(provider: str) -> Gtk.StringList:
+    """Return the model-name list for a free provider, built on first use."""
+    model_list = _free_model_lists.get(provider)
+    if model_list is None:
+        model_list = _free_model_lists[provider] = Gtk.StringList.new(
+            [_model_display_name(m) for m in _FREE_MODELS[provider]]
+        )
+    return model_list
+
+
 class SettingsDialog(Adw.PreferencesWindow):
     """Preferences/settings window."""
 
@@ -121,57 +283,100 @@ class SettingsDialog(Adw.PreferencesWindow):
         self.set_transient_for(parent)
         self.set_modal(True)
         self.set_default_size(720, 500)
-
-        self._build_ui()
-        self._load_settings()
+        # Closing hides the window, so reopening skips the build below
+        self.set_hide_on_close(True)
+        # Widgets are built by the first present(), not here
+        self._built = False
+        # Whether the API type row selects "Free API"; kept by _on_api_type_changed
+        self._is_free = True
+        # Set by any edit after _load_settings(); _on_close saves only then
+        self._dirty = False
+        # API help window, built on first open and hidden on close
+        self._help_dialog = None
+        # Test Connection clients by (provider, key, options); cleared on save
+        self._api_cache: dict[tuple, object] = {}
 
         # Auto-save on close
         self.connect("close-request", self._on_close)
 
+    def present(self):
+        """Build and fill the widgets on the first call, then show the dialog."""
+        if not self._built:
+            self._build_ui()
+            self._load_settings()
+            self._connect_dirty_tracking()
+            self._built = True
+        super().present()
+
+    def _connect_dirty_tracking(self):
+        """Mark the dialog dirty on any edit, provider switches included."""
+        for entry in (self.free_api_key, self.libretranslate_url, self.api_key):
+            entry.connect("changed", self._mark_dirty)
+        for combo in (self.api_type_row, self.free_model_row, self.ref_lang_row):
+            combo.connect("notify::selected", self._mark_dirty)
+        # Switching between providers with the same key leaves the entry
+        # text unchanged, so the radio buttons are tracked directly
+        for check in (
+            *self._provider_checks.values(),
+            *self._paid_provider_checks.values(),
+        ):
+            check.connect("toggled", self._mark_dirty)
+
+    def _mark_dirty(self, *_args):
+        self._dirty = True
+
+    def reload(self, settings: Settings):
+        """Show ``settings`` again in an already-built dialog before reopening."""
+        self.settings = settings
+        if self._built:
+            self._load_settings()
+
     def _on_close(self, window):
-        """Auto-save when closing window."""
-        self._save_settings()
+        """Auto-save when closing window, unless nothing was edited."""
+        if self._dirty:
+            self._save_settings()
         return False
 
     def _save_settings(self):
         """Save all settings."""
-        api_type = "free" if self.api_type_row.get_selected() == 0 else "paid"
-        self.settings.set_api_type(api_type)
-
-        # Free API
+        api_type = "free" if self._is_free else "paid"
         free_provider = self._get_selected_free_provider()
-        self.settings.set("free_api.provider", free_provider)
-        # Save key per-provider (not shared)
-        free_key = self.free_api_key.get_text()
-        self.settings.set_provider_key("free_api", free_provider, free_key)
-        self.settings.set(
-            "free_api.libretranslate_url", self.libretranslate_url.get_text()
-        )
+        paid_provider = self._get_selected_paid_provider()
+        # Collected into one update() so caches are invalidated once
+        values = {
+            "api_type": api_type,
+            # Free API; keys are saved per-provider (not shared)
+            "free_api.provider": free_provider,
+            f"free_api.keys.{free_provider}": self.free_api_key.get_text(),
+            "free_api.libretranslate_url": self.libretranslate_url.get_text(),
+            # Paid API
+            "paid_api.provider": paid_provider,
+            f"paid_api.keys.{paid_provider}": self.api_key.get_text(),
+        }
+
         # Save selected model for providers with model selection
         models = _FREE_MODELS.get(free_provider, [])
         if models:
             idx = self.free_model_row.get_selected()
             if 0 <= idx < len(models):
-                self.settings.set("free_api.model", models[idx])
+                values["free_api.model"] = models[idx]
 
-        # Paid API
-        paid_provider = self._get_selected_paid_provider()
-        self.settings.set("paid_api.provider", paid_provider)
-        # Save key per-provider (not shared)
-        paid_key = self.api_key.get_text()
-        self.settings.set_provider_key("paid_api", paid_provider, paid_key)
         # Save selected paid model
         for model_id, check in self._paid_model_checks.items():
             if check.get_active():
-                self.settings.set("paid_api.model", model_id)
+                values["paid_api.model"] = model_id
                 break
 
         # Fix Context reference language
         ref_idx = self.ref_lang_row.get_selected()
         if 0 <= ref_idx < len(self._ref_lang_options):
-            self.settings.set_reference_lang(self._ref_lang_options[ref_idx][0])
+            values["fix_context.reference_lang"] = self._ref_lang_options[ref_idx][0]
 
+        self.settings.update(values)
         self.settings.save()
+        self._dirty = False
+        # Clients built from edited keys are not needed any more
+        self._api_cache.clear()
 
     def _build_ui(self):
         """Build settings interface."""
@@ -198,52 +403,12 @@ class SettingsDialog(Adw.PreferencesWindow):
         self.free_group.set_title(_("Free Tier APIs"))
         self.free_group.set_description(_("Select your preferred translation provider"))
 
-        # Provider definitions with contextual help (U4)
-        _free_defs = [
-            {
-                "id": "deepl-free",
-                "name": "DeepL Free",
-                "subtitle": _("500k chars/month — Best translation quality"),
-                "recommended": True,
-            },
-            {
-                "id": "groq",
-                "name": "Groq",
-                "subtitle": _("14.4k req/day — Fastest, excellent quality"),
-                "recommended": True,
-            },
-            {
-                "id": "gemini-free",
-                "name": "Gemini Free",
-                "subtitle": _("1,000 req/day — Google AI"),
-                "recommended": False,
-            },
-            {
-                "id": "openrouter",
-                "name": "OpenRouter",
-                "subtitle": _("18 free models available"),
-                "recommended": False,
-            },
-            {
-                "id": "mistral-free",
-                "name": "Mistral Free",
-                "subtitle": _("Free tier — Quality models"),
-                "recommended": False,
-            },
-            {
-                "id": "libretranslate",
-                "name": "LibreTranslate",
-                "subtitle": _("Open source — No API key needed"),
-                "recommended": False,
-            },
-        ]
-
         self._provider_checks: dict[str, Gtk.CheckButton] = {}
         first_check: Gtk.CheckButton | None = None
 
         # Recommended providers (always visible)
-        for pdef in _free_defs:
-            if not pdef["recommended"]:
+        for pdef in _FREE_PROVIDER_DEFS:
+            if pdef["id"] not in _RECOMMENDED_FREE_PROVIDERS:
                 continue
             row = Adw.ActionRow()
             row.set_title(pdef["name"])
@@ -264,8 +429,8 @@ class SettingsDialog(Adw.PreferencesWindow):
         self._more_providers_row.set_title(_("More providers"))
         self._more_providers_row.set_subtitle(_("4 additional free options"))
 
-        for pdef in _free_defs:
-            if pdef["recommended"]:
+        for pdef in _FREE_PROVIDER_DEFS:
+            if pdef["id"] in _RECOMMENDED_FREE_PROVIDERS:
                 continue
             row = Adw.ActionRow()
             row.set_title(pdef["name"])
@@ -314,29 +479,6 @@ class SettingsDialog(Adw.PreferencesWindow):
         self.paid_group.set_title(_("Paid API Settings"))
 
         # Provider selection as ExpanderRow with radio buttons
-        _paid_defs = [
-            {
-                "id": "openai",
-                "name": "OpenAI",
-                "subtitle": _("GPT-5, GPT-4.1 — Industry standard"),
-            },
-            {
-                "id": "gemini",
-                "name": "Gemini (Google AI)",
-                "subtitle": _("Gemini 2.5 Flash/Pro — Fast and capable"),
-            },
-            {
-                "id": "grok",
-                "name": "Grok (xAI)",
-                "subtitle": _("$25 free credits — 2M context window"),
-            },
-            {
-                "id": "deepseek",
-                "name": "DeepSeek",
-                "subtitle": _("Very low cost — Good for high-volume translation"),
-            },
-        ]
-
         self._paid_provider_expander = Adw.ExpanderRow()
         self._paid_provider_expander.set_title(_("Provider"))
         self._paid_provider_expander.set_icon_name("network-server-symbolic")
@@ -344,7 +486,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         self._paid_provider_checks: dict[str, Gtk.CheckButton] = {}
         first_paid_check: Gtk.CheckButton | None = None
 
-        for pdef in _paid_defs:
+        for pdef in _PAID_PROVIDER_DEFS:
             row = Adw.ActionRow()
             row.set_title(pdef["name"])
             row.set_subtitle(pdef["subtitle"])
@@ -395,6 +537,9 @@ class SettingsDialog(Adw.PreferencesWindow):
             ("pt-BR", _("★ Portuguese (Brazil)")),
             ("es", _("★ Spanish")),
         ]
+        self._ref_lang_index = {
+            code: i for i, (code, _label) in enumerate(self._ref_lang_options)
+        }
         ref_model = Gtk.StringList.new(
             [label for _, label in self._ref_lang_options]
         )
@@ -408,8 +553,7 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         button_box.set_halign(Gtk.Align.CENTER)
-        button_box.set_margin_top(8)
-        button_box.set_margin_bottom(8)
+        _set_margins(button_box, top=8, bottom=8)
 
         help_button = Gtk.Button()
         help_button.set_icon_name("help-browser-symbolic")
@@ -445,14 +589,15 @@ class SettingsDialog(Adw.PreferencesWindow):
     def _load_settings(self):
         """Load saved settings."""
         api_type = self.settings.get_api_type()
-        self.api_type_row.set_selected(0 if api_type == "free" else 1)
+        self._is_free = api_type == "free"
+        self.api_type_row.set_selected(0 if self._is_free else 1)
 
         # Free API
         free_provider = self.settings.get("free_api.provider", "deepl-free")
         if free_provider in self._provider_checks:
             self._provider_checks[free_provider].set_active(True)
             # Expand "more" section if non-recommended provider is selected
-            if free_provider not in ("deepl-free", "groq"):
+            if free_provider not in _RECOMMENDED_FREE_PROVIDERS:
                 self._more_providers_row.set_expanded(True)
 
         # Load per-provider key (falls back to legacy shared key)
@@ -480,14 +625,14 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         # Fix Context reference language
         saved_ref = self.settings.get_reference_lang()
-        ref_codes = [code for code, _ in self._ref_lang_options]
-        if saved_ref in ref_codes:
-            self.ref_lang_row.set_selected(ref_codes.index(saved_ref))
-        else:
-            self.ref_lang_row.set_selected(0)  # fr (default)
+        # Unknown codes fall back to the first option, fr (default)
+        self.ref_lang_row.set_selected(self._ref_lang_index.get(saved_ref, 0))
+        # Filling the widgets above is not an edit
+        self._dirty = False
 
     def _on_api_type_changed(self, combo, _):
         """Called when API type changes."""
+        self._is_free = combo.get_selected() == 0
         self._update_visibility()
 
     def _on_free_provider_toggled(self, check: Gtk.CheckButton, provider_id: str):
@@ -506,9 +651,8 @@ class SettingsDialog(Adw.PreferencesWindow):
 
     def _update_visibility(self):
         """Update group visibility based on type."""
-        is_free = self.api_type_row.get_selected() == 0
-        self.free_group.set_visible(is_free)
-        self.paid_group.set_visible(not is_free)
+        self.free_group.set_visible(self._is_free)
+        self.paid_group.set_visible(not self._is_free)
 
     def _on_paid_provider_changed(self, combo, _pspec):
         """Update model list when paid provider changes."""
@@ -547,13 +691,9 @@ class SettingsDialog(Adw.PreferencesWindow):
         """Update the paid provider expander subtitle."""
         for pid, check in self._paid_provider_checks.items():
             if check.get_active():
-                names = {
-                    "openai": "OpenAI",
-                    "gemini": "Gemini",
-                    "grok": "Grok",
-                    "deepseek": "DeepSeek",
-                }
-                self._paid_provider_expander.set_subtitle(names.get(pid, pid))
+                self._paid_provider_expander.set_subtitle(
+                    _PAID_PROVIDER_NAMES.get(pid, pid)
+                )
                 return
 
     def _update_paid_model_list(self):
@@ -595,9 +735,10 @@ class SettingsDialog(Adw.PreferencesWindow):
         # Update expander subtitle
         self._update_paid_model_subtitle()
         for check in self._paid_model_checks.values():
-            check.connect("toggled", lambda _c: self._update_paid_model_subtitle())
+            check.connect("toggled", self._update_paid_model_subtitle)
+            check.connect("toggled", self._mark_dirty)
 
-    def _update_paid_model_subtitle(self):
+    def _update_paid_model_subtitle(self, *_args):
         """Update the paid model expander subtitle with selected model."""
         for model_id, check in self._paid_model_checks.items():
             if check.get_active():
@@ -614,9 +755,10 @@ class SettingsDialog(Adw.PreferencesWindow):
     def _update_free_api_fields(self):
         """Update free API fields visibility based on selected provider."""
         provider = self._get_selected_free_provider()
-        needs_key = provider != "libretranslate"
-        self.free_api_key.set_visible(needs_key)
-        self.libretranslate_url.set_visible(provider == "libretranslate")
+        # None marks providers without a key (LibreTranslate uses a URL)
+        key_title = _FREE_KEY_TITLES.get(provider, _API_KEY_TITLE)
+        self.free_api_key.set_visible(key_title is not None)
+        self.libretranslate_url.set_visible(key_title is None)
 
         # DeepL usage row only visible when DeepL is selected
         self._deepl_usage_row.set_visible(provider == "deepl-free")
@@ -624,8 +766,10 @@ class SettingsDialog(Adw.PreferencesWindow):
         # Model selector
         models = _FREE_MODELS.get(provider, [])
         if models:
-            display_names = [_model_display_name(m) for m in models]
-            self.free_model_row.set_model(Gtk.StringList.new(display_names))
+            model_list = _free_model_list(provider)
+            # Re-setting the current model would only reset the selection
+            if self.free_model_row.get_model() != model_list:
+                self.free_model_row.set_model(model_list)
             # Restore saved model
             saved_model = self.settings.get("free_api.model", "")
             for i, m in enumerate(models):
@@ -636,94 +780,90 @@ class SettingsDialog(Adw.PreferencesWindow):
         else:
             self.free_model_row.set_visible(False)
 
-        key_titles = {
-            "deepl-free": _("{provider} API Key").format(provider="DeepL"),
-            "groq": _("{provider} API Key").format(provider="Groq"),
-            "gemini-free": _("{provider} API Key").format(provider="Gemini"),
-            "openrouter": _("{provider} API Key").format(provider="OpenRouter"),
-            "mistral-free": _("{provider} API Key").format(provider="Mistral"),
-        }
-        if needs_key:
-            self.free_api_key.set_title(key_titles.get(provider, _("API Key")))
+        if key_title is not None:
+            self.free_api_key.set_title(key_title)
 
     def _on_test_connection(self, button):
         """Test API connection in background thread."""
-        import threading
-
         # Show testing state
         button.set_sensitive(False)
         button.set_label(_("Testing..."))
         self._set_connection_status(_("Testing connection..."), "dim-label")
 
-        def _test():
-            try:
-                api_type = "free" if self.api_type_row.get_selected() == 0 else "paid"
-
-                if api_type == "free":
-                    provider = self._get_selected_free_provider()
-                    api_key = self.free_api_key.get_text()
-
-                    if provider == "libretranslate":
-                        api = APIFactory.create(
-                            provider, url=self.libretranslate_url.get_text()
-                        )
-                    else:
-                        models = _FREE_MODELS.get(provider, [])
-                        model = None
-                        if models:
-                            idx = self.free_model_row.get_selected()
-                            if 0 <= idx < len(models):
-                                model = models[idx]
-                        if model:
-                            api = APIFactory.create(provider, api_key, model=model)
-                        else:
-                            api = APIFactory.create(provider, api_key)
-                else:
-                    provider = self._get_selected_paid_provider()
-                    api_key = self.api_key.get_text()
-                    model = ""
-                    for mid, chk in self._paid_model_checks.items():
-                        if chk.get_active():
-                            model = mid
-                            break
-                    api = APIFactory.create(provider, api_key, model=model)
-
-                if api.test_connection():
-                    GLib.idle_add(
-                        self._set_connection_status,
-                        _("Connection successful"),
-                        "success",
-                    )
-                    # Fetch DeepL usage when connected
-                    if api_type == "free" and provider == "deepl-free":
-                        try:
-                            usage = api.get_usage()
-                            used = usage.get("character_count", 0)
-                            limit = usage.get("character_limit", 0)
-                            pct = (used / limit * 100) if limit else 0
-                            text = f"{used:,} / {limit:,} ({pct:.1f}%)"
-                            GLib.idle_add(self._deepl_usage_row.set_subtitle, text)
-                        except Exception:
-                            pass
-                else:
-                    GLib.idle_add(
-                        self._set_connection_status,
-                        _("Connection failed"),
-                        "error",
-                    )
-
-            except Exception as e:
-                error_msg = str(e)
-                if len(error_msg) > 100:
-                    error_msg = error_msg[:100] + "..."
-                log.debug("Connection test error: %s", e)
-                GLib.idle_add(self._set_connection_status, f"{error_msg}", "error")
-
-            finally:
-                GLib.idle_add(self._reset_test_button, button)
-
-        thread = threading.Thread(target=_test, daemon=True)
-        thread.start()
+        # Read the widgets here: GTK may only be used from the main thread
+        api_type = "free" if self._is_free else "paid"
+        api_key = ""
+        options = {}
+        if api_type == "free":
+            provider = self._get_selected_free_provider()
+            if provider == "libretranslate":
+                options["url"] = self.libretranslate_url.get_text()
+            else:
+                api_key = self.free_api_key.get_text()
+                models = _FREE_MODELS.get(provider, [])
+                idx = self.free_model_row.get_selected()
+                if models and 0 <= idx < len(models):
+                    options["model"] = models[idx]
+        else:
+            provider = self._get_selected_paid_provider()
+            api_key = self.api_key.get_text()
+            checks = self._paid_model_checks
+            options["model"] = next(
+                (mid for mid, chk in checks.items() if chk.get_active()), ""
+            )
+
+        threading.Thread(
+            target=self._run_connection_test,
+            args=(button, api_type, provider, api_key, options),
+            daemon=True,
+        ).start()
+
+    def _run_connection_test(self, button, api_type, provider, api_key, options):
+        """Worker thread: build the client, test it and post the result."""
+        try:
+            api = self._test_client(provider, api_key, **options)
+
+            if api.test_connection():
+                GLib.idle_add(
+                    self._set_connection_status,
+                    _("Connection successful"),
+                    "success",
+                )
+                # Fetch DeepL usage when connected
+                if api_type == "free" and provider == "deepl-free":
+                    try:
+                        usage = api.get_usage()
+                        used = usage.get("character_count", 0)
+                        limit = usage.get("character_limit", 0)
+                        pct = (used / limit * 100) if limit else 0
+                        text = f"{used:,} / {limit:,} ({pct:.1f}%)"
+                        GLib.idle_add(self._deepl_usage_row.set_subtitle, text)
+                    except Exception:
+                        pass
+            else:
+                GLib.idle_add(
+                    self._set_connection_status,
+                    _("Connection failed"),
+                    "error",
+                )
+
+        except Exception as e:
+            error_msg = str(e)
+            if len(error_msg) > 100:
+                error_msg = error_msg[:100] + "..."
+            log.debug("Connection test error: %s", e)
+            GLib.idle_add(self._set_connection_status, f"{error_msg}", "error")
+
+        finally:
+            GLib.idle_add(self._reset_test_button, button)
+
+    def _test_client(self, provider: str, api_key: str = "", **kwargs):
+        """Return an API client for Test Connection, reused for the same inputs."""
+        key = (provider, api_key, tuple(sorted(kwargs.items())))
+        api = self._api_cache.get(key)
+        if api is None:
+            api = self._api_cache[key] = APIFactory.create(provider, api_key, **kwargs)
+        return api
 
     def _set_connection_status(self, message: str, css_class: str):
         """Update inline connection status label."""
@@ -745,9 +885,13 @@ class SettingsDialog(Adw.PreferencesWindow):
 
     def _on_show_api_help(self, button):
         """Show dialog with instructions for getting free API keys."""
-        dialog = Adw.Window()
+        if self._help_dialog is not None:
+            self._help_dialog.present()
+            return
+        dialog = self._help_dialog = Adw.Window()
         dialog.set_transient_for(self)
         dialog.set_modal(True)
+        dialog.set_hide_on_close(True)
         dialog.set_default_size(550, 520)
         dialog.set_title(_("Available Free APIs"))
 
@@ -763,10 +907,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         toolbar.set_content(scroll)
 
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        content.set_margin_top(20)
-        content.set_margin_bottom(20)
-        content.set_margin_start(24)
-        content.set_margin_end(24)
+        _set_margins(content, top=20, bottom=20, start=24, end=24)
         scroll.set_child(content)
 
         title = Gtk.Label(label=_("Available Free APIs"))
@@ -780,64 +921,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         subtitle.set_margin_bottom(12)
         content.append(subtitle)
 
-        apis = [
-            {
-                "name": "DeepL Free",
-                "icon": "starred-symbolic",
-                "badge": _("Recommended"),
-                "limit": _("500k characters/month"),
-                "quality": _("Best translation quality"),
-                "url": "https://www.deepl.com/pro-api",
-                "steps": _("Create account → Free Plan → API Keys"),
-            },
-            {
-                "name": "Groq",
-                "icon": "media-playback-start-symbolic",
-                "badge": _("Fastest"),
-                "limit": _("14,400 requests/day"),
-                "quality": _("LLaMA 3 - Excellent value"),
-                "url": "https://console.groq.com",
-                "steps": _("Create account → API Keys → Create"),
-            },
-            {
-                "name": "Gemini Free",
-                "icon": "applications-science-symbolic",
-                "badge": None,
-                "limit": _("1,000 requests/day"),
-                "quality": _("Google AI - Good quality"),
-                "url": "https://aistudio.google.com/apikey",
-                "steps": _("Google Login → Get API Key"),
-            },
-            {
-                "name": "OpenRouter",
-                "icon": "network-server-symbolic",
-                "badge": None,
-                "limit": _("18 free models"),
-                "quality": _("Multiple models available"),
-                "url": "https://openrouter.ai",
-                "steps": _("Create account → Keys → Create Key"),
-            },
-            {
-                "name": "Mistral Free",
-                "icon": "weather-windy-symbolic",
-                "badge": None,
-                "limit": _("Free tier available"),
-                "quality": _("Quality Mistral models"),
-                "url": "https://console.mistral.ai",
-                "steps": _("Create account → API Keys → Generate"),
-            },
-            {
-                "name": "LibreTranslate",
-                "icon": "emblem-documents-symbolic",
-                "badge": _("No API Key"),
-                "limit": _("Unlimited (self-hosted)"),
-                "quality": _("Open source - Basic quality"),
-                "url": "https://libretranslate.com",
-                "steps": _("Use default URL or your own server"),
-            },
-        ]
-
-        for api in apis:
+        for api in _API_HELP_CARDS:
             card = self._create_api_help_card(api)
             content.append(card)
 
@@ -847,13 +931,10 @@ class SettingsDialog(Adw.PreferencesWindow):
         """Create help card for an API."""
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
         card.add_css_class("card")
-        card.set_margin_top(4)
-        card.set_margin_bottom(4)
+        _set_margins(card, top=4, bottom=4)
 
         header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        header.set_margin_start(16)
-        header.set_margin_end(16)
-        header.set_margin_top(12)
+        _set_margins(header, start=16, end=16, top=12)
 
         icon = Gtk.Image.new_from_icon_name(api["icon"])
         icon.set_pixel_size(24)
@@ -874,24 +955,16 @@ class SettingsDialog(Adw.PreferencesWindow):
         card.append(header)
 
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        info_box.set_margin_start(52)
-        info_box.set_margin_end(16)
-        info_box.set_margin_bottom(12)
-
-        limit_label = Gtk.Label(label=f"• {api['limit']}")
-        limit_label.set_halign(Gtk.Align.START)
-        limit_label.add_css_class("dim-label")
-        info_box.append(limit_label)
-
-        quality_label = Gtk.Label(label=f"• {api['quality']}")
-        quality_label.set_halign(Gtk.Align.START)
-        quality_label.add_css_class("dim-label")
-        info_box.append(quality_label)
-
-        steps_label = Gtk.Label(label=f"• {api['steps']}")
-        steps_label.set_halign(Gtk.Align.START)
-        steps_label.add_css_class("dim-label")
-        info_box.append(steps_label)
+        _set_margins(info_box, start=52, end=16, bottom=12)
+
+        # One label for the three bullet lines instead of a label per line
+        info_label = Gtk.Label(
+            label=f"• {api['limit']}\n• {api['quality']}\n• {api['steps']}"
+        )
+        info_label.set_halign(Gtk.Align.START)
+        info_label.set_xalign(0)
+        info_label.add_css_class("dim-label")
+        info_box.append(info_label)
 
         link_button = Gtk.LinkButton.new_with_label(
             api["url"], f"{_('Open')} {api['url']}"
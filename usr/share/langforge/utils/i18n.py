@@ -2,31 +2,51 @@
 # -*- coding: utf-8 -*-
 """Internationalization support for LangForge."""
 
+import functools
 import gettext
 import os
+import stat
 
-# Determine locale directory
-# Priority: 1) Local project locale, 2) AppImage, 3) System install
-locale_dir = "/usr/share/locale"  # Default fallback for system install
 
-# Check if running from source/local (e.g. python main.py from the project)
-script_dir = os.path.dirname(os.path.abspath(__file__))  # utils/
-app_dir = os.path.dirname(script_dir)  # langforge/
-share_dir = os.path.dirname(app_dir)  # share/
-local_locale = os.path.join(share_dir, "locale")  # share/locale
+def _resolve_locale_dir() -> str:
+    """Return the directory holding the langforge .mo catalogs.
 
-if os.path.isdir(local_locale):
-    locale_dir = local_locale
+    Priority: 1) LANGFORGE_LOCALE_DIR, 2) local project or AppImage
+    locale, 3) system install.
+    """
+    override = os.environ.get("LANGFORGE_LOCALE_DIR")
+    if override:
+        return override
+    # share/locale next to share/langforge/utils/: present when running from
+    # source/local (e.g. python main.py from the project) and inside an
+    # AppImage, whose share dir resolves to the same path
+    share_dir = os.path.abspath(__file__).rsplit(os.sep, 3)[0]  # share/
+    local_locale = os.path.join(share_dir, "locale")  # share/locale
+    try:
+        if stat.S_ISDIR(os.stat(local_locale).st_mode):
+            return local_locale
+    except OSError:
+        pass
+    return "/usr/share/locale"  # Default fallback for system install
 
-# Check if we're in an AppImage (overrides local)
-if "APPIMAGE" in os.environ or "APPDIR" in os.environ:
-    appimage_locale = os.path.join(share_dir, "locale")
-    if os.path.isdir(appimage_locale):
-        locale_dir = appimage_locale
+
+# Resolved once at import
+LOCALE_DIR = _resolve_locale_dir()
 
 # Configure the translation text domain for langforge
-gettext.bindtextdomain("langforge", locale_dir)
+gettext.bindtextdomain("langforge", LOCALE_DIR)
 gettext.textdomain("langforge")
 
-# Export _ directly as the translation function
-_ = gettext.gettext
+# Load the catalog once; NullTranslations returns messages unchanged
+# when no .mo file is installed for the current locale
+try:
+    TRANSLATIONS = gettext.translation("langforge", LOCALE_DIR, fallback=True)
+except Exception:  # unreadable .mo: keep the UI in English
+    TRANSLATIONS = gettext.NullTranslations()
+_gettext = TRANSLATIONS.gettext
+
+
+@functools.lru_cache(maxsize=1024)
+def _(message: str) -> str:
+    """Translate ``message`` with the langforge catalog (memoized)."""
+    return _gettext(message)